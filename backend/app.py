@@ -1,35 +1,62 @@
 from flask import Flask
 from flask_cors import CORS
 from config import load_data
+from utils.instrumentation import configure_logging, init_app as init_instrumentation
+from utils.compression import init_app as init_compression
+from utils.concurrency import init_app as init_concurrency
+from utils.memory import init_app as init_memory
+from utils.warmup import init_app as init_warmup
 from routes.team_routes import team_bp
 from routes.match_routes import match_bp
 from routes.player_routes import player_bp
 from routes.analytics_routes import analytics_bp
+from routes.data_routes import data_bp
+from routes.eco_routes import eco_bp
+from routes.draft_routes import draft_bp
+from routes.leaderboard_routes import leaderboard_bp
+from routes.search_routes import search_bp
+from routes.highlight_routes import highlight_bp
+from routes.map_routes import map_bp
 
 
 def create_app() -> Flask:
     """Application factory to create Flask app with blueprints and data loaded."""
     app = Flask(__name__)
     CORS(app)
+    configure_logging()
+    init_instrumentation(app)
+    # Before the concurrency gate, so replayed cached responses skip the queue
+    init_compression(app)
+    init_concurrency(app)
 
     # Load data once at startup
     load_data()
+    init_memory(app)
 
     # Register blueprints under /api
     app.register_blueprint(team_bp, url_prefix="/api")
     app.register_blueprint(match_bp, url_prefix="/api")
     app.register_blueprint(player_bp, url_prefix="/api")
     app.register_blueprint(analytics_bp, url_prefix="/api")
+    app.register_blueprint(data_bp, url_prefix="/api")
+    app.register_blueprint(eco_bp, url_prefix="/api")
+    app.register_blueprint(draft_bp, url_prefix="/api")
+    app.register_blueprint(leaderboard_bp, url_prefix="/api")
+    app.register_blueprint(search_bp, url_prefix="/api")
+    app.register_blueprint(highlight_bp, url_prefix="/api")
+    app.register_blueprint(map_bp, url_prefix="/api")
     
     # Register general routes at root
     from routes.general_routes import general_bp
     app.register_blueprint(general_bp)
 
+    # Last, so the warm-up requests go through every route and hook
+    init_warmup(app)
     return app
 
 
-app = create_app()
-
-
 if __name__ == "__main__":
+    # Only build the app when run directly; wsgi.py creates its own instance,
+    # so importing create_app no longer loads the data twice
+    app = create_app()
     app.run(host="0.0.0.0", port=5000, debug=True)
@@ -0,0 +1,127 @@
+"""
+ASGI entry point: uvicorn asgi:app --host 0.0.0.0 --port 5000
+
+The Flask app stays synchronous. Requests are dispatched by endpoint onto two
+thread pools so CPU-heavy service calls (utils.concurrency.HEAVY_ENDPOINTS)
+can never occupy the threads serving cheap lookups like /health or /api/teams.
+Heavy requests beyond ASGI_HEAVY_THREADS + ASGI_HEAVY_QUEUE_LIMIT are turned
+away with a 503 before they reach a thread; per-endpoint caps are enforced by
+the same gate as the WSGI deployment.
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import version
+
+from asgiref.wsgi import WsgiToAsgiInstance
+from werkzeug.exceptions import HTTPException
+
+from app import create_app
+from config import ASGI_HEAVY_QUEUE_LIMIT, ASGI_HEAVY_THREADS, ASGI_LIGHT_THREADS
+from utils.concurrency import HEAVY_ENDPOINTS, RETRY_AFTER_SECONDS, busy_payload, reject
+
+# asgiref runs every WSGI call on one shared thread; take the plain function so
+# it can run on our pools instead. That function sits behind asgiref's private
+# sync_to_async wrapper, hence the exact pin in requirements.txt and the check
+# here, which stops startup instead of failing on the first request.
+_run_wsgi_app = getattr(WsgiToAsgiInstance.__dict__.get("run_wsgi_app"), "func", None)
+if not callable(_run_wsgi_app) or asyncio.iscoroutinefunction(_run_wsgi_app):
+    raise RuntimeError(
+        f"asgiref {version('asgiref')} no longer exposes WsgiToAsgiInstance.run_wsgi_app as a "
+        "sync_to_async-wrapped function; install the version pinned in requirements.txt"
+    )
+
+
+def _closing(wsgi_application):
+    """The app, with its response iterable closed once asgiref is done with it.
+
+    asgiref iterates the body but never calls close(), which PEP 3333 requires
+    and which releases the concurrency slot of a streamed response.
+    """
+    def application(environ, start_response):
+        body = wsgi_application(environ, start_response)
+        try:
+            yield from body
+        finally:
+            if hasattr(body, "close"):
+                body.close()
+    return application
+
+
+class _PooledWsgiInstance(WsgiToAsgiInstance):
+    """One request, bridged to the WSGI app on the given thread pool"""
+
+    def __init__(self, wsgi_application, executor):
+        super().__init__(_closing(wsgi_application))
+        self.executor = executor
+
+    async def run_wsgi_app(self, body):
+        await asyncio.get_running_loop().run_in_executor(self.executor, _run_wsgi_app, self, body)
+
+
+class PooledASGIApp:
+    """Routes heavy endpoints to a bounded pool and everything else to a light pool"""
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.light_pool = ThreadPoolExecutor(ASGI_LIGHT_THREADS, thread_name_prefix="asgi-light")
+        self.heavy_pool = ThreadPoolExecutor(ASGI_HEAVY_THREADS, thread_name_prefix="asgi-heavy")
+        self.heavy_capacity = ASGI_HEAVY_THREADS + ASGI_HEAVY_QUEUE_LIMIT
+        self.heavy_in_flight = 0
+
+    def endpoint_for(self, scope):
+        adapter = self.flask_app.url_map.bind("localhost")
+        try:
+            endpoint, _ = adapter.match(scope["path"], method=scope.get("method", "GET"))
+        except HTTPException:
+            return None
+        return endpoint
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        endpoint = self.endpoint_for(scope)
+        if endpoint not in HEAVY_ENDPOINTS:
+            await _PooledWsgiInstance(self.flask_app, self.light_pool)(scope, receive, send)
+            return
+
+        # Counted on the event loop, so no lock is needed
+        if self.heavy_in_flight >= self.heavy_capacity:
+            reject(endpoint, "pool_full")
+            await self._busy(send, "pool_full")
+            return
+        self.heavy_in_flight += 1
+        try:
+            await _PooledWsgiInstance(self.flask_app, self.heavy_pool)(scope, receive, send)
+        finally:
+            self.heavy_in_flight -= 1
+
+    async def _busy(self, send, reason):
+        body = json.dumps(busy_payload(reason)).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"retry-after", str(RETRY_AFTER_SECONDS).encode("ascii")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.light_pool.shutdown(wait=False)
+                self.heavy_pool.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+app = PooledASGIApp(create_app())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Storage backend parity check.
+
+Builds the app once, then replays the same requests with every storage
+backend (utils/storage.py) active and compares the JSON they return. Floats
+are compared to 10 significant digits, since SQL and pandas may sum in a
+different order; everything else must match exactly.
+
+    python benchmarks/backend_parity.py
+    python benchmarks/backend_parity.py --data-dir /tmp/valorant-50x --sample-size 20
+
+Exits with status 1 when any request differs, so it can gate CI.
+"""
+
+import argparse
+import json
+import os
+import sys
+from urllib.parse import quote
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# Every request must reach the backend under test, not a cached result
+os.environ["COMPRESSION_ENABLED"] = "0"
+os.environ["RESULT_STORE_PATH"] = ""
+os.environ["WARMUP_MODE"] = "off"
+
+import config  # noqa: E402
+from utils.cache import _caches  # noqa: E402
+from utils.storage import STORAGE_BACKENDS  # noqa: E402
+
+
+def build_requests(match_ids, players):
+    """URLs whose responses go through storage.select / count / aggregate / iter_chunks"""
+    urls = []
+    for match_id in match_ids + ['missing']:
+        urls += [
+            f'/api/match_details/{match_id}',
+            f'/api/round_analysis/{match_id}',
+            f'/api/players/{match_id}',
+            f'/api/eco/match/{match_id}',
+            f'/api/draft/match/{match_id}',
+        ]
+    urls += [
+        '/api/aggregate?name=players_stats&group_by=Teams&metric=wmean:Rating&metric=sum:Kills',
+        '/api/aggregate?name=players_stats&group_by=Agents&group_by=Stage&metric=count&metric=mean:Average Combat Score'
+        '&metric=min:Rating&metric=max:Rating',
+        '/api/aggregate?name=players_stats&metric=count&metric=wmean:Headshot %',
+        '/api/aggregate?name=maps_scores&group_by=Map&metric=sum:Team A Score&filter=Map==Bind|Lotus',
+        '/api/aggregate?name=maps_scores&metric=count&filter=Map==Nowhere',
+        '/api/aggregate?name=players_stats&group_by=Teams&metric=sum:Kills&filter=Nope==x',
+        '/api/dataset?name=maps_scores&format=csv&filter=Map==Bind&chunk_size=7',
+        '/api/dataset?name=scores&format=ndjson&chunk_size=50',
+        '/api/dataset?name=maps_scores&format=csv&filter=Map==Nowhere',
+        '/api/dataset?name=maps_scores&filter=Team A Score==abc',
+    ]
+    urls += [f'/api/aggregate?name=players_stats&group_by=Agents&metric=sum:Kills&filter=Player=={quote(p)}'
+             for p in players]
+    return urls
+
+
+def _normalize(value):
+    if isinstance(value, float):
+        # NaN never equals itself
+        return float(f"{value:.10g}") if value == value else "NaN"
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items() if key != "elapsed_ms"}
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def _body(response):
+    data = response.get_data(as_text=True)
+    if response.mimetype == "application/json":
+        return response.status_code, _normalize(json.loads(data))
+    if response.mimetype == "application/x-ndjson":
+        return response.status_code, [_normalize(json.loads(line)) for line in data.splitlines() if line]
+    return response.status_code, data
+
+
+def run_parity(sample_size):
+    from app import create_app
+    from benchmarks.bench_api import sample_inputs
+
+    app = create_app()
+    client = app.test_client()
+    match_ids, players, _, _ = sample_inputs(sample_size)
+    urls = build_requests(match_ids, players)
+
+    results = {}
+    for name, backend in STORAGE_BACKENDS.items():
+        config.storage = backend()
+        config.storage.load(config.data_store)
+        for cache in list(_caches):
+            cache.clear()
+        results[name] = [_body(client.get(url)) for url in urls]
+
+    reference, *others = results
+    mismatches = [
+        (url, other)
+        for other in others
+        for url, expected, actual in zip(urls, results[reference], results[other])
+        if expected != actual
+    ]
+    return urls, mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare API responses across storage backends")
+    parser.add_argument('--data-dir', help="Directory with the CSV files (defaults to backend/data)")
+    parser.add_argument('--sample-size', type=int, default=10, help="Match ids / players to replay")
+    args = parser.parse_args()
+
+    if args.data_dir:
+        config.DATA_DIR = os.path.abspath(args.data_dir)
+
+    print("🟪 Storage backend parity")
+    print("=" * 40)
+    urls, mismatches = run_parity(args.sample_size)
+    print(f"🔁 {len(urls)} requests x {len(STORAGE_BACKENDS)} backends ({', '.join(STORAGE_BACKENDS)})")
+    if mismatches:
+        print(f"❌ {len(mismatches)} mismatch(es):")
+        for url, backend in mismatches:
+            print(f"   - {backend}: {url}")
+        sys.exit(1)
+    print("✅ Every backend returned identical JSON")
+
+
+if __name__ == "__main__":
+    main()
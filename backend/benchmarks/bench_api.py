@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+API benchmark harness.
+
+Builds the app through create_app(), drives every route with Flask's test
+client across a representative set of match ids, players and teams, and
+records latency percentiles, peak allocations and startup time.
+
+    python benchmarks/bench_api.py --save benchmarks/baseline.json
+    python benchmarks/bench_api.py --baseline benchmarks/baseline.json
+
+With --baseline the run exits with status 1 when any route regresses past
+the threshold, so it can gate CI.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from urllib.parse import quote
+
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# Routes are timed through the service code: the response cache, precomputed
+# bodies and the warm-up would otherwise replay stored bytes, and the persistent
+# result store would make a run depend on the runs before it. --warm keeps the
+# response cache and precomputed bodies on; it is read here because the
+# settings must be in place before config is imported.
+WARM = "--warm" in sys.argv[1:]
+os.environ.setdefault("WARMUP_MODE", "off")
+os.environ.setdefault("RESULT_STORE_PATH", "")
+if not WARM:
+    os.environ.setdefault("COMPRESSION_ENABLED", "0")
+    os.environ.setdefault("PRECOMPUTED_DIR", "")
+
+import config  # noqa: E402
+
+
+def _spread(values, count):
+    """Pick `count` values spread evenly over a list (first, middle, last, ...)"""
+    values = list(values)
+    if len(values) <= count:
+        return values
+    positions = np.linspace(0, len(values) - 1, count).round().astype(int)
+    return [values[i] for i in sorted(set(positions))]
+
+
+def sample_inputs(sample_size):
+    """Representative match ids, players and teams from the loaded data"""
+    scores_df = config.get_data('scores')
+    rounds_kills_df = config.get_data('rounds_kills')
+    team_mapping_df = config.get_data('team_mapping')
+    kills_df = config.get_data('kills')
+
+    match_ids = _spread(scores_df['match_id'], sample_size)
+    # Busiest players first so the timeseries paths do real work
+    player_counts = rounds_kills_df['Eliminator'].value_counts()
+    players = _spread(player_counts.index, sample_size)
+    teams = _spread(team_mapping_df['Full Name'], sample_size)
+    # Pairs that actually met, so head-to-head lookups hit
+    duels = _spread(list(kills_df[['Player', 'Enemy']].drop_duplicates().itertuples(index=False, name=None)), sample_size)
+    return match_ids, players, teams, duels
+
+
+def build_scenarios(match_ids, players, teams, duels):
+    """Map each route endpoint to the list of URLs used to exercise it"""
+    pair = '&'.join(f'players={quote(p)}' for p in players[:2])
+    many = '&'.join(f'players={quote(p)}' for p in players)
+    return {
+        'general.index': ['/'],
+        'general.health': ['/health'],
+        'general.ready': ['/ready'],
+        'general.get_metrics': ['/metrics'],
+        'general.get_matches_alias': ['/matches'],
+        'team.get_teams': ['/api/teams'],
+        'team.get_teams_detailed': ['/api/teams/detailed'],
+        'team.get_team_profile': [f'/api/team/{quote(t)}' for t in teams],
+        'match.get_matches': ['/api/matches'],
+        'match.get_match_details': [f'/api/match_details/{m}' for m in match_ids],
+        'match.get_round_analysis': [f'/api/round_analysis/{m}' for m in match_ids],
+        'match.get_matches_full': ['/api/matches_full'],
+        'player.get_players': [f'/api/players/{m}' for m in match_ids],
+        'player.get_player_details': [f'/api/player_details/{m}' for m in match_ids[:1]],
+        'player.get_players_detailed': ['/api/players/detailed'],
+        'player.get_player_profile': [f'/api/player/{quote(p)}' for p in players],
+        'player.get_player_timeseries': [f'/api/player_timeseries/{quote(p)}' for p in players],
+        'player.get_players_comparison': [f'/api/players_comparison?{pair}'],
+        'player.get_head_to_head': [f'/api/h2h?player={quote(p)}&enemy={quote(e)}' for p, e in duels],
+        'analytics.get_player_clustering': [f'/api/player_clustering?{many}'],
+        'analytics.get_match_predictions': [f'/api/match_predictions/{m}' for m in match_ids[:1]],
+        'analytics.get_correlations': [
+            '/api/correlations',
+            '/api/correlations?method=spearman',
+            '/api/correlations?dataset=maps_scores',
+        ],
+        'data.get_datasets': ['/api/datasets'],
+        'data.export_dataset': [
+            '/api/dataset?name=maps_scores',
+            '/api/dataset?name=players_stats&format=csv',
+        ],
+        'data.aggregate_dataset': [
+            '/api/aggregate?name=players_stats&group_by=Teams&metric=wmean:Rating&metric=sum:Kills',
+        ],
+        'eco.get_eco_teams': ['/api/eco/teams'],
+        'eco.get_eco_team': [f'/api/eco/team/{quote(t)}' for t in teams],
+        'eco.get_eco_match': [f'/api/eco/match/{m}' for m in match_ids],
+        'draft.get_draft_teams': ['/api/draft/teams'],
+        'draft.get_draft_team': [f'/api/draft/team/{quote(t)}' for t in teams],
+        'draft.get_draft_match': [f'/api/draft/match/{m}' for m in match_ids],
+        'leaderboard.get_leaderboard': [
+            '/api/leaderboards?metric=rating&k=10',
+            '/api/leaderboards?metric=acs&k=25&stage=Playoffs',
+            '/api/leaderboards?metric=multi_kills&k=10&agent=jett',
+            '/api/leaderboards?metric=kd&k=5&entity=teams',
+        ],
+        'search.search': (
+            [f'/api/search?q={quote(p[:3])}' for p in players]
+            + [f'/api/search?q={quote(p.upper())}' for p in players]
+            + ['/api/search?q=sentinals', '/api/search?q=prx&type=team']
+        ),
+        'highlight.get_highlights': (
+            ['/api/highlights?limit=10']
+            + [f'/api/highlights?player={quote(p)}' for p in players]
+            + [f'/api/highlights?match_id={m}' for m in match_ids]
+        ),
+        'map.get_maps': ['/api/maps', '/api/maps?stage=Playoffs'],
+        'map.get_map': ['/api/maps/Lotus', '/api/maps/Bind?entity=players&min_maps=1'],
+        'map.get_team_maps': [f'/api/maps/team/{quote(t)}' for t in teams],
+        'map.get_player_maps': [f'/api/maps/player/{quote(p)}' for p in players],
+    }
+
+
+def measure_route(client, urls, iterations, warmup):
+    """Latency percentiles over `iterations` passes and the peak allocation of one pass"""
+    statuses = set()
+    for _ in range(warmup):
+        for url in urls:
+            client.get(url).get_data()
+
+    timings = []
+    for _ in range(iterations):
+        for url in urls:
+            started = time.perf_counter()
+            response = client.get(url)
+            response.get_data()
+            timings.append((time.perf_counter() - started) * 1000)
+            statuses.add(response.status_code)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    for url in urls:
+        client.get(url).get_data()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings = np.asarray(timings)
+    return {
+        'requests': int(len(timings)),
+        'statuses': sorted(statuses),
+        'mean_ms': round(float(timings.mean()), 3),
+        'p50_ms': round(float(np.percentile(timings, 50)), 3),
+        'p95_ms': round(float(np.percentile(timings, 95)), 3),
+        'p99_ms': round(float(np.percentile(timings, 99)), 3),
+        'peak_alloc_kb': round(peak / 1024, 1),
+    }
+
+
+def run_benchmarks(iterations, warmup, sample_size, only=None):
+    """Create the app, exercise every route and return the results document"""
+    started = time.perf_counter()
+    from app import create_app
+    from utils.startup import startup
+    app = create_app()
+    startup_seconds = time.perf_counter() - started
+
+    client = app.test_client()
+    match_ids, players, teams, duels = sample_inputs(sample_size)
+    scenarios = build_scenarios(match_ids, players, teams, duels)
+
+    endpoints = {rule.endpoint for rule in app.url_map.iter_rules() if rule.endpoint != 'static'}
+    uncovered = sorted(endpoints - set(scenarios))
+    if uncovered:
+        print(f"⚠️  Routes without a benchmark scenario: {uncovered}")
+
+    routes = {}
+    for endpoint, urls in scenarios.items():
+        if endpoint not in endpoints or (only and endpoint not in only):
+            continue
+        routes[endpoint] = measure_route(client, urls, iterations, warmup)
+        stats = routes[endpoint]
+        print(f"   {endpoint:<40} p50 {stats['p50_ms']:>9.2f}ms  p95 {stats['p95_ms']:>9.2f}ms  "
+              f"p99 {stats['p99_ms']:>9.2f}ms  peak {stats['peak_alloc_kb']:>9.1f}KB")
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'data_dir': config.DATA_DIR,
+            'data_version': config.get_data_version(),
+            'iterations': iterations,
+            'sample_size': sample_size,
+            'warm': WARM,
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'startup_seconds': round(startup_seconds, 3),
+        'startup_phases': {phase['name']: phase['seconds'] for phase in startup.report()['phases']},
+        'routes': routes,
+        'uncovered_routes': uncovered,
+    }
+
+
+def compare_to_baseline(results, baseline, threshold, min_delta_ms):
+    """List regressions beyond `threshold` (relative) and `min_delta_ms` (absolute noise floor)"""
+    regressions = []
+    for endpoint, stats in results['routes'].items():
+        previous = baseline.get('routes', {}).get(endpoint)
+        if not previous:
+            continue
+        for metric in ('p50_ms', 'p95_ms', 'p99_ms'):
+            delta = stats[metric] - previous[metric]
+            if delta > min_delta_ms and stats[metric] > previous[metric] * (1 + threshold):
+                regressions.append(f"{endpoint} {metric}: {previous[metric]:.2f} -> {stats[metric]:.2f}ms")
+        if stats['peak_alloc_kb'] > previous['peak_alloc_kb'] * (1 + threshold) + 64:
+            regressions.append(
+                f"{endpoint} peak_alloc_kb: {previous['peak_alloc_kb']:.1f} -> {stats['peak_alloc_kb']:.1f}KB"
+            )
+
+    previous_startup = baseline.get('startup_seconds')
+    if previous_startup and results['startup_seconds'] > previous_startup * (1 + threshold) + 0.25:
+        regressions.append(f"startup_seconds: {previous_startup:.2f} -> {results['startup_seconds']:.2f}s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every API route")
+    parser.add_argument('--data-dir', help="Directory with the CSV files (defaults to backend/data)")
+    parser.add_argument('--iterations', type=int, default=20, help="Timed passes per route")
+    parser.add_argument('--warmup', type=int, default=2, help="Untimed passes per route")
+    parser.add_argument('--sample-size', type=int, default=5, help="Match ids / players / teams per route")
+    parser.add_argument('--only', action='append', help="Only benchmark this endpoint (repeatable)")
+    parser.add_argument('--warm', action='store_true',
+                        help="Keep the response cache and precomputed bodies on (times cached replays)")
+    parser.add_argument('--output', help="Write results JSON to this path")
+    parser.add_argument('--save', help="Write results as the new baseline at this path")
+    parser.add_argument('--baseline', help="Compare against this baseline and fail on regressions")
+    parser.add_argument('--threshold', type=float, default=0.25, help="Allowed relative regression (0.25 = 25%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=2.0, help="Ignore latency changes below this")
+    args = parser.parse_args()
+
+    if args.data_dir:
+        config.DATA_DIR = os.path.abspath(args.data_dir)
+
+    print("🟪 Valorant API Benchmarks")
+    print("=" * 40)
+    results = run_benchmarks(args.iterations, args.warmup, args.sample_size, set(args.only or []))
+    phases = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in results['startup_phases'].items())
+    print(f"⏱️  Startup: {results['startup_seconds']:.3f}s ({phases})")
+
+    for path in filter(None, (args.output, args.save)):
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"💾 Wrote {path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get('meta', {}).get('warm', False) != WARM:
+            print("⚠️  Baseline was recorded with a different --warm setting; timings are not comparable")
+        regressions = compare_to_baseline(results, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) past {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"   - {regression}")
+            sys.exit(1)
+        print("✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
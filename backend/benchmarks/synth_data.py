@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""
+Synthetic data generator.
+
+Writes schema-faithful versions of every CSV that load_data reads, so the API
+and the benchmarks can be run against multi-season data volumes offline.
+Every table is derived from one simulated set of series -> maps -> rounds ->
+kills, so team names, player names, match names and round numbers line up
+across tables the same way they do in the scraped data.
+
+    python benchmarks/synth_data.py --out /tmp/valorant-10x --scale 10
+    VALORANT_DATA_DIR=/tmp/valorant-10x VALORANT_TOURNAMENT=all python app.py
+
+A scale of 1 is one event the size of Champions 2025 (16 teams, 34 series),
+named "Valorant Champions 2025" so the default tournament filter keeps it.
+Each additional unit of scale adds another event.
+"""
+
+import argparse
+import os
+import time
+from collections import Counter, defaultdict
+
+import numpy as np
+import pandas as pd
+
+MATCH_KEY_COLUMNS = ['Tournament', 'Stage', 'Match Type', 'Match Name']
+
+MAP_POOL = ['Ascent', 'Bind', 'Haven', 'Lotus', 'Sunset', 'Corrode', 'Abyss', 'Icebox', 'Split', 'Pearl', 'Fracture']
+ACTIVE_MAPS = 7
+AGENTS = {
+    'duelist': ['jett', 'raze', 'neon', 'yoru', 'waylay', 'iso'],
+    'initiator': ['sova', 'fade', 'skye', 'kayo', 'gekko', 'breach', 'tejo'],
+    'controller': ['omen', 'viper', 'astra', 'brimstone', 'harbor', 'clove'],
+    'sentinel': ['killjoy', 'cypher', 'sage', 'chamber', 'vyse', 'deadlock'],
+}
+ROLE_ORDER = ['duelist', 'initiator', 'controller', 'sentinel', 'controller']
+
+# Event names cycle through a season; the first event matches the default tournament filter
+EVENT_SERIES = [
+    'Valorant Champions', 'Valorant Masters Toronto', 'VCT Americas Stage 1', 'VCT EMEA Stage 1',
+    'VCT Pacific Stage 1', 'VCT China Stage 1', 'Valorant Masters Bangkok', 'VCT Americas Stage 2',
+    'VCT EMEA Stage 2', 'VCT Pacific Stage 2', 'VCT China Stage 2',
+]
+BASE_YEAR = 2025
+TEAMS_PER_EVENT = 16
+
+# (stage, match type, best of) for every series of a Champions-style event
+GROUPS = 'ABCD'
+EVENT_FORMAT = (
+    [('Group Stage', f'Opening ({g})', 3) for g in GROUPS for _ in range(2)]
+    + [('Group Stage', f"Winner's ({g})", 3) for g in GROUPS]
+    + [('Group Stage', f'Elimination ({g})', 3) for g in GROUPS]
+    + [('Group Stage', f'Decider ({g})', 3) for g in GROUPS]
+    + [('Playoffs', 'Upper Quarterfinals', 3)] * 4
+    + [('Playoffs', 'Upper Semifinals', 3)] * 2
+    + [('Playoffs', 'Lower Round 1', 3)] * 2
+    + [('Playoffs', 'Lower Round 2', 3)] * 2
+    + [('Playoffs', 'Upper Final', 3), ('Playoffs', 'Lower Round 3', 3),
+       ('Playoffs', 'Lower Final', 5), ('Playoffs', 'Grand Final', 5)]
+)
+
+# Winning method -> the losing team's label (win_loss_methods_count columns)
+LOSS_METHODS = {
+    'Elimination': 'Eliminated',
+    'Detonated': 'Defused Failed',
+    'Defused': 'Detonation Denied',
+    'Time Expiry (No Plant)': 'Time Expiry (Failed to Plant)',
+}
+# eco_rounds Type -> (eco_stats Type, loadout range in credits)
+BUY_TYPES = {
+    'Eco: 0-5k': ('Eco (won)', (1500, 5000)),
+    'Semi-eco: 5-10k': ('$ (won)', (5000, 10000)),
+    'Semi-buy: 10-20k': ('$$ (won)', (10000, 20000)),
+    'Full buy: 20k+': ('$$$ (won)', (20000, 29000)),
+}
+PISTOL_ROUNDS = (1, 13)
+
+TEAM_WORDS = (
+    ['Apex', 'Nova', 'Crimson', 'Vortex', 'Obsidian', 'Solar', 'Phantom', 'Iron', 'Neon', 'Azure',
+     'Ember', 'Frost', 'Lunar', 'Onyx', 'Rapid', 'Silver', 'Storm', 'Titan', 'Void', 'Zenith'],
+    ['Esports', 'Gaming', 'Club', 'Academy', 'Collective', 'Squad', 'United', 'Legion'],
+)
+NAME_SYLLABLES = ['ka', 'zu', 'ri', 'vo', 'ne', 'ta', 'mi', 'xo', 'lu', 'sy', 'de', 'qa', 'fe', 'ro', 'jin', 'ash', 'kai', 'ny']
+
+
+def credits_text(value):
+    """200 -> '0.2k', matching the scraped credit strings"""
+    return f"{value / 1000:.1f}k"
+
+
+def make_teams(rng, count):
+    """Unique team names, abbreviations, strengths and five-player rosters"""
+    names = [f"{a} {b}" for b in TEAM_WORDS[1] for a in TEAM_WORDS[0]]
+    rng.shuffle(names)
+    if count > len(names):
+        names += [f"Team {i}" for i in range(count - len(names))]
+
+    teams, taken_abbrs, taken_players = [], set(), set()
+    for name in names[:count]:
+        words = name.split()
+        abbr = (words[0][:2] + words[-1][0]).upper()
+        suffix = 1
+        while abbr in taken_abbrs:
+            suffix += 1
+            abbr = f"{abbr[:3]}{suffix}"
+        taken_abbrs.add(abbr)
+
+        roster = []
+        while len(roster) < 5:
+            player = ''.join(rng.choice(NAME_SYLLABLES, size=rng.integers(2, 4))).capitalize()
+            if player in taken_players:
+                continue
+            taken_players.add(player)
+            roster.append({
+                'name': player,
+                'skill': float(rng.normal(1.0, 0.15)),
+                'role': ROLE_ORDER[len(roster)],
+            })
+        teams.append({'name': name, 'abbr': abbr, 'strength': float(rng.normal(0, 0.35)), 'roster': roster})
+    return teams
+
+
+class Generator:
+    """Simulates events and accumulates rows for every table"""
+
+    def __init__(self, seed, teams):
+        self.rng = np.random.default_rng(seed)
+        self.teams = make_teams(self.rng, teams)
+        self.by_name = {t['name']: t for t in self.teams}
+        self.tables = defaultdict(list)
+        # Per-map player lines, folded into players_stats and kills_stats at the end
+        self.player_maps = []
+
+    # -- series -------------------------------------------------------------
+
+    def event(self, index):
+        series_name = EVENT_SERIES[index % len(EVENT_SERIES)]
+        tournament = f"{series_name} {BASE_YEAR + index // len(EVENT_SERIES)}"
+        picks = self.rng.choice(len(self.teams), size=min(TEAMS_PER_EVENT, len(self.teams)), replace=False)
+        event_teams = [self.teams[i] for i in picks]
+        map_pool = list(self.rng.choice(MAP_POOL, size=ACTIVE_MAPS, replace=False))
+
+        seen = set()
+        for stage, match_type, best_of in EVENT_FORMAT:
+            while True:
+                team_a, team_b = self.rng.choice(len(event_teams), size=2, replace=False)
+                team_a, team_b = event_teams[team_a], event_teams[team_b]
+                key = (stage, match_type, team_a['name'], team_b['name'])
+                if key not in seen:
+                    seen.add(key)
+                    break
+            self.series(tournament, stage, match_type, best_of, team_a, team_b, map_pool)
+
+    def series(self, tournament, stage, match_type, best_of, team_a, team_b, map_pool):
+        match_name = f"{team_a['name']} vs {team_b['name']}"
+        match = {'Tournament': tournament, 'Stage': stage, 'Match Type': match_type, 'Match Name': match_name}
+
+        maps = self.draft(match, team_a, team_b, map_pool, best_of)
+        needed = best_of // 2 + 1
+        wins = {team_a['name']: 0, team_b['name']: 0}
+        played = []
+        for map_name in maps:
+            winner = self.play_map(match, map_name, team_a, team_b)
+            wins[winner] += 1
+            played.append(map_name)
+            if max(wins.values()) == needed:
+                break
+
+        series_winner = max(wins, key=wins.get)
+        self.tables['scores'].append({
+            **match,
+            'Team A': team_a['name'], 'Team B': team_b['name'],
+            'Team A Score': wins[team_a['name']], 'Team B Score': wins[team_b['name']],
+            'Match Result': f"{series_winner} won",
+        })
+        for map_name in played:
+            self.tables['maps_played'].append({**match, 'Map': map_name})
+        self.series_rollups(match, team_a, team_b, played)
+
+    def draft(self, match, team_a, team_b, map_pool, best_of):
+        """Ban/pick sequence; returns the maps in play order (picks, then the decider)"""
+        remaining = list(self.rng.permutation(map_pool))
+        sequence = (['ban', 'ban', 'pick', 'pick', 'ban', 'ban'] if best_of == 3
+                    else ['ban', 'ban', 'pick', 'pick', 'pick', 'pick'])
+        order = []
+        for step, action in enumerate(sequence):
+            team = team_b if step % 2 == 0 else team_a
+            map_name = remaining.pop()
+            self.tables['draft_phase'].append({**match, 'Team': team['name'], 'Action': action, 'Map': map_name})
+            if action == 'pick':
+                order.append(map_name)
+        return order + remaining[:1]
+
+    # -- maps and rounds ----------------------------------------------------
+
+    def play_map(self, match, map_name, team_a, team_b):
+        rng = self.rng
+        names = (team_a['name'], team_b['name'])
+        p_round = 1 / (1 + np.exp(-(team_a['strength'] - team_b['strength'])))
+        agents = {t['name']: self.pick_agents(t) for t in (team_a, team_b)}
+        lines = {
+            (t['name'], p['name']): Counter(skill=p['skill'], agent=agents[t['name']][i])
+            for t in (team_a, team_b) for i, p in enumerate(t['roster'])
+        }
+        duels = {}
+        score = {n: 0 for n in names}
+        side_score = Counter()
+        methods = {n: Counter() for n in names}
+        buys = {n: None for n in names}
+        round_number = 0
+
+        while True:
+            round_number += 1
+            # Team A attacks the first half, sides swap at 13 and every overtime round
+            if round_number <= 24:
+                a_attacks = round_number <= 12
+            else:
+                a_attacks = (round_number - 25) % 2 == 0
+            attacker = names[0] if a_attacks else names[1]
+            winner = names[0] if rng.random() < p_round else names[1]
+            loser = names[1] if winner == names[0] else names[0]
+            half = 'overtime' if round_number > 24 else ('attack' if winner == attacker else 'defense')
+            side_score[(winner, half)] += 1
+            score[winner] += 1
+
+            if winner == attacker:
+                method = 'Elimination' if rng.random() < 0.6 else 'Detonated'
+            else:
+                method = rng.choice(['Elimination', 'Defused', 'Time Expiry (No Plant)'], p=[0.6, 0.25, 0.15])
+            methods[winner][method] += 1
+            methods[loser][LOSS_METHODS[method]] += 1
+            for team, outcome, label in ((winner, 'Win', method), (loser, 'Loss', LOSS_METHODS[method])):
+                self.tables['win_loss_methods_round_number'].append({
+                    **match, 'Map': map_name, 'Round Number': round_number,
+                    'Team': team, 'Method': label, 'Outcome': outcome,
+                })
+
+            self.play_round(match, map_name, round_number, (team_a, team_b), winner, method, lines, duels, agents)
+            if method in ('Detonated', 'Defused'):
+                lines[(attacker, self.random_player(attacker))]['plants'] += 1
+            if method == 'Defused':
+                lines[(winner, self.random_player(winner))]['defuses'] += 1
+            self.economy(match, map_name, round_number, names, winner, buys)
+
+            a, b = score[names[0]], score[names[1]]
+            if (max(a, b) >= 13 and round_number <= 24) or (round_number > 24 and abs(a - b) >= 2):
+                break
+
+        duration = int(round_number * rng.normal(105, 8))
+        row = {**match, 'Map': map_name}
+        for prefix, team, other in (('Team A', names[0], names[1]), ('Team B', names[1], names[0])):
+            overtime = side_score[(team, 'overtime')]
+            row.update({
+                prefix: team,
+                f'{prefix} Score': score[team],
+                f'{prefix} Attacker Score': side_score[(team, 'attack')],
+                f'{prefix} Defender Score': side_score[(team, 'defense')],
+                f'{prefix} Overtime Score': overtime if round_number > 24 else None,
+            })
+        row['Duration'] = f"{duration // 60}:{duration % 60:02d}"
+        self.tables['maps_scores'].append(row)
+
+        for team in names:
+            self.tables['win_loss_methods_count'].append({
+                **match, 'Map': map_name, 'Team': team,
+                **{m: methods[team][m] for m in list(LOSS_METHODS) + list(LOSS_METHODS.values())},
+            })
+
+        for (player_team, player), line in lines.items():
+            self.player_maps.append({
+                **match, 'Map': map_name, 'Team': player_team, 'Player': player,
+                'Agent': line['agent'], 'Rounds': round_number, **{k: v for k, v in line.items() if k not in ('agent', 'skill')},
+            })
+        for (player, enemy, kind), (player_kills, enemy_kills, player_team, enemy_team) in duels.items():
+            self.tables['kills'].append({
+                **match, 'Map': map_name, 'Player Team': player_team, 'Player': player,
+                'Enemy Team': enemy_team, 'Enemy': enemy, 'Player Kills': player_kills, 'Enemy Kills': enemy_kills,
+                'Difference': player_kills - enemy_kills, 'Kill Type': kind,
+            })
+        return max(score, key=score.get)
+
+    def random_player(self, team):
+        roster = self.by_name[team]['roster']
+        return roster[int(self.rng.integers(len(roster)))]['name']
+
+    def pick_agents(self, team):
+        return [str(self.rng.choice(AGENTS[p['role']])) for p in team['roster']]
+
+    def play_round(self, match, map_name, round_number, teams, winner, method, lines, duels, agents):
+        """Kill feed for one round; the losing team is wiped on eliminations"""
+        rng = self.rng
+        alive = {t['name']: [p['name'] for p in t['roster']] for t in teams}
+        loser = teams[1]['name'] if winner == teams[0]['name'] else teams[0]['name']
+        kill_budget = 10 if method == 'Elimination' else int(rng.integers(2, 9))
+        feed = []
+        clutch = None
+        while len(alive[loser]) > 0 and len(feed) < kill_budget:
+            if len(alive[winner]) == 1 and clutch is None:
+                clutch = (alive[winner][0], len(alive[loser]))
+            killer_team = winner if (len(alive[winner]) == 1 or rng.random() < 0.58) else loser
+            if killer_team == loser and len(alive[winner]) == 1:
+                killer_team = winner
+            victim_team = loser if killer_team == winner else winner
+            if method != 'Elimination' and len(alive[victim_team]) == 1:
+                break
+            killer = alive[killer_team][int(rng.integers(len(alive[killer_team])))]
+            victim = alive[victim_team].pop(int(rng.integers(len(alive[victim_team]))))
+            feed.append((killer_team, killer, victim_team, victim))
+
+        slots = {p['name']: i for t in teams for i, p in enumerate(t['roster'])}
+        kill_counts = Counter((team, player) for team, player, _, _ in feed)
+        for position, (killer_team, killer, victim_team, victim) in enumerate(feed):
+            count = kill_counts[(killer_team, killer)]
+            killer_agent = agents[killer_team][slots[killer]]
+            victim_agent = agents[victim_team][slots[victim]]
+            self.tables['rounds_kills'].append({
+                **match, 'Map': map_name, 'Round Number': round_number,
+                'Eliminator Team': killer_team, 'Eliminator': killer, 'Eliminator Agent': killer_agent,
+                'Eliminated Team': victim_team, 'Eliminated': victim, 'Eliminated Agent': victim_agent,
+                'Kill Type': f"{min(count, 5)}k",
+            })
+            lines[(killer_team, killer)]['kills'] += 1
+            lines[(victim_team, victim)]['deaths'] += 1
+            lines[(killer_team, killer)]['damage'] += int(rng.normal(150, 25))
+            lines[(killer_team, killer)]['headshots'] += int(rng.random() < 0.27)
+            if position == 0:
+                lines[(killer_team, killer)]['first_kills'] += 1
+                lines[(victim_team, victim)]['first_deaths'] += 1
+            self.record_duel(duels, teams[0]['name'], killer_team, killer, victim_team, victim, 'All Kills')
+            if position == 0:
+                self.record_duel(duels, teams[0]['name'], killer_team, killer, victim_team, victim, 'First Kills')
+
+        for (team, player), count in kill_counts.items():
+            if count >= 2:
+                lines[(team, player)][f"{min(count, 5)}k"] += 1
+        dead = {victim for _, _, _, victim in feed}
+        for team in (t['name'] for t in teams):
+            for player in (p['name'] for p in self.by_name[team]['roster']):
+                line = lines[(team, player)]
+                line['assists'] += int(rng.random() < 0.28)
+                line['damage'] += int(rng.normal(25, 10))
+                # Kill, assist, trade or survive
+                line['kast'] += int(player not in dead or kill_counts[(team, player)] > 0 or rng.random() < 0.3)
+                line['econ'] += int(rng.normal(50, 12))
+        if clutch:
+            player, enemies = clutch
+            line = lines[(winner, player)]
+            line['clutches_played'] += 1
+            line['clutches_won'] += 1
+            line[f"1v{min(enemies, 5)}"] += 1
+
+    def record_duel(self, duels, team_a, killer_team, killer, victim_team, victim, kind):
+        """Duels are kept from Team A's perspective only, like the scraped kills table"""
+        if killer_team == team_a:
+            key, team_key = (killer, victim, kind), (killer_team, victim_team)
+        else:
+            key, team_key = (victim, killer, kind), (victim_team, killer_team)
+        player_kills, enemy_kills, _, _ = duels.get(key, (0, 0, None, None))
+        if killer_team == team_a:
+            player_kills += 1
+        else:
+            enemy_kills += 1
+        duels[key] = (player_kills, enemy_kills) + team_key
+
+    def economy(self, match, map_name, round_number, names, winner, buys):
+        """Loadouts per team: pistols are ecos, winners keep buying, losers often save"""
+        rng = self.rng
+        for team in names:
+            if round_number in PISTOL_ROUNDS:
+                buy_type = 'Eco: 0-5k'
+            elif buys[team] is None:
+                buy_type = 'Full buy: 20k+'
+            elif buys[team] == 'Win':
+                buy_type = rng.choice(list(BUY_TYPES), p=[0.03, 0.05, 0.12, 0.80])
+            else:
+                buy_type = rng.choice(list(BUY_TYPES), p=[0.18, 0.08, 0.22, 0.52])
+            low, high = BUY_TYPES[buy_type][1]
+            loadout = int(rng.integers(low, high) // 100 * 100)
+            remaining = int(rng.integers(0, 90) * 100)
+            outcome = 'Win' if team == winner else 'Loss'
+            self.tables['eco_rounds'].append({
+                **match, 'Map': map_name, 'Round Number': round_number, 'Team': team,
+                'Loadout Value': credits_text(loadout), 'Remaining Credits': credits_text(remaining),
+                'Type': buy_type, 'Outcome': outcome,
+            })
+            buys[team] = outcome
+
+    # -- rollups ------------------------------------------------------------
+
+    def series_rollups(self, match, team_a, team_b, played):
+        """eco_stats per map plus the 'All Maps' rows for the series"""
+        rounds = pd.DataFrame([r for r in self.tables['eco_rounds'][-self._eco_rows(played):]])
+        for (map_name, team), group in rounds.groupby(['Map', 'Team'], sort=False):
+            self._eco_stats(match, map_name, team, group)
+        for team, group in rounds.groupby('Team', sort=False):
+            self._eco_stats(match, 'All Maps', team, group)
+
+    def _eco_rows(self, played):
+        """Number of eco_rounds rows written for the maps of the current series"""
+        rows = self.tables['maps_scores'][-len(played):]
+        return sum(2 * (r['Team A Score'] + r['Team B Score']) for r in rows)
+
+    def _eco_stats(self, match, map_name, team, rounds):
+        pistol = rounds['Round Number'].isin(PISTOL_ROUNDS)
+        won = rounds['Outcome'] == 'Win'
+        self.tables['eco_stats'].append({
+            **match, 'Map': map_name, 'Team': team, 'Type': 'Pistol Won', 'Initiated': None,
+            'Won': int((pistol & won).sum()),
+        })
+        for buy_type, (stat_type, _) in BUY_TYPES.items():
+            mask = ~pistol & (rounds['Type'] == buy_type)
+            self.tables['eco_stats'].append({
+                **match, 'Map': map_name, 'Team': team, 'Type': stat_type,
+                'Initiated': int(mask.sum()), 'Won': int((mask & won).sum()),
+            })
+
+    def frames(self):
+        """Every table as a DataFrame with the scraped column layout"""
+        frames = {name: pd.DataFrame(rows) for name, rows in self.tables.items()}
+        maps = pd.DataFrame(self.player_maps).fillna(0)
+        frames['kills_stats'] = self.kills_stats(maps)
+        frames['players_stats'] = self.players_stats(maps)
+        frames['team_mapping'] = pd.DataFrame(
+            [{'Abbreviated': t['abbr'], 'Full Name': t['name']} for t in self.teams]
+        )
+        kills = frames['kills']
+        all_maps = kills.groupby(MATCH_KEY_COLUMNS + ['Player Team', 'Player', 'Enemy Team', 'Enemy', 'Kill Type'],
+                                 as_index=False, sort=False)[['Player Kills', 'Enemy Kills', 'Difference']].sum()
+        frames['kills'] = pd.concat([kills, all_maps.assign(Map='All Maps')], ignore_index=True)[kills.columns]
+        return frames
+
+    def kills_stats(self, maps):
+        counts = ['2k', '3k', '4k', '5k', '1v1', '1v2', '1v3', '1v4', '1v5']
+        for column in counts + ['plants', 'defuses']:
+            if column not in maps:
+                maps[column] = 0
+        keys = MATCH_KEY_COLUMNS + ['Team', 'Player']
+        per_map = maps.assign(Agents=maps['Agent'])
+        all_maps = maps.groupby(keys, as_index=False, sort=False).agg(
+            **{c: (c, 'sum') for c in counts + ['plants', 'defuses', 'econ', 'Rounds']},
+            Agents=('Agent', lambda a: ', '.join(sorted(set(a)))),
+        ).assign(Map='All Maps')
+        frame = pd.concat([all_maps, per_map], ignore_index=True)
+        frame['Econ'] = (frame['econ'] / frame['Rounds']).round().astype(int)
+        frame = frame.rename(columns={'plants': 'Spike Plants', 'defuses': 'Spike Defuses'})
+        # The scraped table leaves zero multi-kill and clutch counts blank
+        frame[counts] = frame[counts].astype(int).replace(0, np.nan).astype('Int64')
+        return frame[keys[:4] + ['Map', 'Team', 'Player', 'Agents'] + counts + ['Econ', 'Spike Plants', 'Spike Defuses']]
+
+    def players_stats(self, maps):
+        """Per (stage, match type) agent rows, multi-agent rows and 'All Stages' rollups"""
+        sums = ['Rounds', 'kills', 'deaths', 'assists', 'first_kills', 'first_deaths', 'damage', 'headshots',
+                'kast', 'clutches_won', 'clutches_played']
+        for column in sums:
+            if column not in maps:
+                maps[column] = 0
+        maps = maps.assign(max_kills=maps['kills'])
+
+        def rollup(frame, keys):
+            per_agent = frame.groupby(keys + ['Agent'], as_index=False, sort=False).agg(
+                **{c: (c, 'sum') for c in sums}, max_kills=('max_kills', 'max'))
+            combined = frame.groupby(keys, as_index=False, sort=False).agg(
+                **{c: (c, 'sum') for c in sums}, max_kills=('max_kills', 'max'),
+                Agent=('Agent', lambda a: ', '.join(sorted(set(a)))), agent_count=('Agent', 'nunique'))
+            combined = combined[combined['agent_count'] > 1].drop(columns='agent_count')
+            return pd.concat([per_agent, combined], ignore_index=True)
+
+        keys = ['Tournament', 'Stage', 'Match Type', 'Player', 'Team']
+        stages = rollup(maps, keys)
+        overall = rollup(maps, ['Tournament', 'Player', 'Team']).assign(**{'Stage': 'All Stages', 'Match Type': 'All Match Types'})
+        frame = pd.concat([stages, overall], ignore_index=True)
+
+        rounds = frame['Rounds'].clip(lower=1)
+        kpr = frame['kills'] / rounds
+        dpr = frame['deaths'] / rounds
+        adr = frame['damage'] / rounds
+        rating = 1.0 + (kpr - dpr) * 1.1 + (adr - 135) / 400 + (frame['kast'] / rounds - 0.72) * 0.8
+        clutch_rate = (100 * frame['clutches_won'] / frame['clutches_played'].where(frame['clutches_played'] > 0))
+
+        def percent(series):
+            return series.round().astype('Int64').astype('string') + '%'
+
+        return pd.DataFrame({
+            'Tournament': frame['Tournament'],
+            'Stage': frame['Stage'],
+            'Match Type': frame['Match Type'],
+            'Player': frame['Player'],
+            'Teams': frame['Team'],
+            'Agents': frame['Agent'],
+            'Rounds Played': frame['Rounds'],
+            'Rating': rating.round(2),
+            'Average Combat Score': (adr * 1.05 + kpr * 60).round().astype(int),
+            'Kills:Deaths': (frame['kills'] / frame['deaths'].clip(lower=1)).round(2),
+            'Kill, Assist, Trade, Survive %': percent(100 * frame['kast'] / rounds),
+            'Average Damage Per Round': adr.round().astype(int),
+            'Kills Per Round': kpr.round(2),
+            'Assists Per Round': (frame['assists'] / rounds).round(2),
+            'First Kills Per Round': (frame['first_kills'] / rounds).round(2),
+            'First Deaths Per Round': (frame['first_deaths'] / rounds).round(2),
+            'Headshot %': percent(100 * frame['headshots'] / frame['kills'].clip(lower=1)),
+            'Clutch Success %': percent(clutch_rate),
+            'Clutches (won/played)': frame['clutches_won'].astype(int).astype(str) + '/' + frame['clutches_played'].astype(int).astype(str),
+            'Maximum Kills in a Single Map': frame['max_kills'].astype(int),
+            'Kills': frame['kills'].astype(int),
+            'Deaths': frame['deaths'].astype(int),
+            'Assists': frame['assists'].astype(int),
+            'First Kills': frame['first_kills'].astype(int),
+            'First Deaths': frame['first_deaths'].astype(int),
+        })
+
+
+# File name -> table name, as read by config.load_data
+OUTPUT_FILES = {
+    'scores.csv': 'scores',
+    'players_stats.csv': 'players_stats',
+    'team_mapping.csv': 'team_mapping',
+    'maps_played.csv': 'maps_played',
+    'maps_scores.csv': 'maps_scores',
+    'kills_stats.csv': 'kills_stats',
+    'eco_stats.csv': 'eco_stats',
+    'eco_rounds.csv': 'eco_rounds',
+    'draft_phase.csv': 'draft_phase',
+    'rounds_kills.csv': 'rounds_kills',
+    'kills.csv': 'kills',
+    'win_loss_methods_count.csv': 'win_loss_methods_count',
+    'win_loss_methods_round_number.csv': 'win_loss_methods_round_number',
+}
+
+
+def generate(out_dir, scale=1, seed=7, teams=48):
+    """Simulate `scale` events and write every CSV into out_dir; returns row counts per file"""
+    generator = Generator(seed, teams)
+    for index in range(scale):
+        generator.event(index)
+    frames = generator.frames()
+
+    os.makedirs(out_dir, exist_ok=True)
+    counts = {}
+    for file_name, table in OUTPUT_FILES.items():
+        frames[table].to_csv(os.path.join(out_dir, file_name), index=False)
+        counts[file_name] = len(frames[table])
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic Valorant CSVs at a given scale")
+    parser.add_argument('--out', required=True, help="Directory to write the CSV files to")
+    parser.add_argument('--scale', type=int, default=1, help="Number of events (1 = one Champions-sized event)")
+    parser.add_argument('--seed', type=int, default=7, help="Random seed, the same seed gives the same data")
+    parser.add_argument('--teams', type=int, default=48, help="Size of the team pool events draw from")
+    args = parser.parse_args()
+
+    print(f"🧪 Generating {args.scale}x synthetic data into {args.out}")
+    started = time.perf_counter()
+    counts = generate(args.out, args.scale, args.seed, args.teams)
+    for file_name, rows in counts.items():
+        print(f"   {file_name:<36} {rows:>10,} rows")
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s")
+    if args.scale > 1:
+        print("   Load every event with VALORANT_TOURNAMENT=all")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,134 @@
 import pandas as pd
 import os
 import hashlib
+import logging
+import time
+from utils.schema import coerce_dataset
+from utils.data_store import DataStore
+from utils.storage import create_storage
+from utils.startup import startup
+
+logger = logging.getLogger("valorant.config")
 
 
 # Global data containers
-data_store = {}
+data_store = DataStore()
+data_state = {"version": None}
+
+# Structures derived from data_store (coerced frames, indexes, precomputed
+# aggregates). Builders are registered by the services that own them and are
+# rebuilt after every load so they never go stale.
+derived_store = {}
+_derived_builders = {}
+# Optional updaters that fold newly ingested rows into a built structure
+_derived_updaters = {}
 def filter_by_tournament(df, tournament="Valorant Champions 2025"):
     """Filter dataframe by tournament if column exists"""
-    if df is None or df.empty:
+    if df is None or df.empty or not tournament:
         return df
     if 'Tournament' in df.columns:
         return df[df['Tournament'] == tournament].copy()
     return df
 
-DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DATA_DIR = os.environ.get(
+    "VALORANT_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+)
+
+# Tournament kept at load time; "all" keeps every tournament (e.g. multi-season synthetic data)
+TOURNAMENT_FILTER = os.environ.get("VALORANT_TOURNAMENT", "Valorant Champions 2025")
+
+# Rows serialized per chunk by the streaming export endpoints
+EXPORT_CHUNK_ROWS = int(os.environ.get("EXPORT_CHUNK_ROWS", 5000))
+
+# Budgets for the /aggregate endpoint. The time budget is enforced while the
+# query runs: inputs over AGGREGATE_CHUNK_ROWS rows are aggregated in chunks
+# with a deadline check before each one (SQLite interrupts the query itself)
+AGGREGATE_MAX_ROWS = int(os.environ.get("AGGREGATE_MAX_ROWS", 2_000_000))
+AGGREGATE_TIME_BUDGET_SECONDS = float(os.environ.get("AGGREGATE_TIME_BUDGET_SECONDS", 2.0))
+AGGREGATE_CACHE_SIZE = int(os.environ.get("AGGREGATE_CACHE_SIZE", 256))
+AGGREGATE_CHUNK_ROWS = int(os.environ.get("AGGREGATE_CHUNK_ROWS", 250_000))
+
+# Logging and per-request profiling (?profile=1). Profiling is opt-in: any client
+# could otherwise make the server run cProfile on demand.
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED", "0") == "1"
+PROFILE_TOP_FUNCTIONS = int(os.environ.get("PROFILE_TOP_FUNCTIONS", 30))
+
+# Admission control for heavy endpoints (see utils/concurrency.py): requests
+# beyond an endpoint's cap wait up to ROUTE_QUEUE_TIMEOUT_SECONDS in a queue of
+# at most ROUTE_QUEUE_LIMIT, anything more gets a 503
+ROUTE_QUEUE_LIMIT = int(os.environ.get("ROUTE_QUEUE_LIMIT", 16))
+ROUTE_QUEUE_TIMEOUT_SECONDS = float(os.environ.get("ROUTE_QUEUE_TIMEOUT_SECONDS", 10.0))
+
+# Thread pools used by the ASGI entry point (asgi.py)
+ASGI_LIGHT_THREADS = int(os.environ.get("ASGI_LIGHT_THREADS", 8))
+ASGI_HEAVY_THREADS = int(os.environ.get("ASGI_HEAVY_THREADS", 4))
+ASGI_HEAVY_QUEUE_LIMIT = int(os.environ.get("ASGI_HEAVY_QUEUE_LIMIT", 64))
+
+# Response compression (see utils/compression.py): bodies under
+# COMPRESSION_MIN_BYTES go out as-is; lower levels trade bandwidth for CPU.
+# Responses of CACHED_ENDPOINTS are kept (with their compressed
+# variants) for the RESPONSE_CACHE_SIZE most recent URLs per data version.
+COMPRESSION_ENABLED = os.environ.get("COMPRESSION_ENABLED", "1") == "1"
+COMPRESSION_MIN_BYTES = int(os.environ.get("COMPRESSION_MIN_BYTES", 1024))
+COMPRESSION_GZIP_LEVEL = int(os.environ.get("COMPRESSION_GZIP_LEVEL", 6))
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get("COMPRESSION_BROTLI_QUALITY", 5))
+RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE", 256))
+
+# Rounds a player (or team, counted in player-rounds) needs in a scope to be ranked on its leaderboards
+LEADERBOARD_MIN_ROUNDS = int(os.environ.get("LEADERBOARD_MIN_ROUNDS", 50))
+
+# Name search: results per query, and the largest edit distance a fuzzy match may have
+SEARCH_RESULT_LIMIT = int(os.environ.get("SEARCH_RESULT_LIMIT", 10))
+SEARCH_MAX_EDIT_DISTANCE = int(os.environ.get("SEARCH_MAX_EDIT_DISTANCE", 2))
+
+# Player form curves: matches in the rolling KD window, and the span (in matches) of the rating EWMA
+FORM_WINDOW = int(os.environ.get("FORM_WINDOW", 5))
+FORM_EWMA_SPAN = int(os.environ.get("FORM_EWMA_SPAN", 5))
+
+# Maps a team or player needs on a map (in the selected stage) to be ranked on its map page
+MAPS_MIN_PLAYED = int(os.environ.get("MAPS_MIN_PLAYED", 3))
+
+# Memory budget (see utils/memory.py) for datasets, derived indexes and caches;
+# 0 disables it. Over budget, cache entries are evicted first, then datasets not
+# read for MEMORY_COLD_SECONDS are spilled to MEMORY_SPILL_DIR and mapped back in
+# when next read. Usage is checked at most every MEMORY_CHECK_INTERVAL_SECONDS.
+MEMORY_BUDGET_BYTES = int(os.environ.get("MEMORY_BUDGET_BYTES", 0))
+MEMORY_COLD_SECONDS = float(os.environ.get("MEMORY_COLD_SECONDS", 60.0))
+MEMORY_CHECK_INTERVAL_SECONDS = float(os.environ.get("MEMORY_CHECK_INTERVAL_SECONDS", 5.0))
+MEMORY_SPILL_DIR = os.environ.get(
+    "MEMORY_SPILL_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "spill")
+)
+
+# Warm-up after loading (see utils/warmup.py): render the hot payloads of the first
+# WARMUP_MATCHES matches and the top WARMUP_PLAYERS players, then touch every route
+# once; /ready answers 503 until it is done. WARMUP_MODE is "background" (serve
+# while warming up), "sync" (warm up before create_app returns) or "off".
+WARMUP_MODE = os.environ.get("WARMUP_MODE", "background")
+WARMUP_MATCHES = int(os.environ.get("WARMUP_MATCHES", 10))
+WARMUP_PLAYERS = int(os.environ.get("WARMUP_PLAYERS", 10))
+
+# Response bodies written by precompute.py, one directory per data and code version;
+# served in place of running the view when present. Empty disables the lookup.
+PRECOMPUTED_DIR = os.environ.get(
+    "PRECOMPUTED_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "precomputed")
+)
+
+# Persistent result store (see utils/result_store.py): SQLite file shared by every
+# worker process and kept across restarts; empty disables it. Least recently read
+# results are evicted once the compressed values pass RESULT_STORE_MAX_BYTES.
+RESULT_STORE_PATH = os.environ.get(
+    "RESULT_STORE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "results.sqlite3")
+)
+RESULT_STORE_MAX_BYTES = int(os.environ.get("RESULT_STORE_MAX_BYTES", 512 * 1024 * 1024))
+
+# Query backend for pushed-down filters and aggregations (see utils/storage.py):
+# "pandas" masks the loaded frames, "sqlite" queries an indexed in-memory copy
+STORAGE_BACKEND = os.environ.get("STORAGE_BACKEND", "pandas")
+storage = create_storage(STORAGE_BACKEND)
+
+# Rows per chunk when streaming large CSVs (eco_rounds) through the tournament filter
+CSV_CHUNK_ROWS = int(os.environ.get("CSV_CHUNK_ROWS", 10000))
 
 def generate_match_id_from_row(row: dict):
     """Generate unique match ID from row data"""
@@ -25,42 +140,149 @@ def generate_match_id_from_row(row: dict):
     base = f"{name}||{stage}||{tour}||{team_a}||{team_b}"
     return hashlib.md5(base.encode("utf-8")).hexdigest()[:8]
 
+def read_csv_filtered(path, tournament, chunksize=None):
+    """Stream a large CSV in chunks, keeping only the rows of the tournament"""
+    chunks = [
+        filter_by_tournament(chunk, tournament)
+        for chunk in pd.read_csv(path, chunksize=chunksize or CSV_CHUNK_ROWS)
+    ]
+    return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+def compute_data_version(data_dir, tournament):
+    """Fingerprint the CSV files (name, size, mtime) so caches can key on the loaded data"""
+    digest = hashlib.md5((tournament or "all").encode("utf-8"))
+    for file_name in sorted(os.listdir(data_dir)):
+        if not file_name.endswith(".csv"):
+            continue
+        stat = os.stat(os.path.join(data_dir, file_name))
+        digest.update(f"{file_name}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+def compute_code_version():
+    """Fingerprint the backend's Python sources, so results persisted by other code are not reused"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.md5()
+    for directory in ("", "routes", "services", "utils"):
+        path = os.path.join(root, directory)
+        for file_name in sorted(os.listdir(path)):
+            if file_name.endswith(".py"):
+                with open(os.path.join(path, file_name), "rb") as handle:
+                    digest.update(f"{directory}/{file_name}:".encode("utf-8") + handle.read())
+    return digest.hexdigest()[:12]
+
+# Part of the key of everything kept across restarts (result store, precomputed
+# bodies). Deploys may set CODE_VERSION (e.g. to the git revision) instead of
+# hashing the sources at startup.
+CODE_VERSION = os.environ.get("CODE_VERSION") or compute_code_version()
+
 def load_data():
     """Load all CSV files into global data store"""
-    print("🔄 Loading data...")
+    logger.info("🔄 Loading data...")
     
     try:
+        tournament_filter = None if TOURNAMENT_FILTER.lower() == "all" else TOURNAMENT_FILTER
+        logger.info("📊 Filtering for tournament: %s", tournament_filter or "all tournaments")
+
         # Load all CSV files
-        raw_data = {
-            'scores': pd.read_csv(os.path.join(DATA_DIR, "scores.csv")),
-            'players_stats': pd.read_csv(os.path.join(DATA_DIR, "players_stats.csv")),
-            'team_mapping': pd.read_csv(os.path.join(DATA_DIR, "team_mapping.csv")),
-            'maps_played': pd.read_csv(os.path.join(DATA_DIR, "maps_played.csv")),
-            'maps_scores': pd.read_csv(os.path.join(DATA_DIR, "maps_scores.csv")),
-            'kills_stats': pd.read_csv(os.path.join(DATA_DIR, "kills_stats.csv")),
-            'draft_phase': pd.read_csv(os.path.join(DATA_DIR, "draft_phase.csv")),
-            'rounds_kills': pd.read_csv(os.path.join(DATA_DIR, "rounds_kills.csv")),
-            'kills': pd.read_csv(os.path.join(DATA_DIR, "kills.csv")),
-            'win_loss_methods_count': pd.read_csv(os.path.join(DATA_DIR, "win_loss_methods_count.csv")),
-            'win_loss_method_round_number': pd.read_csv(os.path.join(DATA_DIR, "win_loss_methods_round_number.csv"))
-        }
-        tournament_filter = "Valorant Champions 2025" 
-        print(f"📊 Filtering for tournament: {tournament_filter}")
-        for key, df in raw_data.items():
-            data_store[key] = filter_by_tournament(df, tournament_filter)
-
-        # Generate match IDs
-        data_store['scores']["match_id"] = data_store['scores'].apply(
-            lambda r: generate_match_id_from_row(r.to_dict()), axis=1
-        )
+        with startup.phase("read_csv"):
+            raw_data = {
+                'scores': pd.read_csv(os.path.join(DATA_DIR, "scores.csv")),
+                'players_stats': pd.read_csv(os.path.join(DATA_DIR, "players_stats.csv")),
+                'team_mapping': pd.read_csv(os.path.join(DATA_DIR, "team_mapping.csv")),
+                'maps_played': pd.read_csv(os.path.join(DATA_DIR, "maps_played.csv")),
+                'maps_scores': pd.read_csv(os.path.join(DATA_DIR, "maps_scores.csv")),
+                'kills_stats': pd.read_csv(os.path.join(DATA_DIR, "kills_stats.csv")),
+                'eco_stats': pd.read_csv(os.path.join(DATA_DIR, "eco_stats.csv")),
+                'eco_rounds': read_csv_filtered(os.path.join(DATA_DIR, "eco_rounds.csv"), tournament_filter),
+                'draft_phase': pd.read_csv(os.path.join(DATA_DIR, "draft_phase.csv")),
+                'rounds_kills': pd.read_csv(os.path.join(DATA_DIR, "rounds_kills.csv")),
+                'kills': pd.read_csv(os.path.join(DATA_DIR, "kills.csv")),
+                'win_loss_methods_count': pd.read_csv(os.path.join(DATA_DIR, "win_loss_methods_count.csv")),
+                'win_loss_method_round_number': pd.read_csv(os.path.join(DATA_DIR, "win_loss_methods_round_number.csv"))
+            }
+        with startup.phase("coerce"):
+            for key, df in raw_data.items():
+                # Parse percentage/ratio/credit strings once so request paths stay numeric
+                data_store[key] = coerce_dataset(key, filter_by_tournament(df, tournament_filter))
+
+            # Generate match IDs
+            data_store['scores']["match_id"] = data_store['scores'].apply(
+                lambda r: generate_match_id_from_row(r.to_dict()), axis=1
+            )
+            data_state["version"] = compute_data_version(DATA_DIR, tournament_filter)
+        with startup.phase("storage"):
+            storage.load(data_store)
+        with startup.phase("indexes"):
+            build_derived()
         
-        print("✅ Data loaded successfully!")
-        print(f"📊 Loaded {len(data_store)} datasets")
+        logger.info("✅ Data loaded successfully!")
+        logger.info("📊 Loaded %d datasets", len(data_store))
         
     except Exception as e:
-        print(f"❌ Error loading data: {e}")
+        logger.exception("❌ Error loading data: %s", e)
         raise e
 
 def get_data(key):
     """Get data from global store"""
     return data_store.get(key)
+
+def register_derived(name, builder, updater=None):
+    """Register a builder that precomputes a derived structure after each load.
+
+    updater(structure, new_rows) is called by ingest_data with the rows just
+    appended per dataset and returns the updated structure; structures without
+    one are rebuilt from scratch on next access.
+    """
+    _derived_builders[name] = builder
+    if updater is not None:
+        _derived_updaters[name] = updater
+
+def build_derived():
+    """(Re)build every registered derived structure from the current data_store"""
+    derived_store.clear()
+    for name in list(_derived_builders):
+        # Includes the structures this one is the first to need
+        started = time.perf_counter()
+        get_derived(name)
+        startup.detail("indexes", name, time.perf_counter() - started)
+
+def get_derived(name):
+    """Get a derived structure, building it on first access if needed"""
+    if name not in derived_store and name in _derived_builders:
+        derived_store[name] = _derived_builders[name]()
+    return derived_store.get(name)
+
+def ingest_data(frames):
+    """Append rows of newly played matches ({dataset: DataFrame}) to the loaded data.
+
+    Rows go through the same tournament filter and schema coercion as load_data.
+    Derived structures with an updater absorb the new rows incrementally.
+    """
+    tournament_filter = None if TOURNAMENT_FILTER.lower() == "all" else TOURNAMENT_FILTER
+    new_rows = {}
+    for key, df in frames.items():
+        df = coerce_dataset(key, filter_by_tournament(df, tournament_filter))
+        if key == 'scores':
+            df["match_id"] = df.apply(lambda r: generate_match_id_from_row(r.to_dict()), axis=1)
+        current = data_store.get(key)
+        data_store[key] = df if current is None else pd.concat([current, df], ignore_index=True)
+        storage.append(key, df)
+        new_rows[key] = df
+
+    sizes = ",".join(f"{key}:{data_store.shape(key)[0]}" for key in sorted(data_store.names()))
+    data_state["version"] = hashlib.md5(f"{data_state['version']}|{sizes}".encode("utf-8")).hexdigest()[:12]
+    for name in list(derived_store):
+        updater = _derived_updaters.get(name)
+        if updater is not None:
+            derived_store[name] = updater(derived_store[name], new_rows)
+        else:
+            del derived_store[name]
+    logger.info("📥 Ingested %s", ", ".join(f"{len(df)} {key} rows" for key, df in new_rows.items()))
+
+def get_storage():
+    """The active query backend"""
+    return storage
+
+def get_data_version():
+    """Version of the currently loaded data, used to key caches"""
+    return data_state["version"]
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Precompute per-match API responses across a process pool.
+
+Loads the data once, writes it as a memory-mappable snapshot (utils/snapshot.py)
+and shards the match ids over worker processes. Workers map the snapshot
+instead of receiving pickled frames, build the derived structures, render
+every per-match endpoint through the real routes and write the bodies to
+PRECOMPUTED_DIR/<data version>/. Serving processes replay those bodies (see
+utils/compression.py) instead of running the views.
+
+    python precompute.py --workers 8
+    python precompute.py --data-dir /tmp/valorant-50x --endpoint round_analysis
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import config
+from utils.precomputed import precomputed_dir, write_precomputed
+
+# Per-match endpoints worth precomputing: name -> URL path of a match id
+ENDPOINTS = {
+    'round_analysis': '/api/round_analysis/{}',
+    'match_details': '/api/match_details/{}',
+    'players': '/api/players/{}',
+}
+# Shards per worker, so a slow shard does not leave the other cores idle at the end
+SHARDS_PER_WORKER = 4
+
+_worker = {}
+
+
+def _init_worker(snapshot_dir, version, out_dir):
+    """Map the snapshot into this worker's data store and build an app over it"""
+    from flask import Flask
+    from routes.match_routes import match_bp
+    from routes.player_routes import player_bp
+    from utils.snapshot import read_snapshot
+
+    config.data_store.update(read_snapshot(snapshot_dir))
+    config.data_state["version"] = version
+    config.PRECOMPUTED_DIR = out_dir
+    config.storage.load(config.data_store)
+    config.build_derived()
+
+    # Only the routes: no compression, response cache or concurrency gate
+    app = Flask(__name__)
+    app.register_blueprint(match_bp, url_prefix="/api")
+    app.register_blueprint(player_bp, url_prefix="/api")
+    _worker["client"] = app.test_client()
+    _worker["version"] = version
+
+
+def _precompute_shard(match_ids, endpoints):
+    """Render and store every endpoint of a shard of match ids"""
+    client, version = _worker["client"], _worker["version"]
+    written = failed = size = 0
+    for match_id in match_ids:
+        for endpoint in endpoints:
+            path = ENDPOINTS[endpoint].format(match_id)
+            response = client.get(path)
+            if response.status_code != 200:
+                failed += 1
+                continue
+            body = response.get_data()
+            write_precomputed(version, path, body)
+            written += 1
+            size += len(body)
+    return written, failed, size
+
+
+def _shards(values, count):
+    size = max(1, -(-len(values) // count))
+    return [values[start:start + size] for start in range(0, len(values), size)]
+
+
+def precompute(workers, endpoints):
+    """Precompute every endpoint for every match id and return a summary"""
+    started = time.perf_counter()
+    config.load_data()
+    version = config.get_data_version()
+    match_ids = config.get_data('scores')['match_id'].tolist()
+    loaded = time.perf_counter()
+
+    results = {"version": version, "matches": len(match_ids), "written": 0, "failed": 0, "bytes": 0}
+    os.makedirs(config.PRECOMPUTED_DIR, exist_ok=True)
+    snapshot_dir = tempfile.mkdtemp(prefix=".snapshot-", dir=config.PRECOMPUTED_DIR)
+    try:
+        from utils.snapshot import write_snapshot
+        write_snapshot(config.data_store, snapshot_dir)
+        # spawn: workers start clean and get the data from the snapshot only
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker,
+                                 initargs=(snapshot_dir, version, config.PRECOMPUTED_DIR)) as pool:
+            futures = [pool.submit(_precompute_shard, shard, endpoints)
+                       for shard in _shards(match_ids, workers * SHARDS_PER_WORKER)]
+            for future in as_completed(futures):
+                written, failed, size = future.result()
+                results["written"] += written
+                results["failed"] += failed
+                results["bytes"] += size
+    finally:
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+
+    results["load_seconds"] = loaded - started
+    results["precompute_seconds"] = time.perf_counter() - loaded
+    return results
+
+
+def prune(version):
+    """Remove the bodies of every other data or code version"""
+    keep = os.path.basename(precomputed_dir(version))
+    for name in os.listdir(config.PRECOMPUTED_DIR):
+        path = os.path.join(config.PRECOMPUTED_DIR, name)
+        if name != keep and not name.startswith('.') and os.path.isdir(path):
+            shutil.rmtree(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute per-match API responses")
+    parser.add_argument('--data-dir', help="Directory with the CSV files (defaults to backend/data)")
+    parser.add_argument('--out', help="Directory for the bodies (defaults to PRECOMPUTED_DIR)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument('--endpoint', action='append', choices=sorted(ENDPOINTS),
+                        help="Only precompute this endpoint (repeatable)")
+    parser.add_argument('--prune', action='store_true', help="Delete bodies of other data or code versions")
+    args = parser.parse_args()
+
+    if args.data_dir:
+        config.DATA_DIR = os.path.abspath(args.data_dir)
+    if args.out:
+        config.PRECOMPUTED_DIR = os.path.abspath(args.out)
+
+    print("🟪 Valorant precompute")
+    print("=" * 40)
+    results = precompute(args.workers, args.endpoint or list(ENDPOINTS))
+    print(f"📦 Data version {results['version']}: {results['matches']} matches, {args.workers} worker(s)")
+    print(f"⏱️  Load {results['load_seconds']:.2f}s, precompute {results['precompute_seconds']:.2f}s")
+    print(f"💾 Wrote {results['written']} bodies ({results['bytes'] / 1e6:.1f} MB), "
+          f"{results['failed']} failed, to {config.PRECOMPUTED_DIR}")
+    if args.prune:
+        prune(results['version'])
+
+
+if __name__ == "__main__":
+    main()
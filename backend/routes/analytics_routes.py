@@ -1,8 +1,10 @@
 from flask import Blueprint, jsonify, request
 from services.analytics_service import AnalyticsService
+from services.correlation_service import CorrelationService
 
 analytics_bp = Blueprint('analytics', __name__)
 analytics_service = AnalyticsService()
+correlation_service = CorrelationService()
 
 @analytics_bp.route('/player_clustering')
 def get_player_clustering():
@@ -22,3 +24,22 @@ def get_match_predictions(match_id):
         return jsonify(predictions)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+
+@analytics_bp.route('/correlations')
+def get_correlations():
+    """Get correlation matrix over numeric player or team stats"""
+    try:
+        correlations = correlation_service.get_correlations(
+            dataset=request.args.get('dataset', 'players_stats'),
+            method=request.args.get('method', 'pearson'),
+            missing=request.args.get('missing', 'pairwise'),
+            tournament=request.args.get('tournament'),
+            stage=request.args.get('stage'),
+            agent=request.args.get('agent'),
+            min_periods=request.args.get('min_periods', 3, type=int)
+        )
+        return jsonify(correlations)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
@@ -0,0 +1,68 @@
+from flask import Blueprint, jsonify, request, Response
+from services.export_service import ExportService, EXPORT_FORMATS
+from services.aggregate_service import AggregateService, QueryBudgetExceeded
+from utils.query import parse_filters, DatasetNotFound
+
+data_bp = Blueprint('data', __name__)
+export_service = ExportService()
+aggregate_service = AggregateService()
+
+@data_bp.route('/datasets')
+def get_datasets():
+    """List available datasets"""
+    try:
+        return jsonify(export_service.list_datasets())
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@data_bp.route('/dataset')
+def export_dataset():
+    """Stream a dataset as NDJSON or CSV with optional projection and filters"""
+    name = request.args.get('name')
+    if not name:
+        return jsonify({"error": "No dataset specified"}), 400
+
+    fmt = request.args.get('format', 'ndjson')
+    try:
+        chunks = export_service.stream_dataset(
+            name,
+            fmt=fmt,
+            columns=request.args.getlist('columns'),
+            filters=parse_filters(request.args.getlist('filter')),
+            chunk_size=request.args.get('chunk_size', type=int)
+        )
+    except DatasetNotFound:
+        return jsonify({"error": f"Dataset '{name}' not found"}), 404
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+    response = Response(chunks, mimetype=EXPORT_FORMATS[fmt])
+    response.headers['Content-Disposition'] = f'attachment; filename="{name}.{fmt}"'
+    return response
+
+@data_bp.route('/aggregate')
+def aggregate_dataset():
+    """Server-side group-by aggregation over a dataset"""
+    name = request.args.get('name')
+    if not name:
+        return jsonify({"error": "No dataset specified"}), 400
+
+    try:
+        result = aggregate_service.aggregate(
+            name,
+            group_by=request.args.getlist('group_by'),
+            metrics=request.args.getlist('metric'),
+            filters=parse_filters(request.args.getlist('filter')),
+            weight=request.args.get('weight')
+        )
+        return jsonify(result)
+    except DatasetNotFound:
+        return jsonify({"error": f"Dataset '{name}' not found"}), 404
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except QueryBudgetExceeded as e:
+        return jsonify({"error": str(e)}), 422
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
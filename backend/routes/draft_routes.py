@@ -0,0 +1,35 @@
+from flask import Blueprint, jsonify
+from services.draft_service import DraftService
+
+draft_bp = Blueprint('draft', __name__)
+draft_service = DraftService()
+
+@draft_bp.route('/draft/teams')
+def get_draft_teams():
+    """Get pick/ban summary for every team"""
+    try:
+        return jsonify(draft_service.get_teams_draft())
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@draft_bp.route('/draft/team/<team_name>')
+def get_draft_team(team_name):
+    """Get map pick, ban and decider rates and pick-to-win for a team"""
+    try:
+        draft = draft_service.get_team_draft(team_name)
+        if not draft:
+            return jsonify({"error": f"Team '{team_name}' not found"}), 404
+        return jsonify(draft)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@draft_bp.route('/draft/match/<match_id>')
+def get_draft_match(match_id):
+    """Get the pick/ban sequence of a match with its decider and pick outcomes"""
+    try:
+        draft = draft_service.get_match_draft(match_id)
+        if draft is None:
+            return jsonify({"error": "Match not found"}), 404
+        return jsonify(draft)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
@@ -0,0 +1,35 @@
+from flask import Blueprint, jsonify
+from services.eco_service import EcoService
+
+eco_bp = Blueprint('eco', __name__)
+eco_service = EcoService()
+
+@eco_bp.route('/eco/teams')
+def get_eco_teams():
+    """Get buy-type conversion rates for every team"""
+    try:
+        return jsonify(eco_service.get_teams_conversion())
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@eco_bp.route('/eco/team/<team_name>')
+def get_eco_team(team_name):
+    """Get buy-type conversion rates for a team, overall and per map"""
+    try:
+        conversion = eco_service.get_team_conversion(team_name)
+        if not conversion:
+            return jsonify({"error": f"Team '{team_name}' not found"}), 404
+        return jsonify(conversion)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@eco_bp.route('/eco/match/<match_id>')
+def get_eco_match(match_id):
+    """Get round-by-round loadouts and buy-type conversion for a match"""
+    try:
+        economy = eco_service.get_match_economy(match_id)
+        if economy is None:
+            return jsonify({"error": "Match not found"}), 404
+        return jsonify(economy)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
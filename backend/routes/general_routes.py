@@ -1,6 +1,9 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, jsonify, request
 from config import data_store
 from routes.match_routes import match_service
+from utils.instrumentation import metrics
+from utils.memory import memory_report
+from utils.startup import startup
 
 general_bp = Blueprint('general', __name__)
 
@@ -11,14 +14,19 @@ def index():
         data_summary = {
             "status": "online",
             "message": "Valorant Backend API",
-            "loaded_datasets": list(data_store.keys()),
-            "dataset_sizes": {k: len(v) if v is not None else 0 for k, v in data_store.items()},
+            "loaded_datasets": data_store.names(),
+            "dataset_sizes": {k: data_store.shape(k)[0] for k in data_store.names()},
             "endpoints": {
                 "root": "/",
                 "matches": "/matches",
-                "api_matches": "/api/matches"
+                "api_matches": "/api/matches",
+                "metrics": "/metrics",
+                "ready": "/ready"
             }
         }
+        # Opt-in: the report deep-walks every dataset, index and cache
+        if request.args.get('memory') == '1':
+            data_summary["memory"] = memory_report()
         return jsonify(data_summary)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -36,3 +44,15 @@ def get_matches_alias():
 def health():
     """Simple health check."""
     return jsonify({"status": "healthy"}), 200
+
+@general_bp.route('/ready')
+def ready():
+    """Readiness check: 503 until the data is loaded and the warm-up has finished."""
+    report = startup.report()
+    status = "ready" if report["ready"] else "warming_up"
+    return jsonify({"status": status, **report}), 200 if report["ready"] else 503
+
+@general_bp.route('/metrics')
+def get_metrics():
+    """Request, stage and cache metrics in Prometheus text format."""
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,23 @@
+from flask import Blueprint, jsonify, request
+from services.highlight_service import HighlightService
+from config import SEARCH_RESULT_LIMIT
+
+highlight_bp = Blueprint('highlight', __name__)
+highlight_service = HighlightService()
+
+@highlight_bp.route('/highlights')
+def get_highlights():
+    """Get multi-kill and clutch counts of a player or a match, or the top players without either"""
+    try:
+        highlights = highlight_service.get_highlights(
+            player=request.args.get('player'),
+            match_id=request.args.get('match_id'),
+            limit=request.args.get('limit', SEARCH_RESULT_LIMIT, type=int)
+        )
+        if highlights is None:
+            return jsonify({"error": "Player or match not found"}), 404
+        return jsonify(highlights)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
@@ -0,0 +1,26 @@
+from flask import Blueprint, jsonify, request
+from services.leaderboard_service import LeaderboardService
+
+leaderboard_bp = Blueprint('leaderboard', __name__)
+leaderboard_service = LeaderboardService()
+
+@leaderboard_bp.route('/leaderboards')
+def get_leaderboard():
+    """Get the top players or teams on a metric, optionally per tournament, stage and agent"""
+    try:
+        metric = request.args.get('metric')
+        if not metric:
+            return jsonify({"error": "No metric specified"}), 400
+        leaderboard = leaderboard_service.get_leaderboard(
+            metric,
+            k=request.args.get('k', 10, type=int),
+            entity=request.args.get('entity', 'players'),
+            tournament=request.args.get('tournament', 'all'),
+            stage=request.args.get('stage', 'all'),
+            agent=request.args.get('agent', 'all')
+        )
+        return jsonify(leaderboard)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
@@ -0,0 +1,60 @@
+from flask import Blueprint, jsonify, request
+from services.map_service import MapService
+from config import MAPS_MIN_PLAYED
+
+map_bp = Blueprint('map', __name__)
+map_service = MapService()
+
+@map_bp.route('/maps')
+def get_maps():
+    """Get every map with attack/defense splits, durations and win methods"""
+    try:
+        return jsonify(map_service.get_maps(stage=request.args.get('stage')))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@map_bp.route('/maps/<map_name>')
+def get_map(map_name):
+    """Get the teams or players ranked on a map"""
+    try:
+        result = map_service.get_map(
+            map_name,
+            entity=request.args.get('entity', 'teams'),
+            stage=request.args.get('stage'),
+            min_maps=request.args.get('min_maps', MAPS_MIN_PLAYED, type=int)
+        )
+        if result is None:
+            return jsonify({"error": f"Map '{map_name}' not found"}), 404
+        return jsonify(result)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@map_bp.route('/maps/team/<team_name>')
+def get_team_maps(team_name):
+    """Get a team's results per map"""
+    try:
+        result = map_service.get_team_maps(team_name, stage=request.args.get('stage'))
+        if result is None:
+            return jsonify({"error": f"Team '{team_name}' not found"}), 404
+        return jsonify(result)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@map_bp.route('/maps/player/<player_name>')
+def get_player_maps(player_name):
+    """Get a player's results per map"""
+    try:
+        result = map_service.get_player_maps(player_name, stage=request.args.get('stage'))
+        if result is None:
+            return jsonify({"error": f"Player '{player_name}' not found"}), 404
+        return jsonify(result)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
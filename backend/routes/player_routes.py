@@ -1,8 +1,12 @@
 from flask import Blueprint, jsonify, request
+from services.duel_service import DuelService
 from services.player_service import PlayerService
+from utils.instrumentation import get_logger
 
 player_bp = Blueprint('player', __name__)
 player_service = PlayerService()
+duel_service = DuelService()
+logger = get_logger(__name__)
 
 @player_bp.route('/player_timeseries/<player_name>')
 def get_player_timeseries(player_name):
@@ -15,6 +19,25 @@ def get_player_timeseries(player_name):
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@player_bp.route('/players/detailed')
+def get_players_detailed():
+    """Get all players with career metadata"""
+    try:
+        return jsonify(player_service.get_players_detailed())
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@player_bp.route('/player/<player_name>')
+def get_player_profile(player_name):
+    """Get comprehensive player profile"""
+    try:
+        profile = player_service.get_player_profile(player_name)
+        if not profile:
+            return jsonify({"error": f"Player '{player_name}' not found"}), 404
+        return jsonify(profile)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 @player_bp.route('/players_comparison')
 def get_players_comparison():
     """Compare multiple players"""
@@ -28,6 +51,22 @@ def get_players_comparison():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@player_bp.route('/h2h')
+def get_head_to_head():
+    """Career head-to-head between two players"""
+    try:
+        player = request.args.get('player')
+        enemy = request.args.get('enemy')
+        if not player or not enemy:
+            return jsonify({"error": "Both 'player' and 'enemy' are required"}), 400
+
+        h2h = duel_service.get_head_to_head(player, enemy)
+        if not h2h:
+            return jsonify({"error": f"No duels between '{player}' and '{enemy}'"}), 404
+        return jsonify(h2h)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 @player_bp.route('/player_details/<match_id>')
 def get_player_details(match_id):
     """Get player details for a specific match"""
@@ -41,12 +80,9 @@ def get_player_details(match_id):
 def get_players(match_id):
     """Get all players with map-segregated statistics"""
     try:
-        print("🌐 [ROUTE] /api/players endpoint called")
         players = player_service.get_all_players_with_map_stats(match_id)
-        print(f"🌐 [ROUTE] Returning {len(players)} players")
+        logger.debug("🌐 /api/players/%s returning %d players", match_id, len(players))
         return jsonify(players)
     except Exception as e:
-        print(f"❌ [ROUTE] Error in /api/players: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error in /api/players: %s", e)
         return jsonify({"error": str(e)}), 500
\ No newline at end of file
@@ -0,0 +1,22 @@
+from flask import Blueprint, jsonify, request
+from services.search_service import SearchService
+from config import SEARCH_RESULT_LIMIT
+
+search_bp = Blueprint('search', __name__)
+search_service = SearchService()
+
+@search_bp.route('/search')
+def search():
+    """Type-ahead search over player and team names"""
+    try:
+        query = request.args.get('q', '')
+        results = search_service.search(
+            query,
+            entity_type=request.args.get('type'),
+            limit=request.args.get('limit', SEARCH_RESULT_LIMIT, type=int)
+        )
+        return jsonify(results)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
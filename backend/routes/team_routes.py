@@ -1,8 +1,10 @@
 from flask import Blueprint, jsonify
 from services.data_service import DataService
+from services.team_service import TeamService
 
 team_bp = Blueprint('team', __name__)
 data_service = DataService()
+team_service = TeamService()
 
 @team_bp.route('/teams')
 def get_teams():
@@ -12,3 +14,22 @@ def get_teams():
         return jsonify(teams)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+
+@team_bp.route('/teams/detailed')
+def get_teams_detailed():
+    """Get all teams with record and rating metadata"""
+    try:
+        return jsonify(team_service.get_teams_detailed())
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@team_bp.route('/team/<team_name>')
+def get_team_profile(team_name):
+    """Get comprehensive team profile"""
+    try:
+        profile = team_service.get_team_profile(team_name)
+        if not profile:
+            return jsonify({"error": f"Team '{team_name}' not found"}), 404
+        return jsonify(profile)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
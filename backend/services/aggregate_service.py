@@ -0,0 +1,126 @@
+import time
+import pandas as pd
+from config import (
+    get_data,
+    get_data_version,
+    get_storage,
+    AGGREGATE_MAX_ROWS,
+    AGGREGATE_TIME_BUDGET_SECONDS,
+    AGGREGATE_CACHE_SIZE,
+    AGGREGATE_CHUNK_ROWS,
+)
+from utils.cache import LRUCache
+from utils.instrumentation import instrument, timer
+from utils.singleflight import single_flight
+from utils.query import DatasetNotFound, QueryTimeout, validate_columns
+from utils.storage import metric_label
+
+
+AGGREGATE_OPS = ("count", "sum", "mean", "min", "max", "wmean")
+DEFAULT_WEIGHT_COLUMN = "Rounds Played"
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised when an aggregation query exceeds its row or time budget"""
+
+
+class AggregateService:
+    def __init__(self):
+        self.cache = LRUCache("aggregate", maxsize=AGGREGATE_CACHE_SIZE)
+
+    def parse_metrics(self, raw_metrics):
+        """Parse `op:Column` specs (or a bare `count`) into (op, column) tuples"""
+        metrics = []
+        for raw in raw_metrics or ["count"]:
+            op, _, column = raw.partition(":")
+            op = op.strip().lower()
+            if op not in AGGREGATE_OPS:
+                raise ValueError(f"Unsupported metric '{op}', expected one of {list(AGGREGATE_OPS)}")
+            if op != "count" and not column:
+                raise ValueError(f"Metric '{op}' requires a column, e.g. '{op}:Kills'")
+            metrics.append((op, column or None))
+        return metrics
+
+    @instrument
+    @single_flight
+    def aggregate(self, name, group_by=None, metrics=None, filters=None, weight=None):
+        """Run a declarative group-by aggregation over a data_store dataset"""
+        df = get_data(name)
+        if df is None:
+            raise DatasetNotFound(name)
+
+        group_by = list(group_by or [])
+        metrics = self.parse_metrics(metrics)
+        filters = filters or {}
+        weight = weight or DEFAULT_WEIGHT_COLUMN
+
+        plan = (
+            name,
+            tuple(group_by),
+            tuple(metrics),
+            tuple(sorted((k, tuple(v)) for k, v in filters.items())),
+            weight,
+            get_data_version(),
+        )
+        cached = self.cache.get(plan)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+        result = self._run(df, name, group_by, metrics, filters, weight)
+        self.cache.set(plan, result)
+        return {**result, "cached": False}
+
+    def _run(self, df, name, group_by, metrics, filters, weight):
+        """Execute a query plan with vectorized groupby under the row and time budgets"""
+        started = time.perf_counter()
+
+        value_columns = [c for _, c in metrics if c]
+        if any(op == "wmean" for op, _ in metrics):
+            value_columns.append(weight)
+        validate_columns(df, group_by + value_columns)
+        for column in set(value_columns):
+            if not pd.api.types.is_numeric_dtype(df[column]):
+                raise ValueError(f"Column '{column}' is not numeric")
+
+        storage = get_storage()
+        validate_columns(df, filters.keys())
+        with timer("filter"):
+            input_rows = storage.count(name, filters)
+        if input_rows > AGGREGATE_MAX_ROWS:
+            raise QueryBudgetExceeded(
+                f"Query scans {input_rows} rows, budget is {AGGREGATE_MAX_ROWS}"
+            )
+
+        # The backend stops on its own once the deadline passes: SQLite through a
+        # progress handler, pandas between chunks of AGGREGATE_CHUNK_ROWS rows
+        deadline = started + AGGREGATE_TIME_BUDGET_SECONDS
+        with timer("aggregate"):
+            try:
+                result = storage.aggregate(name, group_by, metrics, filters, weight,
+                                           deadline=deadline, chunk_rows=AGGREGATE_CHUNK_ROWS)
+            except QueryTimeout:
+                raise QueryBudgetExceeded(
+                    f"Query exceeded time budget of {AGGREGATE_TIME_BUDGET_SECONDS}s"
+                )
+
+        self._check_time(started)
+        with timer("serialize"):
+            result = result.astype(object).where(result.notna(), None)
+            rows = result.to_dict(orient="records")
+
+        return {
+            "dataset": name,
+            "group_by": group_by,
+            "metrics": list(dict.fromkeys(metric_label(op, column) for op, column in metrics)),
+            "input_rows": int(input_rows),
+            "row_count": int(len(result)),
+            "rows": rows,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def _check_time(self, started):
+        elapsed = time.perf_counter() - started
+        if elapsed > AGGREGATE_TIME_BUDGET_SECONDS:
+            raise QueryBudgetExceeded(
+                f"Query exceeded time budget of {AGGREGATE_TIME_BUDGET_SECONDS}s"
+            )
@@ -1,8 +1,14 @@
 from config import get_data
 import numpy as np
+from utils.instrumentation import instrument
+from utils.singleflight import single_flight
+from utils.result_store import persistent
 
 
 class AnalyticsService:
+    @instrument
+    @single_flight
+    @persistent
     def perform_player_clustering(self, player_names):
         """Cluster players using simple statistical features derived from rounds data."""
         if not player_names or len(player_names) < 2:
@@ -70,6 +76,8 @@ class AnalyticsService:
             }
         return result
 
+    @instrument
+    @single_flight
     def predict_match_outcomes(self, match_id):
         """Placeholder prediction endpoint. Wire to a model if available."""
         # If you have a model (e.g., joblib), load and predict here.
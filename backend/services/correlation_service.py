@@ -0,0 +1,207 @@
+import numpy as np
+from config import get_data, get_data_version, get_derived, register_derived
+from utils.cache import LRUCache
+from utils.instrumentation import instrument, timer
+from utils.singleflight import single_flight
+
+
+CORRELATION_COLUMNS = {
+    "players_stats": [
+        "Rating",
+        "Average Combat Score",
+        "Kills:Deaths",
+        "Kill, Assist, Trade, Survive %",
+        "Average Damage Per Round",
+        "Kills Per Round",
+        "Assists Per Round",
+        "First Kills Per Round",
+        "First Deaths Per Round",
+        "Headshot %",
+        "Clutch Success %",
+    ],
+    "maps_scores": [
+        "Team A Score",
+        "Team A Attacker Score",
+        "Team A Defender Score",
+        "Team B Score",
+        "Team B Attacker Score",
+        "Team B Defender Score",
+    ],
+}
+CORRELATION_METHODS = ("pearson", "spearman")
+MISSING_MODES = ("pairwise", "complete")
+
+
+def build_correlation_matrices():
+    """Stack the (schema-coerced) correlation columns of each dataset into a float matrix once per load"""
+    matrices = {}
+    for name, columns in CORRELATION_COLUMNS.items():
+        df = get_data(name)
+        if df is None:
+            continue
+        columns = [c for c in columns if c in df.columns]
+        values = np.column_stack([df[c].to_numpy(dtype=np.float64, na_value=np.nan) for c in columns]) if columns else np.empty((len(df), 0))
+
+        agent_rows = {}
+        if "Agents" in df.columns:
+            for row, agents in enumerate(df["Agents"].fillna("").astype(str)):
+                for agent in agents.split(","):
+                    agent = agent.strip().lower()
+                    if agent:
+                        agent_rows.setdefault(agent, []).append(row)
+
+        matrices[name] = {
+            "columns": columns,
+            "values": values,
+            "tournament": df["Tournament"].to_numpy() if "Tournament" in df.columns else None,
+            "stage": df["Stage"].to_numpy() if "Stage" in df.columns else None,
+            "agent_rows": {a: np.asarray(rows, dtype=np.int64) for a, rows in agent_rows.items()},
+        }
+    return matrices
+
+
+register_derived("correlation_matrices", build_correlation_matrices)
+
+
+def sorted_ranks(ordered):
+    """Average ranks of an ascending NaN-free vector (ties share their mean rank)"""
+    starts = np.ones(len(ordered), dtype=bool)
+    starts[1:] = ordered[1:] != ordered[:-1]
+    group = np.cumsum(starts) - 1
+    counts = np.bincount(group)
+    average = np.cumsum(counts) - (counts - 1) / 2.0
+    return average[group]
+
+
+def ranks_over(column, order, rows):
+    """Average ranks of column over the selected rows (given its argsort), in row order"""
+    order = order[rows[order]]
+    ranks = np.empty(len(column))
+    ranks[order] = sorted_ranks(column[order])
+    return ranks[rows]
+
+
+def pairwise_correlation(values, min_periods=3):
+    """Pearson correlation over pairwise-complete observations.
+
+    Every sum is restricted to the rows where both columns are present, so the
+    whole matrix comes from a handful of matrix products instead of a loop over
+    column pairs. Returns (correlation matrix, observation counts).
+    """
+    present = ~np.isnan(values)
+    x = np.where(present, values, 0.0)
+    m = present.astype(np.float64)
+
+    n = m.T @ m
+    sum_x = x.T @ m            # sum of column i over rows where j is present
+    sum_xx = (x * x).T @ m
+    sum_xy = x.T @ x
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = n * sum_xy - sum_x * sum_x.T
+        var_x = n * sum_xx - sum_x ** 2
+        var_y = var_x.T
+        corr = cov / np.sqrt(var_x * var_y)
+
+    corr[n < min_periods] = np.nan
+    corr = np.clip(corr, -1.0, 1.0)
+    return corr, n.astype(np.int64)
+
+
+def spearman_correlation(values, min_periods=3):
+    """Spearman correlation over pairwise-complete observations.
+
+    Ranks depend on which rows take part, so a pair involving a column with
+    missing values is re-ranked over the rows both columns share (as pandas
+    does). Pairs of columns missing the same rows, complete ones included,
+    come from one Pearson pass over the column ranks. Returns (correlation
+    matrix, observation counts).
+    """
+    # Contiguous columns sorted once; every ranking filters that sort order
+    columns = np.ascontiguousarray(values.T)
+    orders = [np.argsort(column) for column in columns]
+    present = ~np.isnan(values)
+
+    ranks = np.full(values.shape, np.nan)
+    for k, column in enumerate(columns):
+        ranks[present[:, k], k] = ranks_over(column, orders[k], present[:, k])
+    corr, n_obs = pairwise_correlation(ranks, min_periods=min_periods)
+
+    incomplete = np.flatnonzero(~present.all(axis=0))
+    for i in incomplete:
+        for j in range(values.shape[1]):
+            if (j in incomplete and j < i) or np.array_equal(present[:, i], present[:, j]):
+                continue  # already done as (j, i), or the column ranks are exact
+            shared = present[:, i] & present[:, j]
+            if shared.sum() < min_periods:
+                corr[i, j] = corr[j, i] = np.nan
+                continue
+            x, y = (ranks_over(columns[k], orders[k], shared) for k in (i, j))
+            x -= x.mean()
+            y -= y.mean()
+            with np.errstate(divide="ignore", invalid="ignore"):
+                corr[i, j] = corr[j, i] = np.clip(x @ y / np.sqrt((x @ x) * (y @ y)), -1.0, 1.0)
+    return corr, n_obs
+
+
+class CorrelationService:
+    def __init__(self):
+        self.cache = LRUCache("correlations", maxsize=128)
+
+    @instrument
+    @single_flight
+    def get_correlations(self, dataset="players_stats", method="pearson", missing="pairwise",
+                         tournament=None, stage=None, agent=None, min_periods=3):
+        """Get a (cached) correlation matrix for a slice of a dataset"""
+        if method not in CORRELATION_METHODS:
+            raise ValueError(f"Unsupported method '{method}', expected one of {list(CORRELATION_METHODS)}")
+        if missing not in MISSING_MODES:
+            raise ValueError(f"Unsupported missing mode '{missing}', expected one of {list(MISSING_MODES)}")
+
+        matrices = get_derived("correlation_matrices") or {}
+        if dataset not in matrices:
+            raise ValueError(f"Correlations are available for {list(matrices)}")
+
+        key = (dataset, method, missing, tournament, stage, agent and agent.lower(), min_periods, get_data_version())
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._compute(matrices[dataset], dataset, method, missing, tournament, stage, agent, min_periods)
+        self.cache.set(key, result)
+        return result
+
+    def _compute(self, source, dataset, method, missing, tournament, stage, agent, min_periods):
+        """Slice the precomputed matrix and correlate its columns"""
+        values = source["values"]
+        mask = np.ones(len(values), dtype=bool)
+        if tournament and source["tournament"] is not None:
+            mask &= source["tournament"] == tournament
+        if stage and source["stage"] is not None:
+            mask &= source["stage"] == stage
+        if agent:
+            agent_mask = np.zeros(len(values), dtype=bool)
+            agent_mask[source["agent_rows"].get(agent.lower(), [])] = True
+            mask &= agent_mask
+
+        with timer("filter"):
+            values = values[mask]
+            if missing == "complete":
+                values = values[~np.isnan(values).any(axis=1)]
+        with timer("aggregate"):
+            if method == "spearman":
+                corr, n_obs = spearman_correlation(values, min_periods=min_periods)
+            else:
+                corr, n_obs = pairwise_correlation(values, min_periods=min_periods)
+            corr = np.round(corr, 4)
+
+        return {
+            "dataset": dataset,
+            "method": method,
+            "missing": missing,
+            "filters": {"tournament": tournament, "stage": stage, "agent": agent},
+            "rows": int(len(values)),
+            "columns": source["columns"],
+            "matrix": [[None if np.isnan(v) else float(v) for v in row] for row in corr],
+            "observations": n_obs.tolist(),
+        }
@@ -1,10 +1,15 @@
-from config import get_data
+from config import get_data, get_derived, register_derived
+
+def build_team_list():
+    """Serialize team_mapping once per load instead of on every request"""
+    return get_data('team_mapping').to_dict(orient="records")
+
+register_derived('team_list', build_team_list)
 
 class DataService:
     def get_teams(self):
         """Get all teams"""
-        team_mapping_df = get_data('team_mapping')
-        return team_mapping_df.to_dict(orient="records")
+        return get_derived('team_list')
     
     def get_scores(self):
         """Get scores data"""
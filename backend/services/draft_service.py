@@ -0,0 +1,181 @@
+from collections import Counter
+from config import get_data, get_derived, get_storage, register_derived
+from utils.helpers import construct_match_names, safe_divide
+from utils.instrumentation import instrument
+from services.team_aliases import resolve_team
+
+
+MATCH_KEY_COLUMNS = ['Tournament', 'Stage', 'Match Type', 'Match Name']
+
+
+def _rate(count, total):
+    return round(float(safe_divide(count, total)), 3)
+
+
+def _map_winners(maps_scores_df):
+    """(match key) -> {map: winning team} in play order"""
+    winners = {}
+    if maps_scores_df is None or maps_scores_df.empty:
+        return winners
+    columns = MATCH_KEY_COLUMNS + ['Map', 'Team A', 'Team A Score', 'Team B', 'Team B Score']
+    for *key, map_name, team_a, score_a, team_b, score_b in maps_scores_df[columns].itertuples(index=False, name=None):
+        if score_a == score_b:
+            winner = None
+        else:
+            winner = team_a if score_a > score_b else team_b
+        winners.setdefault(tuple(key), {})[map_name] = winner
+    return winners
+
+
+def _decider(picked, banned, played, pool):
+    """Map left after the veto: the unpicked map that was played, else the one pool map not vetoed"""
+    for map_name in played:
+        if map_name not in picked:
+            return map_name
+    remaining = pool - picked - banned
+    return next(iter(remaining)) if len(remaining) == 1 else None
+
+
+def build_draft_index():
+    """Index pick/ban sequences per match and precompute per-team veto rates"""
+    draft_df = get_data('draft_phase')
+    winners = _map_winners(get_data('maps_scores'))
+    if draft_df is None or draft_df.empty:
+        return {'matches': {}, 'teams': {}}
+
+    records = draft_df.to_dict('records')
+    # Map pool per tournament: every map vetoed or played in it
+    pools = {}
+    for row in records:
+        pools.setdefault(row['Tournament'], set()).add(row['Map'])
+    for key, maps in winners.items():
+        pools.setdefault(key[0], set()).update(maps)
+
+    matches = {}
+    for key, rows in draft_df.groupby(MATCH_KEY_COLUMNS, sort=False).indices.items():
+        rows = [records[i] for i in sorted(rows)]
+        map_winners = winners.get(key, {})
+        picked = {row['Map'] for row in rows if row['Action'] == 'pick'}
+        banned = {row['Map'] for row in rows if row['Action'] == 'ban'}
+        decider = _decider(picked, banned, list(map_winners), pools.get(key[0], set()))
+
+        sequence = []
+        for order, row in enumerate(rows, start=1):
+            step = {'order': order, 'team': row['Team'], 'action': row['Action'], 'map': row['Map']}
+            if row['Action'] == 'pick':
+                step['played'] = row['Map'] in map_winners
+                step['winner'] = map_winners.get(row['Map'])
+            sequence.append(step)
+
+        matches[key] = {
+            'tournament': key[0],
+            'stage': key[1],
+            'match_type': key[2],
+            'match_name': key[3],
+            'teams': list(dict.fromkeys(row['Team'] for row in rows)),
+            'sequence': sequence,
+            'decider': {
+                'map': decider,
+                'played': decider in map_winners,
+                'winner': map_winners.get(decider),
+            } if decider else None,
+            'rows': rows,
+        }
+
+    teams = {}
+    for draft in matches.values():
+        decider = draft['decider']['map'] if draft['decider'] else None
+        for team in draft['teams']:
+            stats = teams.setdefault(team, {'matches': 0, 'picks': Counter(), 'bans': Counter(),
+                                            'deciders': Counter(), 'picks_played': Counter(), 'picks_won': Counter()})
+            stats['matches'] += 1
+            if decider:
+                stats['deciders'][decider] += 1
+        for step in draft['sequence']:
+            stats = teams[step['team']]
+            if step['action'] == 'pick':
+                stats['picks'][step['map']] += 1
+                if step['played']:
+                    stats['picks_played'][step['map']] += 1
+                    stats['picks_won'][step['map']] += step['winner'] == step['team']
+            elif step['action'] == 'ban':
+                stats['bans'][step['map']] += 1
+
+    return {'matches': matches, 'teams': {team: _team_draft(team, stats) for team, stats in sorted(teams.items())}}
+
+
+def _team_draft(team, stats):
+    """Serialize one team's veto counters into pick/ban/decider rates and pick-to-win"""
+    matches = stats['matches']
+    maps = {}
+    for map_name in sorted(set(stats['picks']) | set(stats['bans']) | set(stats['deciders'])):
+        picks_played = stats['picks_played'][map_name]
+        picks_won = stats['picks_won'][map_name]
+        maps[map_name] = {
+            'picks': stats['picks'][map_name],
+            'bans': stats['bans'][map_name],
+            'deciders': stats['deciders'][map_name],
+            'pick_rate': _rate(stats['picks'][map_name], matches),
+            'ban_rate': _rate(stats['bans'][map_name], matches),
+            'decider_rate': _rate(stats['deciders'][map_name], matches),
+            'picks_played': picks_played,
+            'picks_won': picks_won,
+            'pick_win_rate': _rate(picks_won, picks_played),
+        }
+    picks_played = sum(stats['picks_played'].values())
+    picks_won = sum(stats['picks_won'].values())
+    return {
+        'team': team,
+        'matches': matches,
+        'picks': sum(stats['picks'].values()),
+        'bans': sum(stats['bans'].values()),
+        'picks_played': picks_played,
+        'picks_won': picks_won,
+        'pick_win_rate': _rate(picks_won, picks_played),
+        'most_picked': stats['picks'].most_common(1)[0][0] if stats['picks'] else None,
+        'most_banned': stats['bans'].most_common(1)[0][0] if stats['bans'] else None,
+        'maps': maps,
+    }
+
+
+register_derived('draft_index', build_draft_index)
+
+
+class DraftService:
+    def _find_match(self, tournament, stage, match_type, team_a, team_b):
+        matches = get_derived('draft_index')['matches']
+        for match_name in construct_match_names(team_a, team_b):
+            draft = matches.get((tournament, stage, match_type, match_name))
+            if draft is not None:
+                return draft
+        return None
+
+    def get_draft_rows(self, tournament, stage, match_type, team_a, team_b):
+        """Raw draft_phase rows of a match in veto order (empty if not recorded)"""
+        draft = self._find_match(tournament, stage, match_type, team_a, team_b)
+        return draft['rows'] if draft else []
+
+    @instrument
+    def get_teams_draft(self):
+        """Get pick/ban summary for every team"""
+        teams = get_derived('draft_index')['teams']
+        return [{key: value for key, value in team.items() if key != 'maps'} for team in teams.values()]
+
+    def get_team_draft(self, team_name):
+        """Get per-map pick, ban and decider rates and pick-to-win for a team"""
+        teams = get_derived('draft_index')['teams']
+        team = resolve_team(team_name) or team_name
+        return teams.get(team)
+
+    @instrument
+    def get_match_draft(self, match_id):
+        """Get the veto sequence of a match with the decider and who won each pick"""
+        match_row = get_storage().select('scores', {'match_id': [match_id]})
+        if match_row.empty:
+            return None
+        match = match_row.iloc[0]
+        draft = self._find_match(match['Tournament'], match['Stage'], match['Match Type'],
+                                 match['Team A'], match['Team B'])
+        if draft is None:
+            return None
+        return {'match_id': match_id, **{key: value for key, value in draft.items() if key != 'rows'}}
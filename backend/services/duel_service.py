@@ -0,0 +1,246 @@
+import numpy as np
+import pandas as pd
+from config import get_data, get_derived, register_derived
+from utils.encoding import encode, encode_keys, vocabulary
+from utils.instrumentation import instrument
+
+
+MATCH_KEY_COLUMNS = ['Tournament', 'Stage', 'Match Type', 'Match Name']
+# Per-match rollup rows of the kills table
+ALL_MAPS = 'All Maps'
+
+
+def _sorted_groups(groups):
+    return sorted(groups.items(), key=lambda item: item[0])
+
+
+class DuelTensor:
+    """The kills table as a sparse player x enemy x map x kill type tensor.
+
+    Rows stay grouped by match key (in file order within a match) for the
+    per-match views. The head-to-head entries sum every match into one row per
+    (player, enemy, map, kill type), stored from both players' side.
+    """
+
+    def __init__(self, kills_df):
+        df = kills_df if kills_df is not None else pd.DataFrame(
+            columns=MATCH_KEY_COLUMNS + ['Map', 'Player Team', 'Player', 'Enemy Team', 'Enemy',
+                                         'Player Kills', 'Enemy Kills', 'Difference', 'Kill Type']
+        )
+        self.players = vocabulary(df['Player'], df['Enemy'])
+        self.teams = vocabulary(df['Player Team'], df['Enemy Team'])
+        self.maps = vocabulary(df['Map'])
+        self.kill_types = vocabulary(df['Kill Type'])
+        self.matches, match = encode_keys(df, MATCH_KEY_COLUMNS)
+        self.match_codes = {key: code for code, key in enumerate(self.matches)}
+        self.player_codes = {name: code for code, name in enumerate(self.players[:-1])}
+        self.player_aliases = {}
+        for name in self.players[:-1]:
+            self.player_aliases.setdefault(name.lower(), name)
+
+        order = np.argsort(match, kind='stable')
+        self.match = match[order]
+        self.player = encode(df['Player'], self.players)[order]
+        self.enemy = encode(df['Enemy'], self.players)[order]
+        self.player_team = encode(df['Player Team'], self.teams)[order]
+        self.enemy_team = encode(df['Enemy Team'], self.teams)[order]
+        self.map = encode(df['Map'], self.maps)[order]
+        self.kill_type = encode(df['Kill Type'], self.kill_types)[order]
+        self.player_kills = df['Player Kills'].fillna(0).to_numpy(dtype=np.int32)[order]
+        self.enemy_kills = df['Enemy Kills'].fillna(0).to_numpy(dtype=np.int32)[order]
+        self.difference = df['Difference'].fillna(0).to_numpy(dtype=np.int32)[order]
+        # Match m spans rows match_offsets[m]:match_offsets[m + 1]
+        self.match_offsets = np.searchsorted(self.match, np.arange(len(self.matches) + 1))
+
+        self._build_head_to_head()
+
+    def _build_head_to_head(self):
+        valid = (self.player >= 0) & (self.enemy >= 0) & (self.map >= 0) & (self.kill_type >= 0)
+        low = np.minimum(self.player, self.enemy)[valid]
+        high = np.maximum(self.player, self.enemy)[valid]
+        swapped = (self.player > self.enemy)[valid]
+        low_kills = np.where(swapped, self.enemy_kills[valid], self.player_kills[valid])
+        high_kills = np.where(swapped, self.player_kills[valid], self.enemy_kills[valid])
+        match, maps, kill_types = self.match[valid], self.map[valid], self.kill_type[valid]
+
+        # A duel may be listed from both players' side; count each (match, pair, map, kill type) once
+        _, first = np.unique(np.stack([match, low, high, maps, kill_types]), axis=1, return_index=True)
+        low, high, low_kills, high_kills = low[first], high[first], low_kills[first], high_kills[first]
+        match, maps, kill_types = match[first], maps[first], kill_types[first]
+
+        distinct = low != high
+        player = np.concatenate([low, high[distinct]])
+        enemy = np.concatenate([high, low[distinct]])
+        kills = np.concatenate([low_kills, high_kills[distinct]])
+        deaths = np.concatenate([high_kills, low_kills[distinct]])
+        match = np.concatenate([match, match[distinct]])
+        maps = np.concatenate([maps, maps[distinct]])
+        kill_types = np.concatenate([kill_types, kill_types[distinct]])
+
+        cells, cell = np.unique(np.stack([player, enemy, maps, kill_types]), axis=1, return_inverse=True)
+        cell = cell.ravel()
+        self.h2h_player, self.h2h_enemy, self.h2h_map, self.h2h_kill_type = cells
+        self.h2h_kills = np.bincount(cell, weights=kills, minlength=cells.shape[1]).astype(np.int32)
+        self.h2h_deaths = np.bincount(cell, weights=deaths, minlength=cells.shape[1]).astype(np.int32)
+
+        # (player, enemy) -> (first cell, last cell + 1, matches played against each other)
+        pairs, pair_starts = np.unique(cells[:2], axis=1, return_index=True)
+        pair_stops = np.append(pair_starts[1:], cells.shape[1])
+        met = np.unique(np.stack([player, enemy, match]), axis=1)
+        _, met_counts = np.unique(met[:2], axis=1, return_counts=True)
+        self.h2h_pairs = {
+            (int(p), int(e)): (int(start), int(stop), int(count))
+            for p, e, start, stop, count in zip(pairs[0], pairs[1], pair_starts, pair_stops, met_counts)
+        }
+
+    def resolve_player(self, name):
+        """Exact player name, or the case-insensitive match, or None"""
+        name = (name or '').strip()
+        return name if name in self.player_codes else self.player_aliases.get(name.lower())
+
+    def find_match(self, tournament, stage, match_type, match_names):
+        """Code of the first of match_names recorded for the match, or None"""
+        for match_name in match_names:
+            code = self.match_codes.get((tournament, stage, match_type, match_name))
+            if code is not None:
+                return code
+        return None
+
+    def match_rows(self, match_code):
+        """Decoded rows of one match, in file order"""
+        rows = slice(self.match_offsets[match_code], self.match_offsets[match_code + 1])
+        return list(zip(
+            self.players[self.player[rows]].tolist(),
+            self.players[self.enemy[rows]].tolist(),
+            self.teams[self.player_team[rows]].tolist(),
+            self.teams[self.enemy_team[rows]].tolist(),
+            self.maps[self.map[rows]].tolist(),
+            self.kill_types[self.kill_type[rows]].tolist(),
+            self.player_kills[rows].tolist(),
+            self.enemy_kills[rows].tolist(),
+            self.difference[rows].tolist(),
+        ))
+
+    def head_to_head(self, player, enemy):
+        """Summed duel cells of player against enemy, or None if they never met"""
+        entry = self.h2h_pairs.get((self.player_codes[player], self.player_codes[enemy]))
+        if entry is None:
+            return None
+        start, stop, matches = entry
+        cells = slice(start, stop)
+        return matches, zip(
+            self.maps[self.h2h_map[cells]].tolist(),
+            self.kill_types[self.h2h_kill_type[cells]].tolist(),
+            self.h2h_kills[cells].tolist(),
+            self.h2h_deaths[cells].tolist(),
+        )
+
+
+def build_duel_tensor():
+    """Encode the kills table into a DuelTensor"""
+    return DuelTensor(get_data('kills'))
+
+
+register_derived('duels', build_duel_tensor)
+
+
+class DuelService:
+    def get_match_duels(self, tournament, stage, match_type, match_names):
+        """Player, enemy and per-map duel stats of a match from the duel tensor"""
+        duels = get_derived('duels')
+        match_code = duels.find_match(tournament, stage, match_type, match_names)
+        if match_code is None:
+            return [], [], []
+        rows = duels.match_rows(match_code)
+        return self._player_stats(rows), self._enemy_stats(rows), self._duels(rows)
+
+    @instrument
+    def get_head_to_head(self, player_name, enemy_name):
+        """Career head-to-head of two players, overall and per map, by kill type"""
+        duels = get_derived('duels')
+        player = duels.resolve_player(player_name)
+        enemy = duels.resolve_player(enemy_name)
+        if player is None or enemy is None:
+            return None
+        result = duels.head_to_head(player, enemy)
+        if result is None:
+            return None
+        matches, cells = result
+
+        overall = {}
+        maps = {}
+        for map_name, kill_type, kills, deaths in cells:
+            entry = {"player_kills": kills, "enemy_kills": deaths, "difference": kills - deaths}
+            if map_name == ALL_MAPS:
+                overall[kill_type] = entry
+            else:
+                maps.setdefault(map_name, {})[kill_type] = entry
+        return {
+            "player": player,
+            "enemy": enemy,
+            "matches": matches,
+            "overall": overall,
+            "maps": maps,
+        }
+
+    @staticmethod
+    def _overall_rows(rows):
+        # 'All Maps' rows already sum the maps; fall back to the per-map rows when absent
+        overall = [row for row in rows if row[4] == ALL_MAPS]
+        return overall or rows
+
+    def _player_stats(self, rows):
+        groups = {}
+        for player, enemy, player_team, enemy_team, _, _, kills, deaths, difference in self._overall_rows(rows):
+            if player is None or player_team is None or enemy_team is None:
+                continue
+            group = groups.setdefault((player_team, player, enemy_team), [0, 0, 0, []])
+            group[0] += kills
+            group[1] += deaths
+            group[2] += difference
+            group[3].append(enemy)
+        return [
+            {
+                'Player Team': player_team, 'Player': player, 'Enemy Team': enemy_team,
+                'Player Kills': kills, 'Enemy Kills': deaths, 'Difference': difference, 'Enemy': enemies,
+            }
+            for (player_team, player, enemy_team), (kills, deaths, difference, enemies) in _sorted_groups(groups)
+        ]
+
+    def _enemy_stats(self, rows):
+        groups = {}
+        for player, enemy, player_team, enemy_team, _, _, kills, deaths, difference in self._overall_rows(rows):
+            if enemy is None or enemy_team is None or player_team is None:
+                continue
+            group = groups.setdefault((enemy_team, enemy, player_team), [0, 0, 0, []])
+            group[0] += kills
+            group[1] += deaths
+            group[2] += difference
+            group[3].append(player)
+        # Seen from the enemy's side; the kill columns keep the original player's perspective
+        return [
+            {
+                'Player Team': enemy_team, 'Player': enemy, 'Enemy Team': player_team,
+                'Player Kills': kills, 'Enemy Kills': deaths, 'Difference': difference, 'Enemy': players,
+            }
+            for (enemy_team, enemy, player_team), (kills, deaths, difference, players) in _sorted_groups(groups)
+        ]
+
+    def _duels(self, rows):
+        groups = {}
+        for player, enemy, player_team, enemy_team, map_name, kill_type, kills, deaths, difference in rows:
+            if player is None or enemy is None or map_name is None or kill_type is None:
+                continue
+            group = groups.setdefault((player, enemy, map_name, kill_type), [kills, deaths, difference, None, None])
+            group[3] = group[3] if group[3] is not None else player_team
+            group[4] = group[4] if group[4] is not None else enemy_team
+        return [
+            {
+                'Player': player, 'Enemy': enemy, 'Map': map_name, 'Kill Type': kill_type,
+                'Player Kills': kills, 'Enemy Kills': deaths, 'Difference': difference,
+                'Player Team': player_team if player_team is not None else 0,
+                'Enemy Team': enemy_team if enemy_team is not None else 0,
+            }
+            for (player, enemy, map_name, kill_type), (kills, deaths, difference, player_team, enemy_team)
+            in _sorted_groups(groups)
+        ]
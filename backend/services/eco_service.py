@@ -0,0 +1,204 @@
+import numpy as np
+import pandas as pd
+from config import get_data, get_derived, get_storage, register_derived
+from services.team_aliases import resolve_team
+from utils.helpers import construct_match_names, safe_divide
+from utils.instrumentation import instrument
+
+
+# eco_rounds Type -> buy type key
+ECO_ROUND_TYPES = {
+    'Eco: 0-5k': 'eco',
+    'Semi-eco: 5-10k': 'semi_eco',
+    'Semi-buy: 10-20k': 'semi_buy',
+    'Full buy: 20k+': 'full_buy',
+}
+# eco_stats Type -> buy type key. Pistol rows carry no "Initiated" count, every
+# map has two pistol rounds.
+ECO_STAT_TYPES = {
+    'Pistol Won': 'pistol',
+    'Eco (won)': 'eco',
+    '$ (won)': 'semi_eco',
+    '$$ (won)': 'semi_buy',
+    '$$$ (won)': 'full_buy',
+}
+BUY_TYPE_LABELS = {
+    'pistol': 'Pistol',
+    'eco': 'Eco: 0-5k',
+    'semi_eco': 'Semi-eco: 5-10k',
+    'semi_buy': 'Semi-buy: 10-20k',
+    'full_buy': 'Full buy: 20k+',
+}
+# First round of each regulation half
+PISTOL_ROUNDS = (1, 13)
+MATCH_KEY_COLUMNS = ['Tournament', 'Stage', 'Match Type', 'Match Name']
+CONVERSION_KEYS = MATCH_KEY_COLUMNS + ['Team', 'Map', 'buy_type']
+
+
+def _conversion(initiated, won):
+    return {
+        'initiated': int(initiated),
+        'won': int(won),
+        'conversion_rate': round(float(safe_divide(won, initiated)), 3),
+    }
+
+
+def _credits(value):
+    return int(value) if pd.notna(value) else None
+
+
+def _round_buy_types(eco_rounds_df):
+    """Buy type key per eco_rounds row, pistol rounds are split out of the eco bucket"""
+    buy_types = eco_rounds_df['Type'].map(ECO_ROUND_TYPES)
+    pistol = eco_rounds_df['Round Number'].isin(PISTOL_ROUNDS)
+    return buy_types.where(~pistol, 'pistol')
+
+
+def _conversions_from_rounds(eco_rounds_df):
+    """(match, team, map, buy type) -> (initiated, won) from round-level loadouts"""
+    if eco_rounds_df is None or eco_rounds_df.empty:
+        return pd.DataFrame(columns=CONVERSION_KEYS + ['initiated', 'won'])
+    frame = eco_rounds_df[MATCH_KEY_COLUMNS + ['Team', 'Map']].assign(
+        buy_type=_round_buy_types(eco_rounds_df),
+        won=eco_rounds_df['Outcome'] == 'Win',
+    ).dropna(subset=['buy_type'])
+    return frame.groupby(CONVERSION_KEYS).agg(
+        initiated=('won', 'size'), won=('won', 'sum')
+    ).reset_index()
+
+
+def _conversions_from_stats(eco_stats_df):
+    """(match, team, map, buy type) -> (initiated, won) from per-map eco_stats summaries"""
+    if eco_stats_df is None or eco_stats_df.empty:
+        return pd.DataFrame(columns=CONVERSION_KEYS + ['initiated', 'won'])
+    # 'All Maps' rows are rollups of the per-map rows
+    eco = eco_stats_df[eco_stats_df['Type'].isin(ECO_STAT_TYPES) & (eco_stats_df['Map'] != 'All Maps')]
+    buy_types = eco['Type'].map(ECO_STAT_TYPES)
+    frame = eco[MATCH_KEY_COLUMNS + ['Team', 'Map']].assign(
+        buy_type=buy_types,
+        initiated=eco['Initiated'].where(buy_types != 'pistol', len(PISTOL_ROUNDS)).fillna(0),
+        won=eco['Won'],
+    )
+    return frame.groupby(CONVERSION_KEYS).sum().reset_index()
+
+
+def _buy_types(rows):
+    """Serialize conversion rows of one group into {buy type: conversion}"""
+    totals = rows.groupby('buy_type')[['initiated', 'won']].sum()
+    return {
+        buy_type: {'type': BUY_TYPE_LABELS[buy_type], **_conversion(row['initiated'], row['won'])}
+        for buy_type, row in totals.iterrows()
+    }
+
+
+def build_eco_index():
+    """Precompute buy-type conversion rates and a round-level loadout index"""
+    eco_rounds_df = get_data('eco_rounds')
+    eco_stats_df = get_data('eco_stats')
+
+    # Round-level data is the most precise source; eco_stats fills in the
+    # (match, team, map) combinations that have no round-level rows
+    from_rounds = _conversions_from_rounds(eco_rounds_df).assign(source='eco_rounds')
+    from_stats = _conversions_from_stats(eco_stats_df).assign(source='eco_stats')
+    map_keys = MATCH_KEY_COLUMNS + ['Team', 'Map']
+    if not from_rounds.empty:
+        covered = from_rounds[map_keys].drop_duplicates().assign(_covered=True)
+        from_stats = from_stats.merge(covered, on=map_keys, how='left')
+        from_stats = from_stats[from_stats['_covered'].isna()].drop(columns='_covered')
+    conversions = pd.concat([f for f in (from_rounds, from_stats) if not f.empty] or [from_stats], ignore_index=True)
+
+    teams = {}
+    for team, team_rows in conversions.groupby('Team'):
+        teams[team] = {
+            'team': team,
+            'buy_types': _buy_types(team_rows),
+            'maps': {map_name: _buy_types(map_rows) for map_name, map_rows in team_rows.groupby('Map')},
+        }
+
+    match_conversions = {}
+    for key, rows in conversions.groupby(MATCH_KEY_COLUMNS + ['Team', 'Map']):
+        match_conversions.setdefault(key[:4], {}).setdefault(key[4], {})[key[5]] = {
+            'source': rows['source'].iloc[0],
+            'buy_types': _buy_types(rows),
+        }
+
+    rounds = {}
+    if eco_rounds_df is not None and not eco_rounds_df.empty:
+        buy_types = _round_buy_types(eco_rounds_df).to_numpy()
+        records = eco_rounds_df[['Team', 'Loadout Value', 'Remaining Credits', 'Type', 'Outcome']].to_numpy()
+        positions = eco_rounds_df.groupby(MATCH_KEY_COLUMNS + ['Map', 'Round Number'], sort=False).indices
+        for key, rows in positions.items():
+            key = key[:5] + (int(key[5]),)
+            rounds[key] = [
+                {
+                    'team': records[i][0],
+                    'loadout_value': _credits(records[i][1]),
+                    'remaining_credits': _credits(records[i][2]),
+                    'type': records[i][3],
+                    'buy_type': buy_types[i],
+                    'outcome': records[i][4],
+                }
+                for i in np.sort(rows)
+            ]
+
+    # (match key) -> sorted (map, round) keys so match lookups skip the scan as well
+    matches = {}
+    for key in rounds:
+        matches.setdefault(key[:4], []).append(key[4:])
+    for key in matches:
+        matches[key].sort()
+
+    return {'teams': teams, 'match_conversions': match_conversions, 'rounds': rounds, 'matches': matches}
+
+
+register_derived('eco_index', build_eco_index)
+
+
+class EcoService:
+    @instrument
+    def get_teams_conversion(self):
+        """Get overall buy-type conversion for every team"""
+        teams = get_derived('eco_index')['teams']
+        return [{'team': t['team'], 'buy_types': t['buy_types']} for t in teams.values()]
+
+    def get_team_conversion(self, team):
+        """Get buy-type conversion for a team (full name or abbreviation), overall and per map"""
+        return get_derived('eco_index')['teams'].get(resolve_team(team) or team)
+
+    def get_round_economy(self, tournament, stage, match_type, team_a, team_b, map_name, round_number):
+        """Get both teams' loadouts for a round, or an empty list when not recorded"""
+        rounds = get_derived('eco_index')['rounds']
+        for match_name in construct_match_names(team_a, team_b):
+            entries = rounds.get((tournament, stage, match_type, match_name, map_name, int(round_number)))
+            if entries is not None:
+                return entries
+        return []
+
+    @instrument
+    def get_match_economy(self, match_id):
+        """Get round-by-round loadouts and per-map conversion for a match"""
+        match_row = get_storage().select('scores', {'match_id': [match_id]})
+        if match_row.empty:
+            return None
+        match = match_row.iloc[0]
+        eco_index = get_derived('eco_index')
+
+        rounds = []
+        conversion = {}
+        for match_name in construct_match_names(match['Team A'], match['Team B']):
+            key = (match['Tournament'], match['Stage'], match['Match Type'], match_name)
+            for map_name, round_number in eco_index['matches'].get(key, []):
+                rounds.append({
+                    'map': map_name,
+                    'round_number': round_number,
+                    'teams': eco_index['rounds'][key + (map_name, round_number)],
+                })
+            conversion.update(eco_index['match_conversions'].get(key, {}))
+
+        return {
+            'match_id': match_id,
+            'team_a': match['Team A'],
+            'team_b': match['Team B'],
+            'rounds': rounds,
+            'conversion': conversion,
+        }
@@ -0,0 +1,61 @@
+from config import get_data, get_storage, data_store, EXPORT_CHUNK_ROWS
+from utils.query import DatasetNotFound, coerce_filter_values, validate_columns
+
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+class ExportService:
+    def list_datasets(self):
+        """List exportable datasets with their columns and row counts"""
+        return [
+            {
+                "name": name,
+                "rows": int(rows),
+                "columns": columns,
+            }
+            for name, (rows, columns) in ((name, data_store.shape(name)) for name in data_store.names())
+            # shape() reads spilled datasets from their manifest; a missing (None) one has no columns
+            if columns
+        ]
+
+    def stream_dataset(self, name, fmt="ndjson", columns=None, filters=None, chunk_size=None):
+        """Validate an export request and return a generator of serialized chunks.
+
+        Validation happens eagerly so errors can be reported before the response
+        starts streaming; the generator itself only ever holds one chunk.
+        """
+        df = get_data(name)
+        if df is None:
+            raise DatasetNotFound(name)
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported format '{fmt}', expected one of {list(EXPORT_FORMATS)}")
+
+        columns = list(columns) if columns else list(df.columns)
+        filters = filters or {}
+        validate_columns(df, columns)
+        validate_columns(df, filters.keys())
+        # Coerced here rather than per chunk, so a bad value is a 400 and not a broken stream
+        filters = {
+            column: coerce_filter_values(df[column].dtype, column, values) for column, values in filters.items()
+        }
+
+        chunk_size = max(1, int(chunk_size or EXPORT_CHUNK_ROWS))
+        return self._iter_chunks(df, name, fmt, columns, filters, chunk_size)
+
+    def _iter_chunks(self, df, name, fmt, columns, filters, chunk_size):
+        """Yield the filtered, projected frame chunk by chunk"""
+        header_written = False
+        for chunk in get_storage().iter_chunks(name, filters, columns, chunk_size):
+            if fmt == "csv":
+                yield chunk.to_csv(index=False, header=not header_written)
+                header_written = True
+            else:
+                yield chunk.to_json(orient="records", lines=True)
+
+        if fmt == "csv" and not header_written:
+            # Still emit a header so empty exports parse as valid CSV
+            yield df.iloc[0:0][columns].to_csv(index=False)
@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+from config import FORM_EWMA_SPAN, FORM_WINDOW, get_data, get_derived, register_derived
+from utils.helpers import player_match_totals
+import services.kill_event_store  # noqa: F401 -- registers kill_events, which form is computed from
+
+
+CURVE_FIELDS = ('match_index', 'match_name', 'kd_ratio', 'rolling_kd', 'ewma_rating', 'streak', 'kd_percentile')
+
+
+def _values(series, decimals=None):
+    """List of a column's values with NaN as None, rounded like the rest of the timeseries"""
+    values = series.astype(object).where(series.notna(), None).tolist()
+    if decimals is None:
+        return values
+    return [None if value is None else round(value, decimals) for value in values]
+
+
+def _player_matches(events):
+    """One row per (player, match) with kills and deaths, in the order of player timeseries.
+
+    Like PlayerService._get_player_matches, matches are grouped by match name and
+    ordered by the player's first event of each in rounds_kills file order.
+    """
+    match_names, name_codes = np.unique(
+        np.array([key[3] for key in events.matches], dtype=object), return_inverse=True
+    )
+    involved = pd.DataFrame({
+        'player': np.concatenate([events.eliminator, events.eliminated]),
+        'match': np.tile(name_codes[events.match], 2),
+        'match_code': np.tile(events.match, 2),
+        'row': np.tile(events.source_row, 2),
+        'kills': np.repeat([1, 0], events.size),
+        'deaths': np.repeat([0, 1], events.size),
+    })
+    involved = involved[involved['player'] >= 0].sort_values('row', kind='stable')
+    matches = involved.groupby(['player', 'match'], sort=False).agg(
+        row=('row', 'first'), match_code=('match_code', 'first'), kills=('kills', 'sum'), deaths=('deaths', 'sum')
+    ).reset_index().sort_values(['player', 'row'], kind='stable').reset_index(drop=True)
+    matches['match_name'] = match_names[matches['match'].to_numpy()]
+    return matches
+
+
+def _ratings(events, matches):
+    """Rating of each (player, match) row from players_stats, NaN when the player has none"""
+    totals = player_match_totals(get_data('players_stats'))
+    keys = ['Player', 'Tournament', 'Stage', 'Match Type']
+    # A player listed for two teams in a match type keeps the row with most rounds
+    ratings = totals.sort_values('Rounds Played', ascending=False, kind='stable').drop_duplicates(keys)
+    match_keys = pd.DataFrame(events.matches, columns=['Tournament', 'Stage', 'Match Type', 'Match Name'])
+    lookup = match_keys.iloc[matches['match_code']].reset_index(drop=True)[keys[1:]]
+    lookup.insert(0, 'Player', events.players[matches['player']])
+    return lookup.merge(ratings[keys + ['Rating']], on=keys, how='left')['Rating'].astype('float64')
+
+
+def build_player_form():
+    """Rolling KD, rating EWMA, streaks and percentiles over every player's matches"""
+    events = get_derived('kill_events')
+    matches = _player_matches(events)
+    player = matches['player']
+    by_player = matches.groupby(player, sort=False)
+
+    matches['match_index'] = by_player.cumcount()
+    matches['kd_ratio'] = matches['kills'] / matches['deaths'].clip(lower=1)
+
+    # Window sums are differences of running sums FORM_WINDOW matches apart
+    running = by_player[['kills', 'deaths']].cumsum()
+    window = running - running.groupby(player).shift(FORM_WINDOW, fill_value=0)
+    matches['rolling_kd'] = window['kills'] / window['deaths'].clip(lower=1)
+
+    matches['rating'] = _ratings(events, matches)
+    matches['ewma_rating'] = (
+        matches.groupby(player, sort=False)['rating']
+        .ewm(span=FORM_EWMA_SPAN, ignore_na=True).mean()
+        .reset_index(level=0, drop=True)
+    )
+
+    # Streak: consecutive matches at KD >= 1 (positive) or below it (negative)
+    positive = matches['kd_ratio'] >= 1
+    runs = ((positive != positive.shift()) | (player != player.shift())).cumsum()
+    length = matches.groupby(runs).cumcount() + 1
+    matches['streak'] = length.where(positive, -length)
+
+    # Percentile of the match KD among everyone who played the match
+    matches['kd_percentile'] = matches.groupby('match')['kd_ratio'].rank(pct=True) * 100
+
+    run_lengths = matches.groupby(runs).agg(player=('player', 'first'), positive=('streak', 'first'),
+                                            length=('streak', 'size'))
+    longest = run_lengths.assign(positive=run_lengths['positive'] > 0).pivot_table(
+        index='player', columns='positive', values='length', aggfunc='max'
+    ).reindex(columns=[True, False]).fillna(0).astype(int)
+
+    current = matches.groupby(player, sort=False).tail(1).set_index('player')
+    current_form = pd.DataFrame({
+        'rolling_kd': current['rolling_kd'],
+        'ewma_rating': current['ewma_rating'],
+        'streak': current['streak'],
+        'form_percentile': current['rolling_kd'].rank(pct=True) * 100,
+        'rating_percentile': current['ewma_rating'].rank(pct=True) * 100,
+    })
+    kd_by_player = matches.groupby(player, sort=False)['kd_ratio']
+    consistency = (1 / (1 + kd_by_player.var(ddof=0))).where(kd_by_player.size() > 1, 0.0)
+
+    columns = [
+        matches['match_index'].tolist(), matches['match_name'].tolist(), _values(matches['kd_ratio'], 2),
+        _values(matches['rolling_kd'], 2), _values(matches['ewma_rating'], 3), matches['streak'].tolist(),
+        _values(matches['kd_percentile'], 1),
+    ]
+    currents = {
+        code: dict(zip(current_form.columns, values))
+        for code, values in zip(current_form.index, zip(
+            _values(current_form['rolling_kd'], 2), _values(current_form['ewma_rating'], 3),
+            current_form['streak'].tolist(), _values(current_form['form_percentile'], 1),
+            _values(current_form['rating_percentile'], 1),
+        ))
+    }
+
+    # Rows of a player are contiguous: build each curve from its slice of the columns
+    starts = np.flatnonzero(np.diff(player.to_numpy(), prepend=-1) != 0)
+    ends = np.append(starts[1:], len(matches))
+    form = {}
+    for code, start, end in zip(player.to_numpy()[starts].tolist(), starts.tolist(), ends.tolist()):
+        form[events.players[code]] = {
+            'consistency_score': round(float(consistency[code]), 3),
+            'form': {
+                'window': FORM_WINDOW,
+                'ewma_span': FORM_EWMA_SPAN,
+                'current': currents[code],
+                'longest_positive_streak': int(longest.at[code, True]),
+                'longest_negative_streak': int(longest.at[code, False]),
+                'curve': [dict(zip(CURVE_FIELDS, row)) for row in zip(*(column[start:end] for column in columns))],
+            },
+        }
+    return form
+
+
+register_derived('player_form', build_player_form)
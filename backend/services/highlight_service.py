@@ -0,0 +1,220 @@
+import numpy as np
+import pandas as pd
+from config import SEARCH_RESULT_LIMIT, get_data, get_derived, get_storage, register_derived
+from services.kill_event_store import MATCH_KEY_COLUMNS, MULTI_KILL_TYPES
+from services.search_service import SearchService
+from utils.encoding import encode, encode_keys, vocabulary
+from utils.helpers import construct_match_names
+from utils.instrumentation import instrument
+from utils.schema import COUNT_COLUMNS_KILLS_STATS
+
+
+CLUTCH_TYPES = ('1v1', '1v2', '1v3', '1v4', '1v5')
+# Kill types the round timeline folds into one entry per eliminator
+TIMELINE_GROUPED_KILL_TYPES = MULTI_KILL_TYPES + ('1v1',)
+ALL_MAPS = 'All Maps'
+
+
+def _kill_type_lookup(events, kill_types):
+    """Position in kill_types of every kill type code (indexed by code, -1 when absent)"""
+    codes = {name: code for code, name in enumerate(events.kill_types[:-1])}
+    lookup = np.full(len(events.kill_types), -1, dtype=np.int32)
+    for position, kill_type in enumerate(kill_types):
+        if kill_type in codes:
+            lookup[codes[kill_type]] = position
+    return lookup
+
+
+def _count_by(keys, columns, size):
+    """Distinct rows of the key arrays (sorted) and a counts matrix of their column hits"""
+    distinct, inverse = np.unique(np.stack(keys, axis=1), axis=0, return_inverse=True)
+    counts = np.zeros((len(distinct), size), dtype=np.int32)
+    np.add.at(counts, (inverse.reshape(-1), columns), 1)
+    return distinct, counts
+
+
+class HighlightIndex:
+    """Multi-kill and clutch counts as int32 arrays.
+
+    From kills_stats: one row per (player, match, map) with the 2k-5k and 1v1-1v5
+    counts, sorted by player with per-player offsets and a match-ordered view,
+    plus career totals per player. From the kill events: a multi-kill flag and a
+    timeline group (first event of the same eliminator and grouped kill type in
+    the round) per event, and per-match multi-kill event counts per (player,
+    team) and per agent.
+    """
+
+    def __init__(self, kills_stats_df, events):
+        df = kills_stats_df if kills_stats_df is not None else pd.DataFrame(
+            columns=MATCH_KEY_COLUMNS + ['Map', 'Team', 'Player'] + COUNT_COLUMNS_KILLS_STATS
+        )
+        df = df[df['Player'].notna()]
+        self.players = vocabulary(df['Player'])
+        self.teams = vocabulary(df['Team'])
+        self.maps = vocabulary(df['Map'])
+        self.matches, match_codes = encode_keys(df, MATCH_KEY_COLUMNS)
+        self.match_codes = {key: code for code, key in enumerate(self.matches)}
+
+        columns = {
+            'player': encode(df['Player'], self.players),
+            'match': match_codes,
+            'map': encode(df['Map'], self.maps),
+            'team': encode(df['Team'], self.teams),
+            'counts': df[COUNT_COLUMNS_KILLS_STATS].fillna(0).to_numpy(dtype=np.int32),
+        }
+        order = np.lexsort((columns['map'], columns['match'], columns['player']))
+        for name, values in columns.items():
+            setattr(self, name, values[order])
+        self.player_offsets = np.searchsorted(self.player, np.arange(len(self.players)))
+        self.player_codes = {name: code for code, name in enumerate(self.players[:-1])}
+        # Rows of match m are match_rows[match_offsets[m]:match_offsets[m + 1]], in player order
+        self.match_rows = np.argsort(self.match, kind='stable')
+        self.match_offsets = np.searchsorted(self.match[self.match_rows], np.arange(len(self.matches) + 1))
+
+        # Career totals count the per-match 'All Maps' rows only
+        all_maps_code = encode(pd.Series([ALL_MAPS]), self.maps)[0]
+        self.all_maps = (self.map == all_maps_code) & (all_maps_code >= 0)
+        self.totals = np.zeros((len(self.players) - 1, len(COUNT_COLUMNS_KILLS_STATS)), dtype=np.int64)
+        np.add.at(self.totals, self.player[self.all_maps], self.counts[self.all_maps])
+
+        # Kill events
+        self.events = events
+        multi_type = _kill_type_lookup(events, MULTI_KILL_TYPES)[events.kill_type]
+        self.multi_kill = multi_type >= 0
+        grouped = _kill_type_lookup(events, TIMELINE_GROUPED_KILL_TYPES)[events.kill_type] >= 0
+        event_round = np.repeat(np.arange(len(events.round_offsets) - 1), np.diff(events.round_offsets))
+        group_keys = pd.DataFrame({
+            'round': event_round, 'eliminator': events.eliminator, 'kill_type': events.kill_type,
+            'position': np.arange(events.size),
+        })[grouped]
+        self.timeline_group = np.full(events.size, -1, dtype=np.int64)
+        self.timeline_group[grouped] = group_keys.groupby(['round', 'eliminator', 'kill_type'])['position'].transform('min')
+
+        counted = self.multi_kill & (events.eliminator >= 0) & (events.eliminator_team >= 0)
+        self.player_multi_keys, self.player_multi_counts = _count_by(
+            [events.match[counted], events.eliminator[counted], events.eliminator_team[counted]],
+            multi_type[counted], len(MULTI_KILL_TYPES)
+        )
+        counted = self.multi_kill & (events.eliminator_agent >= 0)
+        self.agent_multi_keys, self.agent_multi_counts = _count_by(
+            [events.match[counted], events.eliminator_agent[counted]], multi_type[counted], len(MULTI_KILL_TYPES)
+        )
+
+    def match_multi_kills(self, match_code):
+        """Multi-kill event counts of a kill-event match: {(player, team): counts}, {agent: counts}"""
+        events = self.events
+        players = {}
+        keys, counts = self.player_multi_keys, self.player_multi_counts
+        start, stop = np.searchsorted(keys[:, 0], [match_code, match_code + 1])
+        for (_, player, team), row in zip(keys[start:stop].tolist(), counts[start:stop].tolist()):
+            players[(events.players[player], events.teams[team])] = row
+        agents = {}
+        keys, counts = self.agent_multi_keys, self.agent_multi_counts
+        start, stop = np.searchsorted(keys[:, 0], [match_code, match_code + 1])
+        for (_, agent), row in zip(keys[start:stop].tolist(), counts[start:stop].tolist()):
+            agents[events.agents[agent]] = row
+        return players, agents
+
+
+def build_highlight_index():
+    """Index kills_stats multi-kill/clutch counts and multi-kill kill events"""
+    return HighlightIndex(get_data('kills_stats'), get_derived('kill_events'))
+
+
+register_derived('highlights', build_highlight_index)
+
+
+def highlight_counts(counts):
+    """Multi-kill and clutch counts of a kills_stats count row"""
+    counts = dict(zip(COUNT_COLUMNS_KILLS_STATS, (int(value) for value in counts)))
+    multi_kills = {kill_type: counts[kill_type] for kill_type in MULTI_KILL_TYPES}
+    clutches = {clutch: counts[clutch] for clutch in CLUTCH_TYPES}
+    return {
+        'multi_kills': {**multi_kills, 'total': sum(multi_kills.values())},
+        'clutches': {**clutches, 'total': sum(clutches.values())},
+    }
+
+
+class HighlightService:
+    def __init__(self):
+        self.search_service = SearchService()
+
+    def _rows(self, index, rows):
+        """Per-match entries of kills_stats rows: the 'All Maps' counts plus a per-map breakdown"""
+        entries = {}
+        for row in rows.tolist():
+            key = (int(index.match[row]), int(index.player[row]))
+            entry = entries.get(key)
+            if entry is None:
+                tournament, stage, match_type, match_name = index.matches[key[0]]
+                entry = entries[key] = {
+                    'tournament': tournament, 'stage': stage, 'match_type': match_type,
+                    'match_name': match_name, 'player': index.players[key[1]],
+                    'team': index.teams[index.team[row]], **highlight_counts([0] * len(COUNT_COLUMNS_KILLS_STATS)),
+                    'maps': [],
+                }
+            if index.all_maps[row]:
+                entry.update(highlight_counts(index.counts[row]))
+            else:
+                entry['maps'].append({'map': index.maps[index.map[row]], **highlight_counts(index.counts[row])})
+        return list(entries.values())
+
+    def _top(self, index, columns, limit):
+        values = index.totals[:, columns].sum(axis=1)
+        order = np.lexsort((np.arange(len(values)), -values))[:limit]
+        return [{'player': index.players[code], 'value': int(values[code])} for code in order.tolist() if values[code]]
+
+    @instrument
+    def get_highlights(self, player=None, match_id=None, limit=SEARCH_RESULT_LIMIT):
+        """Multi-kill and clutch counts of a player, of every player in a match, or the top players"""
+        if player and match_id:
+            raise ValueError("Specify either player or match_id, not both")
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        index = get_derived('highlights')
+
+        if player:
+            player = self.search_service.resolve_player(player)
+            code = index.player_codes.get(player)
+            if code is None:
+                return None
+            rows = np.arange(index.player_offsets[code], index.player_offsets[code + 1])
+            return {
+                'player': player,
+                'totals': highlight_counts(index.totals[code]),
+                'matches': [
+                    {key: value for key, value in entry.items() if key != 'player'}
+                    for entry in self._rows(index, rows)
+                ],
+            }
+
+        if match_id:
+            match_row = get_storage().select('scores', {'match_id': [match_id]})
+            if match_row.empty:
+                return None
+            match = match_row.iloc[0]
+            code = None
+            for match_name in construct_match_names(match['Team A'], match['Team B']):
+                code = index.match_codes.get((match['Tournament'], match['Stage'], match['Match Type'], match_name))
+                if code is not None:
+                    break
+            if code is None:
+                return None
+            rows = index.match_rows[index.match_offsets[code]:index.match_offsets[code + 1]]
+            tournament, stage, match_type, match_name = index.matches[code]
+            return {
+                'match_id': match_id,
+                'tournament': tournament, 'stage': stage, 'match_type': match_type, 'match_name': match_name,
+                'players': [
+                    {key: value for key, value in entry.items()
+                     if key not in ('tournament', 'stage', 'match_type', 'match_name')}
+                    for entry in self._rows(index, rows)
+                ],
+            }
+
+        multi_columns = [COUNT_COLUMNS_KILLS_STATS.index(kill_type) for kill_type in MULTI_KILL_TYPES]
+        clutch_columns = [COUNT_COLUMNS_KILLS_STATS.index(clutch) for clutch in CLUTCH_TYPES]
+        return {
+            'multi_kills': self._top(index, multi_columns, limit),
+            'clutches': self._top(index, clutch_columns, limit),
+        }
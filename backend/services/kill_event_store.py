@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+from config import get_data, register_derived
+from utils.encoding import encode, encode_keys, vocabulary
+
+
+MATCH_KEY_COLUMNS = ['Tournament', 'Stage', 'Match Type', 'Match Name']
+MULTI_KILL_TYPES = ('2k', '3k', '4k', '5k')
+
+
+class KillEventStore:
+    """rounds_kills as int32 code arrays sorted by (match, map, round).
+
+    Codes index into the vocabularies (players, teams, agents, maps, kill_types,
+    matches). Events of one round are contiguous and keep their source order,
+    so round and match slices are plain array views.
+    """
+
+    def __init__(self, rounds_kills_df):
+        df = rounds_kills_df if rounds_kills_df is not None else pd.DataFrame(
+            columns=MATCH_KEY_COLUMNS + ['Map', 'Round Number', 'Eliminator', 'Eliminated',
+                                         'Eliminator Agent', 'Eliminated Agent',
+                                         'Eliminator Team', 'Eliminated Team', 'Kill Type']
+        )
+        self.players = vocabulary(df['Eliminator'], df['Eliminated'])
+        self.teams = vocabulary(df['Eliminator Team'], df['Eliminated Team'])
+        self.agents = vocabulary(df['Eliminator Agent'], df['Eliminated Agent'])
+        self.maps = vocabulary(df['Map'])
+        self.kill_types = vocabulary(df['Kill Type'])
+
+        self.matches, match_codes = encode_keys(df, MATCH_KEY_COLUMNS)
+        self.match_codes = {key: code for code, key in enumerate(self.matches)}
+
+        columns = {
+            'match': match_codes,
+            'map': encode(df['Map'], self.maps),
+            'round': df['Round Number'].to_numpy(dtype=np.int32),
+            'eliminator': encode(df['Eliminator'], self.players),
+            'eliminated': encode(df['Eliminated'], self.players),
+            'eliminator_agent': encode(df['Eliminator Agent'], self.agents),
+            'eliminated_agent': encode(df['Eliminated Agent'], self.agents),
+            'eliminator_team': encode(df['Eliminator Team'], self.teams),
+            'eliminated_team': encode(df['Eliminated Team'], self.teams),
+            'kill_type': encode(df['Kill Type'], self.kill_types),
+            'source_row': np.arange(len(df), dtype=np.int32),
+        }
+        # lexsort is stable, events within a round stay in file order
+        order = np.lexsort((columns['round'], columns['map'], columns['match']))
+        for name, values in columns.items():
+            setattr(self, name, values[order])
+        self.size = len(order)
+
+        # Round r spans events round_offsets[r]:round_offsets[r + 1]
+        boundary = np.ones(self.size, dtype=bool)
+        if self.size:
+            boundary[1:] = (
+                (np.diff(self.match) != 0) | (np.diff(self.map) != 0) | (np.diff(self.round) != 0)
+            )
+        starts = np.flatnonzero(boundary)
+        self.round_offsets = np.append(starts, self.size).astype(np.int64)
+        self.round_match = self.match[starts]
+        self.round_map = self.map[starts]
+        self.round_number = self.round[starts]
+        # Match m spans rounds match_round_offsets[m]:match_round_offsets[m + 1]
+        self.match_round_offsets = np.searchsorted(self.round_match, np.arange(len(self.matches) + 1))
+
+        # Events each player took part in (as eliminator or eliminated), in file order
+        players = np.concatenate([self.eliminator, self.eliminated])
+        positions = np.concatenate([np.arange(self.size), np.arange(self.size)])
+        involved = players >= 0
+        pairs = np.unique(np.stack([players[involved], self.source_row[positions[involved]]]), axis=1)
+        self.player_events = np.argsort(self.source_row)[pairs[1]]
+        self.player_offsets = np.searchsorted(pairs[0], np.arange(len(self.players)))
+        self.player_codes = {name: code for code, name in enumerate(self.players[:-1])}
+
+    def find_match(self, tournament, stage, match_type, match_names):
+        """Code of the first of match_names recorded for the match, or None"""
+        for match_name in match_names:
+            code = self.match_codes.get((tournament, stage, match_type, match_name))
+            if code is not None:
+                return code
+        return None
+
+    def match_rounds(self, match_code):
+        """Round indexes of a match, ordered by (map, round)"""
+        return range(self.match_round_offsets[match_code], self.match_round_offsets[match_code + 1])
+
+    def match_events(self, match_code):
+        """Slice of the event arrays covering a match"""
+        rounds = self.match_rounds(match_code)
+        return slice(self.round_offsets[rounds.start], self.round_offsets[rounds.stop])
+
+    def round_events(self, round_index):
+        """Slice of the event arrays covering one round"""
+        return slice(self.round_offsets[round_index], self.round_offsets[round_index + 1])
+
+    def events_of_player(self, player_name):
+        """Event positions involving a player in file order (empty if unknown)"""
+        code = self.player_codes.get(player_name)
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        return self.player_events[self.player_offsets[code]:self.player_offsets[code + 1]]
+
+    def decode(self, events):
+        """Column lists of the selected events with codes turned back into names"""
+        return {
+            'map': self.maps[self.map[events]].tolist(),
+            'round': self.round[events].tolist(),
+            'eliminator': self.players[self.eliminator[events]].tolist(),
+            'eliminated': self.players[self.eliminated[events]].tolist(),
+            'eliminator_agent': self.agents[self.eliminator_agent[events]].tolist(),
+            'eliminated_agent': self.agents[self.eliminated_agent[events]].tolist(),
+            'eliminator_team': self.teams[self.eliminator_team[events]].tolist(),
+            'eliminated_team': self.teams[self.eliminated_team[events]].tolist(),
+            'kill_type': self.kill_types[self.kill_type[events]].tolist(),
+        }
+
+
+def build_kill_event_store():
+    """Encode rounds_kills into a KillEventStore"""
+    return KillEventStore(get_data('rounds_kills'))
+
+
+register_derived('kill_events', build_kill_event_store)
@@ -0,0 +1,216 @@
+from bisect import bisect_left, insort
+from collections import Counter
+import pandas as pd
+from config import LEADERBOARD_MIN_ROUNDS, get_data, get_derived, register_derived
+from services.kill_event_store import MULTI_KILL_TYPES
+from utils.helpers import safe_divide
+from utils.instrumentation import instrument
+
+
+ALL = 'all'
+ENTITIES = ('players', 'teams')
+# Accumulator slots, summed over every row of a subject in a scope
+(ROUNDS, RATING, RATING_WEIGHT, ACS, ACS_WEIGHT, FKPR, FKPR_WEIGHT,
+ KILLS, DEATHS, CLUTCHES_WON, CLUTCHES_PLAYED, MULTI_KILLS) = range(12)
+WEIGHTED = {
+    'Rating': (RATING, RATING_WEIGHT),
+    'Average Combat Score': (ACS, ACS_WEIGHT),
+    'First Kills Per Round': (FKPR, FKPR_WEIGHT),
+}
+COUNTED = {
+    'Kills': KILLS,
+    'Deaths': DEATHS,
+    'Clutches Won': CLUTCHES_WON,
+    'Clutches Played': CLUTCHES_PLAYED,
+}
+# metric -> (value from an accumulator or None, decimals in the response)
+METRICS = {
+    'rating': (lambda acc: acc[RATING] / acc[RATING_WEIGHT] if acc[RATING_WEIGHT] else None, 2),
+    'acs': (lambda acc: acc[ACS] / acc[ACS_WEIGHT] if acc[ACS_WEIGHT] else None, 1),
+    'kd': (lambda acc: acc[KILLS] / max(acc[DEATHS], 1), 2),
+    'fkpr': (lambda acc: acc[FKPR] / acc[FKPR_WEIGHT] if acc[FKPR_WEIGHT] else None, 2),
+    'clutch_rate': (lambda acc: safe_divide(acc[CLUTCHES_WON], acc[CLUTCHES_PLAYED], None), 3),
+    'multi_kills': (lambda acc: acc[MULTI_KILLS], 0),
+}
+
+
+def _scopes(tournament, stage, agent):
+    """Every (tournament, stage, agent) scope a row counts towards"""
+    return [(t, s, agent) for t in (tournament, ALL) for s in (stage, ALL)]
+
+
+def _contribution(row):
+    """Accumulator increments of one players_stats row"""
+    rounds = float(row['Rounds Played'])
+    acc = [0.0] * 12
+    acc[ROUNDS] = rounds
+    for column, (total, weight) in WEIGHTED.items():
+        value = row[column]
+        if pd.notna(value):
+            acc[total] = float(value) * rounds
+            acc[weight] = rounds
+    for column, slot in COUNTED.items():
+        value = row[column]
+        acc[slot] = float(value) if pd.notna(value) else 0.0
+    return acc
+
+
+class Leaderboards:
+    """Per-scope rankings kept as sorted arrays, updated in place as rows arrive.
+
+    Each board is a list of (-value, name) ascending, so top-k is a slice. Rows
+    are folded into per-(subject, scope) accumulators; only the subjects a batch
+    touched are re-ranked.
+    """
+
+    def __init__(self):
+        self.accumulators = {}
+        self.team_rounds = {}
+        self.boards = {}
+        self.ranked = {}
+        # players_stats row key -> contribution currently counted for it
+        self.rows = {}
+
+    def add_player_stats(self, players_stats_df):
+        dirty = set()
+        if players_stats_df is None or players_stats_df.empty:
+            return dirty
+        rows = players_stats_df[players_stats_df['Stage'] != 'All Stages']
+        for row in rows.to_dict('records'):
+            agents = str(row['Agents'])
+            # The row covering all agents of a match type is the one with the most rounds;
+            # single-agent rows also feed that agent's boards
+            candidates = [((row['Player'], row['Teams'], row['Tournament'], row['Stage'], row['Match Type']), ALL, True)]
+            if ',' not in agents:
+                candidates.append((candidates[0][0] + (agents,), agents, False))
+            contribution = _contribution(row)
+            for key, agent, keep_most_rounds in candidates:
+                previous = self.rows.get(key)
+                if previous is not None and keep_most_rounds and previous[ROUNDS] >= contribution[ROUNDS]:
+                    continue
+                delta = contribution if previous is None else [n - o for n, o in zip(contribution, previous)]
+                self.rows[key] = contribution
+                for scope in _scopes(row['Tournament'], row['Stage'], agent):
+                    dirty |= self._add(scope, row['Player'], row['Teams'], delta)
+        return dirty
+
+    def add_kill_events(self, rounds_kills_df):
+        """Count multi-kill rounds (a round where the eliminator's kills are tagged 2k-5k)"""
+        dirty = set()
+        if rounds_kills_df is None or rounds_kills_df.empty:
+            return dirty
+        multi = rounds_kills_df[rounds_kills_df['Kill Type'].isin(MULTI_KILL_TYPES)]
+        rounds = multi.drop_duplicates(
+            ['Tournament', 'Stage', 'Match Type', 'Match Name', 'Map', 'Round Number', 'Eliminator']
+        )
+        counts = rounds.groupby(
+            ['Tournament', 'Stage', 'Eliminator Agent', 'Eliminator', 'Eliminator Team'], sort=False
+        ).size()
+        for (tournament, stage, agent, player, team), count in counts.items():
+            delta = [0.0] * 12
+            delta[MULTI_KILLS] = float(count)
+            for scope in _scopes(tournament, stage, ALL) + _scopes(tournament, stage, agent):
+                dirty |= self._add(scope, player, team, delta, count_rounds=False)
+        return dirty
+
+    def _add(self, scope, player, team, delta, count_rounds=True):
+        touched = set()
+        for entity, name in (('players', player), ('teams', team)):
+            acc = self.accumulators.setdefault((entity, scope, name), [0.0] * 12)
+            for slot, value in enumerate(delta):
+                acc[slot] += value
+            touched.add((entity, scope, name))
+        if count_rounds:
+            self.team_rounds.setdefault((scope, player), Counter())[team] += delta[ROUNDS]
+        return touched
+
+    def rerank(self, dirty):
+        """Move the touched subjects to their new place on every metric's board"""
+        fresh = {}
+        for entity, scope, name in dirty:
+            acc = self.accumulators[(entity, scope, name)]
+            qualified = acc[ROUNDS] >= LEADERBOARD_MIN_ROUNDS
+            for metric, (value_of, _) in METRICS.items():
+                board_key = (entity, scope, metric)
+                old = self.ranked.pop((board_key, name), None)
+                board = self.boards.setdefault(board_key, [])
+                if old is not None:
+                    del board[bisect_left(board, old)]
+                value = value_of(acc) if qualified else None
+                if value is None:
+                    continue
+                entry = (-value, name)
+                self.ranked[(board_key, name)] = entry
+                if board and board_key not in fresh:
+                    insort(board, entry)
+                else:
+                    fresh.setdefault(board_key, []).append(entry)
+        # Boards built from scratch are sorted once instead of entry by entry
+        for board_key, entries in fresh.items():
+            self.boards[board_key] = sorted(self.boards[board_key] + entries)
+
+    def top(self, entity, scope, metric, k):
+        board = self.boards.get((entity, scope, metric), [])
+        return board[:k], len(board)
+
+
+def build_leaderboards():
+    """Rank players and teams on every metric, per tournament, stage and agent"""
+    leaderboards = Leaderboards()
+    dirty = leaderboards.add_player_stats(get_data('players_stats'))
+    dirty |= leaderboards.add_kill_events(get_data('rounds_kills'))
+    leaderboards.rerank(dirty)
+    return leaderboards
+
+
+def update_leaderboards(leaderboards, new_rows):
+    """Fold newly ingested players_stats and rounds_kills rows into the boards"""
+    dirty = leaderboards.add_player_stats(new_rows.get('players_stats'))
+    dirty |= leaderboards.add_kill_events(new_rows.get('rounds_kills'))
+    leaderboards.rerank(dirty)
+    return leaderboards
+
+
+register_derived('leaderboards', build_leaderboards, update_leaderboards)
+
+
+class LeaderboardService:
+    @instrument
+    def get_leaderboard(self, metric, k=10, entity='players', tournament=ALL, stage=ALL, agent=ALL):
+        """Top-k players or teams on a metric within a tournament/stage/agent scope"""
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of: {', '.join(METRICS)}")
+        if entity not in ENTITIES:
+            raise ValueError(f"Unknown entity '{entity}', expected one of: {', '.join(ENTITIES)}")
+        if k < 1:
+            raise ValueError("k must be at least 1")
+
+        leaderboards = get_derived('leaderboards')
+        scope = (tournament, stage, agent.lower() if agent != ALL else ALL)
+        entries, total = leaderboards.top(entity, scope, metric, k)
+        decimals = METRICS[metric][1]
+
+        ranking = []
+        for rank, (value, name) in enumerate(entries, start=1):
+            acc = leaderboards.accumulators[(entity, scope, name)]
+            entry = {
+                'rank': rank,
+                'name': name,
+                'value': round(-value, decimals) if decimals else int(-value),
+                'rounds': int(acc[ROUNDS]),
+            }
+            if entity == 'players':
+                teams = leaderboards.team_rounds.get((scope, name))
+                entry['team'] = teams.most_common(1)[0][0] if teams else None
+            ranking.append(entry)
+
+        return {
+            'metric': metric,
+            'entity': entity,
+            'tournament': tournament,
+            'stage': stage,
+            'agent': scope[2],
+            'min_rounds': LEADERBOARD_MIN_ROUNDS,
+            'total': total,
+            'entries': ranking,
+        }
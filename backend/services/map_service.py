@@ -0,0 +1,261 @@
+import numpy as np
+import pandas as pd
+from config import MAPS_MIN_PLAYED, get_data, get_derived, register_derived
+from services.kill_event_store import MATCH_KEY_COLUMNS
+from services.search_service import SearchService
+from services.team_aliases import resolve_team
+from utils.encoding import encode, vocabulary
+from utils.helpers import safe_divide
+from utils.instrumentation import instrument
+
+
+ENTITIES = ('teams', 'players')
+SIDES = ('attack', 'defense', 'overtime')
+# win_loss_methods_count columns: rounds won by each method, and lost by each
+WIN_METHODS = {
+    'elimination': 'Elimination',
+    'detonated': 'Detonated',
+    'defused': 'Defused',
+    'time_expiry': 'Time Expiry (No Plant)',
+}
+LOSS_METHODS = {
+    'eliminated': 'Eliminated',
+    'defuse_failed': 'Defused Failed',
+    'detonation_denied': 'Detonation Denied',
+    'time_expiry': 'Time Expiry (Failed to Plant)',
+}
+# Measures summed into the cube, per (entity, map, stage)
+MEASURES = (
+    ['maps_played', 'maps_won', 'rounds_won', 'rounds_lost']
+    + [f'{side}_{outcome}' for side in SIDES for outcome in ('won', 'lost')]
+    + ['duration_seconds', 'timed_maps', 'kills', 'deaths']
+    + [f'win_{method}' for method in WIN_METHODS] + [f'loss_{method}' for method in LOSS_METHODS]
+)
+MAP_KEY_COLUMNS = MATCH_KEY_COLUMNS + ['Map']
+
+
+def team_map_rows(maps_scores_df, win_loss_methods_df):
+    """One row per (team, played map) with the MEASURES of that team on it"""
+    sides = []
+    for team, opponent in (('Team A', 'Team B'), ('Team B', 'Team A')):
+        scores = maps_scores_df
+        sides.append(pd.DataFrame({
+            **{column: scores[column] for column in MAP_KEY_COLUMNS},
+            'Team': scores[team],
+            'maps_played': 1,
+            'maps_won': (scores[f'{team} Score'] > scores[f'{opponent} Score']).astype(int),
+            'rounds_won': scores[f'{team} Score'],
+            'rounds_lost': scores[f'{opponent} Score'],
+            # A team's attack rounds are lost to the opponent's defense, and the other way round
+            'attack_won': scores[f'{team} Attacker Score'],
+            'attack_lost': scores[f'{opponent} Defender Score'],
+            'defense_won': scores[f'{team} Defender Score'],
+            'defense_lost': scores[f'{opponent} Attacker Score'],
+            'overtime_won': scores[f'{team} Overtime Score'],
+            'overtime_lost': scores[f'{opponent} Overtime Score'],
+            'duration_seconds': scores['Duration Seconds'],
+            'timed_maps': (scores['Duration Seconds'] > 0).astype(int),
+        }))
+    rows = pd.concat(sides, ignore_index=True)
+
+    methods = win_loss_methods_df[MAP_KEY_COLUMNS + ['Team'] + list(WIN_METHODS.values()) + list(LOSS_METHODS.values())]
+    # One row per team and map, in case a map is listed twice
+    methods = methods.drop_duplicates(MAP_KEY_COLUMNS + ['Team']).rename(columns={
+        **{column: f'win_{name}' for name, column in WIN_METHODS.items()},
+        **{column: f'loss_{name}' for name, column in LOSS_METHODS.items()},
+    })
+    rows = rows.merge(methods, on=MAP_KEY_COLUMNS + ['Team'], how='left')
+    rows['kills'] = 0
+    rows['deaths'] = 0
+    return rows
+
+
+def player_map_rows(events, team_rows):
+    """One row per (player, played map) with kills and deaths from the kill events and the
+    results of the team they played for on it"""
+    involved = pd.DataFrame({
+        'match': np.tile(events.match, 2),
+        'map': np.tile(events.map, 2),
+        'player': np.concatenate([events.eliminator, events.eliminated]),
+        'team': np.concatenate([events.eliminator_team, events.eliminated_team]),
+        'kills': np.repeat([1, 0], events.size),
+        'deaths': np.repeat([0, 1], events.size),
+    })
+    involved = involved[(involved['player'] >= 0) & (involved['team'] >= 0)]
+    per_map = involved.groupby(['match', 'map', 'player', 'team'], sort=False)[['kills', 'deaths']].sum().reset_index()
+
+    keys = pd.DataFrame(events.matches, columns=MATCH_KEY_COLUMNS).iloc[per_map['match']].reset_index(drop=True)
+    rows = keys.assign(
+        Map=events.maps[per_map['map']], Player=events.players[per_map['player']],
+        Team=events.teams[per_map['team']], kills=per_map['kills'], deaths=per_map['deaths'],
+    )
+    team_measures = team_rows.drop(columns=['kills', 'deaths'])
+    rows = rows.merge(team_measures, on=MAP_KEY_COLUMNS + ['Team'], how='left')
+    rows['maps_played'] = 1
+    return rows
+
+
+class MapCube:
+    """MEASURES summed into a dense (entity, map, stage, measure) array.
+
+    Slicing a team's or player's maps, or every entity on a map, is array indexing
+    followed by a sum over the axes left open (e.g. every stage).
+    """
+
+    def __init__(self, rows, entity_column):
+        self.entities = vocabulary(rows[entity_column])
+        self.maps = vocabulary(rows['Map'])
+        self.stages = vocabulary(rows['Stage'])
+        self.entity_codes = {name: code for code, name in enumerate(self.entities[:-1])}
+        self.map_codes = {name: code for code, name in enumerate(self.maps[:-1])}
+        self.map_names = {name.lower(): name for name in self.maps[:-1]}
+        self.stage_codes = {name: code for code, name in enumerate(self.stages[:-1])}
+
+        codes = (encode(rows[entity_column], self.entities), encode(rows['Map'], self.maps),
+                 encode(rows['Stage'], self.stages))
+        known = (codes[0] >= 0) & (codes[1] >= 0) & (codes[2] >= 0)
+        self.values = np.zeros(
+            (len(self.entities) - 1, len(self.maps) - 1, len(self.stages) - 1, len(MEASURES)), dtype=np.float64
+        )
+        measures = rows[list(MEASURES)].astype('float64').fillna(0).to_numpy()
+        np.add.at(self.values, tuple(code[known] for code in codes), measures[known])
+
+    def stage_slice(self, stage):
+        """Cube restricted to one stage (or summed over every stage), shape (entity, map, measure)"""
+        if stage is None:
+            return self.values.sum(axis=2)
+        return self.values[:, :, self.stage_codes[stage]]
+
+
+def build_map_cubes():
+    """Team and player cubes over (entity, map, stage)"""
+    team_rows = team_map_rows(get_data('maps_scores'), get_data('win_loss_methods_count'))
+    player_rows = player_map_rows(get_derived('kill_events'), team_rows)
+    return {'teams': MapCube(team_rows, 'Team'), 'players': MapCube(player_rows, 'Player')}
+
+
+register_derived('map_cube', build_map_cubes)
+
+
+def _rate(won, lost):
+    return round(safe_divide(won, won + lost, 0.0), 3)
+
+
+def map_summary(values, entity):
+    """Response entry of one cube cell (a MEASURES vector)"""
+    m = dict(zip(MEASURES, values.tolist()))
+    average_duration = safe_divide(m['duration_seconds'], m['timed_maps'], None)
+    summary = {
+        'maps_played': int(m['maps_played']),
+        'maps_won': int(m['maps_won']),
+        'map_win_rate': round(safe_divide(m['maps_won'], m['maps_played'], 0.0), 3),
+        'rounds_won': int(m['rounds_won']),
+        'rounds_lost': int(m['rounds_lost']),
+        'round_win_rate': _rate(m['rounds_won'], m['rounds_lost']),
+        **{
+            side: {'won': int(m[f'{side}_won']), 'lost': int(m[f'{side}_lost']),
+                   'win_rate': _rate(m[f'{side}_won'], m[f'{side}_lost'])}
+            for side in SIDES
+        },
+        'average_duration_seconds': round(average_duration, 1) if average_duration is not None else None,
+        'average_duration': (
+            f"{int(average_duration) // 60}:{int(average_duration) % 60:02d}" if average_duration is not None else None
+        ),
+        'win_methods': {method: int(m[f'win_{method}']) for method in WIN_METHODS},
+        'loss_methods': {method: int(m[f'loss_{method}']) for method in LOSS_METHODS},
+    }
+    if entity == 'players':
+        summary['kills'] = int(m['kills'])
+        summary['deaths'] = int(m['deaths'])
+        summary['kd_ratio'] = round(m['kills'] / max(m['deaths'], 1), 2)
+    return summary
+
+
+class MapService:
+    def __init__(self):
+        self.search_service = SearchService()
+
+    def _cube(self, entity, stage):
+        if entity not in ENTITIES:
+            raise ValueError(f"Unknown entity '{entity}', expected one of: {', '.join(ENTITIES)}")
+        cube = get_derived('map_cube')[entity]
+        if stage is not None and stage not in cube.stage_codes:
+            raise ValueError(f"Unknown stage '{stage}'")
+        return cube
+
+    @instrument
+    def get_maps(self, stage=None):
+        """Every map with results over all teams (each map counted once, not per team)"""
+        cube = self._cube('teams', stage)
+        totals = cube.stage_slice(stage).sum(axis=0)
+        maps = []
+        for code, map_name in enumerate(cube.maps[:-1]):
+            summary = map_summary(totals[code], 'teams')
+            if not summary['maps_played']:
+                continue
+            # Summed over teams every map is counted twice and every round once per side
+            maps.append({
+                'map': map_name,
+                'maps_played': summary['maps_played'] // 2,
+                'rounds_played': summary['rounds_won'],
+                'attack': summary['attack'],
+                'defense': summary['defense'],
+                'overtime_rounds': summary['overtime']['won'],
+                'average_duration_seconds': summary['average_duration_seconds'],
+                'average_duration': summary['average_duration'],
+                'win_methods': summary['win_methods'],
+            })
+        return {'stage': stage, 'maps': maps}
+
+    @instrument
+    def get_map(self, map_name, entity='teams', stage=None, min_maps=MAPS_MIN_PLAYED):
+        """Results of every team or player with at least min_maps on a map (case-insensitive), best map win rate first"""
+        cube = self._cube(entity, stage)
+        map_name = cube.map_names.get(map_name.strip().lower())
+        if map_name is None:
+            return None
+        code = cube.map_codes[map_name]
+        values = cube.stage_slice(stage)[:, code]
+        played = values[:, MEASURES.index('maps_played')]
+        won = values[:, MEASURES.index('maps_won')]
+        rate = np.divide(won, played, out=np.zeros_like(won), where=played > 0)
+        ranked = np.flatnonzero(played >= max(min_maps, 1))
+        ranked = ranked[np.lexsort((ranked, -played[ranked], -rate[ranked]))]
+        key = 'team' if entity == 'teams' else 'player'
+        return {
+            'map': map_name,
+            'stage': stage,
+            'entity': entity,
+            'min_maps': min_maps,
+            'ranking': [{key: cube.entities[i], **map_summary(values[i], entity)} for i in ranked.tolist()],
+        }
+
+    def _entity_maps(self, entity, name, stage):
+        cube = self._cube(entity, stage)
+        code = cube.entity_codes.get(name)
+        if code is None:
+            return None
+        values = cube.stage_slice(stage)[code]
+        maps = [
+            {'map': cube.maps[i], **map_summary(values[i], entity)}
+            for i in np.flatnonzero(values[:, MEASURES.index('maps_played')]).tolist()
+        ]
+        return {
+            'stage': stage,
+            'overall': map_summary(values.sum(axis=0), entity),
+            'maps': sorted(maps, key=lambda m: (-m['maps_played'], m['map'])),
+        }
+
+    @instrument
+    def get_team_maps(self, team_name, stage=None):
+        """Per-map results of a team (full name or abbreviation)"""
+        team_name = resolve_team(team_name) or team_name
+        result = self._entity_maps('teams', team_name, stage)
+        return {'team': team_name, **result} if result is not None else None
+
+    @instrument
+    def get_player_maps(self, player_name, stage=None):
+        """Per-map results of a player, with the kills and deaths from the kill events"""
+        player_name = self.search_service.resolve_player(player_name)
+        result = self._entity_maps('players', player_name, stage)
+        return {'player': player_name, **result} if result is not None else None
@@ -1,25 +1,43 @@
-from config import get_data
+from config import get_data, get_derived, get_storage
 from services.data_service import DataService
+from services.draft_service import DraftService, MATCH_KEY_COLUMNS
+from services.duel_service import DuelService
+from services.eco_service import EcoService
+from services.kill_event_store import MULTI_KILL_TYPES
+import services.highlight_service  # noqa: F401 -- registers highlights
 from utils.helpers import construct_match_names
+from utils.instrumentation import get_logger, instrument, timer
+from utils.singleflight import single_flight
+from utils.result_store import persistent
 import numpy as np
 
+logger = get_logger(__name__)
+
+
+def _slice_events(events, start, stop):
+    """Rows start:stop of decoded event columns"""
+    return {column: values[start:stop] for column, values in events.items()}
+
+
 class MatchService:
     def __init__(self):
         self.data_service = DataService()
+        self.eco_service = EcoService()
+        self.duel_service = DuelService()
+        self.draft_service = DraftService()
     
+    @instrument
     def get_all_matches(self):
         """Get all tournament matches"""
-        scores_df = get_data('scores')
-        matches = scores_df[scores_df["Tournament"] == "Valorant Champions 2025"]
-        return matches.to_dict(orient="records")
+        # scores is already filtered to the configured tournament at load time
+        return get_data('scores').to_dict(orient="records")
     
+    @instrument
+    @single_flight
+    @persistent
     def get_match_details(self, match_id):
         """Get comprehensive match details"""
-        scores_df = get_data('scores')
-        kills_df = get_data('kills')
-        draft_phase_df = get_data('draft_phase')
-        
-        match_row = scores_df[scores_df["match_id"] == match_id]
+        match_row = get_storage().select('scores', {'match_id': [match_id]})
         if match_row.empty:
             return None
         
@@ -33,28 +51,17 @@ class MatchService:
         
         match_name_1, match_name_2 = construct_match_names(team_a, team_b)
         
-        # Get player kills data
-        player_kills = kills_df[
-            (kills_df['Match Type'] == match_type) &  
-            (
-                (kills_df['Match Name'] == match_name_1) |
-                (kills_df['Match Name'] == match_name_2)
+        with timer("filter"):
+            # Veto rows come from the draft index, keyed by match
+            draft_phase = self.draft_service.get_draft_rows(
+                match['Tournament'], match['Stage'], match_type, team_a, team_b
             )
-        ]
         
-        # Get draft phase data
-        draft_phase = draft_phase_df[
-            (draft_phase_df['Match Type'] == match_type) &  
-            (
-                (draft_phase_df['Match Name'] == match_name_1) |
-                (draft_phase_df['Match Name'] == match_name_2)
+        with timer("aggregate"):
+            # Player, enemy and duel views come from the precomputed duel tensor
+            player_stats, enemy_stats, duels_data = self.duel_service.get_match_duels(
+                match['Tournament'], match['Stage'], match_type, (match_name_1, match_name_2)
             )
-        ]
-        
-        # Process player statistics
-        player_stats = self._process_player_stats(player_kills)
-        enemy_stats = self._process_enemy_stats(player_kills)
-        duels_data = self._process_duels(player_kills)
         
         return {
             "match_id": match_id,
@@ -64,18 +71,18 @@ class MatchService:
             "player_kills": player_stats,
             "enemy_kills": enemy_stats,
             "player_vs_enemy": duels_data,
-            "draft_phase": draft_phase.to_dict('records')
+            "draft_phase": draft_phase
         }
     
+    @instrument
+    @single_flight
+    @persistent
     def get_round_analysis(self, match_id):
         """Get detailed round-by-round analysis"""
-        scores_df = get_data('scores')
-        rounds_kills_df = get_data('rounds_kills')
-        maps_scores_df = get_data('maps_scores')
-        win_loss_methods_count_df = get_data('win_loss_methods_count')
-        win_loss_method_round_number_df = get_data('win_loss_method_round_number')
+        storage = get_storage()
+        events = get_derived('kill_events')
 
-        match_row = scores_df[scores_df["match_id"] == match_id]
+        match_row = storage.select('scores', {'match_id': [match_id]})
         if match_row.empty:
             return None
 
@@ -85,241 +92,204 @@ class MatchService:
         team_b = match['Team B']
 
         match_name_1, match_name_2 = construct_match_names(team_a, team_b)
-        only_rounds_data = win_loss_method_round_number_df[
-            (win_loss_method_round_number_df['Match Name'] == match_name_1) |
-            (win_loss_method_round_number_df['Match Name'] == match_name_2)
-        ]
-        rounds_data = rounds_kills_df[
-            (rounds_kills_df['Match Type'] == match_type) &
-            (
-                (rounds_kills_df['Match Name'] == match_name_1) |
-                (rounds_kills_df['Match Name'] == match_name_2)
+        with timer("filter"):
+            match_names = {'Match Name': [match_name_1, match_name_2]}
+            only_rounds_data = storage.select('win_loss_method_round_number', match_names)
+            match_code = events.find_match(
+                match['Tournament'], match['Stage'], match_type, (match_name_1, match_name_2)
             )
-        ]
 
-        print(rounds_data['Map'])
-        map_scores = maps_scores_df[
-            (maps_scores_df["Match Name"] == match_name_1) |
-            (maps_scores_df["Match Name"] == match_name_2)
-        ]
+            map_scores = storage.select('maps_scores', match_names)
+            win_loss_methods = storage.select('win_loss_methods_count', match_names)
 
-        win_loss_methods = win_loss_methods_count_df[
-            (win_loss_methods_count_df["Match Name"] == match_name_1) |
-            (win_loss_methods_count_df["Match Name"] == match_name_2)
-        ]
-
-      
-
-        if rounds_data.empty:
+        if match_code is None:
             return None
+        match_events = events.decode(events.match_events(match_code))
+        logger.debug("Round analysis %s: %d kill events", match_id, len(match_events['map']))
 
-        rounds_analysis = self._process_rounds_analysis(rounds_data,only_rounds_data, team_a, team_b)
-        maps_analysis = self._process_maps_analysis(map_scores, win_loss_methods, team_a, team_b)
-        match_statistics = self._calculate_match_statistics(rounds_data, maps_analysis, team_a, team_b)
+        with timer("aggregate"):
+            rounds_analysis = self._process_rounds_analysis(
+                events, match_code, match_events, only_rounds_data, team_a, team_b, match
+            )
+            maps_analysis = self._process_maps_analysis(map_scores, win_loss_methods, team_a, team_b)
+            match_statistics = self._calculate_match_statistics(
+                match_code, match_events, maps_analysis, team_a, team_b
+            )
+
+        with timer("serialize"):
+            only_rounds_records = only_rounds_data.to_dict('records')
 
         return {
             "match_id": match_id,
             "match": match,
-            "only_rounds_data": only_rounds_data.to_dict('records'),
+            "only_rounds_data": only_rounds_records,
             "rounds": rounds_analysis,
             "maps": maps_analysis,
             "statistics": match_statistics,
             "total_rounds": len(rounds_analysis)
         }
     
+    @instrument
+    @single_flight
+    @persistent
     def get_matches_full(self):
         """Get comprehensive match data with maps and picks/bans"""
         scores_df = get_data('scores')
         maps_played_df = get_data('maps_played')
-        draft_phase_df = get_data('draft_phase')
         players_stats_df = get_data('players_stats')
 
+        with timer("filter"):
+            # One pass over each table instead of a scan per match
+            maps_records = maps_played_df.to_dict(orient="records")
+            maps_index = maps_played_df.groupby(MATCH_KEY_COLUMNS, sort=False).indices
+            players_records = players_stats_df.to_dict(orient="records")
+            players_index = players_stats_df.groupby(['Tournament', 'Stage', 'Match Type', 'Teams'], sort=False).indices
+
         all_matches = []
-        for _, row in scores_df.iterrows():
-            match_id = row["match_id"]
-            match_name = row.get("Match Name")
-            tournament = row.get("Tournament")
-
-            maps = maps_played_df[
-                (maps_played_df["Match ID"] == match_name) | (maps_played_df["Match Name"] == match_name)
-            ].to_dict(orient="records")
-
-            picks_bans = draft_phase_df[
-                (draft_phase_df["Match ID"] == match_name) | (draft_phase_df["match_name"] == match_name)
-            ].to_dict(orient="records")
-
-            players = players_stats_df[
-                (players_stats_df["Tournament"] == tournament) & (players_stats_df["Match Name"] == match_name)
-            ].to_dict(orient="records")
-
-            all_matches.append({
-                "match_id": match_id,
-                "match": row.to_dict(),
-                "maps": maps,
-                "picks_bans": picks_bans,
-                "players": players
-            })
+        with timer("aggregate"):
+            for match in scores_df.to_dict(orient="records"):
+                tournament, stage, match_type = match["Tournament"], match["Stage"], match["Match Type"]
+                team_a, team_b = match["Team A"], match["Team B"]
+
+                maps = []
+                for match_name in construct_match_names(team_a, team_b):
+                    rows = maps_index.get((tournament, stage, match_type, match_name))
+                    if rows is not None:
+                        maps = [maps_records[i] for i in sorted(rows)]
+                        break
+
+                players = [
+                    players_records[i]
+                    for team in (team_a, team_b)
+                    for i in sorted(players_index.get((tournament, stage, match_type, team), []))
+                ]
+
+                all_matches.append({
+                    "match_id": match["match_id"],
+                    "match": match,
+                    "maps": maps,
+                    "picks_bans": self.draft_service.get_draft_rows(tournament, stage, match_type, team_a, team_b),
+                    "players": players
+                })
 
         return all_matches
     
-    def _process_player_stats(self, player_kills):
-        """Process player statistics"""
-        # Filter for All Maps for general stats to avoid duplication if needed, 
-        # BUT the original code was aggregating. 
-        # If player_kills now has all maps, simple aggregation might double count if 'All Maps' rows exist.
-        # We should filter for 'All Maps' here if we want overall stats, OR sum up specific maps.
-        # Assuming 'All Maps' rows exist and we want to use them for overall stats:
-        
-        overall_kills = player_kills[player_kills['Map'] == 'All Maps']
-        if overall_kills.empty:
-             # Fallback if no 'All Maps' rows (unlikely given previous code)
-             overall_kills = player_kills
-             
-        player_stats = overall_kills.groupby(['Player Team', 'Player', "Enemy Team"]).agg({
-            'Player Kills': 'sum',
-            'Enemy Kills': 'sum', 
-            'Difference': 'sum',
-            'Enemy': lambda x: list(x)
-        }).reset_index()
-        return player_stats.fillna(0).to_dict('records')
-    
-    def _process_enemy_stats(self, player_kills):
-        """Process enemy statistics"""
-        overall_kills = player_kills[player_kills['Map'] == 'All Maps']
-        if overall_kills.empty:
-             overall_kills = player_kills
-
-        enemy_stats = overall_kills.groupby(['Enemy Team', 'Enemy', "Player Team"]).agg({
-            'Player Kills': 'sum',
-            'Enemy Kills': 'sum', 
-            'Difference': 'sum',
-            'Player': lambda x: list(x)
-        }).reset_index()
-        
-        enemy_stats = enemy_stats.rename(columns={
-            'Enemy': 'Player', 
-            "Player Team": "Enemy Team", 
-            "Enemy Team": "Player Team", 
-            'Player': 'Enemy'
-        })
-        return enemy_stats.fillna(0).to_dict('records')
-    
-    def _process_duels(self, player_kills):
-        """Process player vs enemy duels"""
-        # We want to keep Map information now
-        duels = player_kills.groupby(['Player', 'Enemy', 'Map', 'Kill Type']).agg({
-            'Player Kills': 'first', # Assuming one row per player-enemy-map combo in the source
-            'Enemy Kills': 'first',
-            'Difference': 'first',
-            'Player Team': 'first',
-            'Enemy Team': 'first'
-        }).reset_index()
-        return duels.fillna(0).to_dict('records')
-
-    def _process_rounds_analysis(self, rounds_data, onlyroundsData, team_a, team_b):
+    def _process_rounds_analysis(self, events, match_code, match_events, onlyroundsData, team_a, team_b, match=None):
         """Process rounds grouped by map"""
         rounds_analysis = []
-        
-        # ✅ NEW: Process rounds grouped by map
-        for map_name in sorted(rounds_data['Map'].unique()):
-            # Filter data for this specific map
-            map_rounds_data = rounds_data[rounds_data['Map'] == map_name]
-            map_only_rounds = onlyroundsData[onlyroundsData['Map'] == map_name]
-            
-            # Process each round in this map
-            for round_num in sorted(map_rounds_data['Round Number'].unique()):
-                round_events = map_rounds_data[map_rounds_data['Round Number'] == round_num]
-                rm = map_only_rounds[map_only_rounds['Round Number'] == round_num]
-                
-                # Get winner info
-                if not rm.empty:
-                    winner_info = rm[rm['Outcome'] == 'Win'].iloc[0]
-                    round_winner = winner_info['Team']
-                    win_method = winner_info['Method']
-                else:
-                    team_a_kills = len(round_events[round_events['Eliminator Team'] == team_a])
-                    team_b_kills = len(round_events[round_events['Eliminator Team'] == team_b])
-                    round_winner = team_a if team_a_kills > team_b_kills else team_b
-                    win_method = "Elimination"
-                
-                # Process round data
-                kill_timeline = self._process_kill_timeline(round_events)
-                key_moments = self._extract_key_moments(kill_timeline)
-                player_perf = self._calculate_round_player_performance(round_events)
-                agent_perf = self._calculate_agent_performance(round_events)
-                
-                team_a_kills = len(round_events[round_events['Eliminator Team'] == team_a])
-                team_b_kills = len(round_events[round_events['Eliminator Team'] == team_b])
-                
-                rounds_analysis.append({
-                    "round_number": int(round_num),
-                    "map": map_name,  # ✅ Now properly set for each round
-                    "winner": round_winner,
-                    "win_method": win_method,
-                    "team_a_kills": int(team_a_kills),
-                    "team_b_kills": int(team_b_kills),
-                    "total_kills": int(len(round_events)),
-                    "round_summary": f"{round_winner} wins via {win_method}",
-                    "kill_timeline": kill_timeline,
-                    "key_moments": key_moments,
-                    "player_performance": player_perf,
-                    "agent_performance": agent_perf,
-                    "duration": "Unknown"
-                })
-        
+
+        # First recorded winner per (map, round)
+        round_winners = {}
+        wins = onlyroundsData[onlyroundsData['Outcome'] == 'Win']
+        for map_name, round_num, team, method in zip(wins['Map'], wins['Round Number'], wins['Team'], wins['Method']):
+            round_winners.setdefault((map_name, int(round_num)), (team, method))
+
+        # Rounds are stored ordered by (map, round)
+        match_start = events.match_events(match_code).start
+        timeline_group = get_derived('highlights').timeline_group
+        for round_index in events.match_rounds(match_code):
+            round_slice = events.round_events(round_index)
+            round_events = _slice_events(match_events, round_slice.start - match_start, round_slice.stop - match_start)
+            map_name = events.maps[events.round_map[round_index]]
+            round_num = int(events.round_number[round_index])
+
+            team_a_kills = round_events['eliminator_team'].count(team_a)
+            team_b_kills = round_events['eliminator_team'].count(team_b)
+
+            # Get winner info
+            if (map_name, round_num) in round_winners:
+                round_winner, win_method = round_winners[(map_name, round_num)]
+            else:
+                round_winner = team_a if team_a_kills > team_b_kills else team_b
+                win_method = "Elimination"
+
+            # Process round data
+            kill_timeline = self._process_kill_timeline(
+                round_events, (timeline_group[round_slice] - round_slice.start).tolist()
+            )
+            key_moments = self._extract_key_moments(kill_timeline)
+            player_perf = self._calculate_round_player_performance(round_events)
+            agent_perf = self._calculate_agent_performance(round_events)
+
+            # Loadouts come from the precomputed eco index, keyed by (match, map, round)
+            economy = []
+            if match is not None:
+                economy = self.eco_service.get_round_economy(
+                    match['Tournament'], match['Stage'], match['Match Type'],
+                    team_a, team_b, map_name, round_num
+                )
+
+            rounds_analysis.append({
+                "round_number": round_num,
+                "map": map_name,
+                "winner": round_winner,
+                "win_method": win_method,
+                "team_a_kills": team_a_kills,
+                "team_b_kills": team_b_kills,
+                "total_kills": len(round_events['map']),
+                "round_summary": f"{round_winner} wins via {win_method}",
+                "kill_timeline": kill_timeline,
+                "key_moments": key_moments,
+                "player_performance": player_perf,
+                "agent_performance": agent_perf,
+                "economy": economy,
+                "duration": "Unknown"
+            })
+
         return rounds_analysis
 
 
-    def _process_kill_timeline(self, round_events):
-        """Process kill timeline with map info"""
+    def _process_kill_timeline(self, round_events, timeline_group):
+        """Process kill timeline with map info.
+
+        timeline_group holds, per event, the position in the round of the first event
+        its multi-kill/clutch entry folds into (-1 for single kills).
+        """
         kill_timeline = []
-        processed_multi = set()
         sequence = 0
-        
-        # Get map name from first event
-        map_name = round_events['Map'].iloc[0] if not round_events.empty else "Unknown"
-        
-        for _, kill in round_events.iterrows():
-            multi_key = (kill['Eliminator'], kill['Kill Type'])
-            
-            if kill['Kill Type'] in ['2k', '3k', '4k', '5k', '1v1']:
-                if multi_key not in processed_multi:
-                    processed_multi.add(multi_key)
-                    victims = round_events[
-                        (round_events['Eliminator'] == kill['Eliminator']) &
-                        (round_events['Kill Type'] == kill['Kill Type'])
-                    ]['Eliminated'].tolist()
-                    
+
+        map_name = round_events['map'][0] if round_events['map'] else "Unknown"
+        eliminators = round_events['eliminator']
+        kill_types = round_events['kill_type']
+
+        for i, (eliminator, kill_type, group) in enumerate(zip(eliminators, kill_types, timeline_group)):
+            if group >= 0:
+                if group == i:
+                    victims = [
+                        victim for victim, victim_group in zip(round_events['eliminated'][i:], timeline_group[i:])
+                        if victim_group == i
+                    ]
+
                     kill_timeline.append({
-                        "eliminator": kill['Eliminator'],
-                        "eliminator_agent": kill['Eliminator Agent'],
-                        "eliminator_team": kill['Eliminator Team'],
+                        "eliminator": eliminator,
+                        "eliminator_agent": round_events['eliminator_agent'][i],
+                        "eliminator_team": round_events['eliminator_team'][i],
                         "eliminated": victims,
-                        "eliminated_agent": kill['Eliminated Agent'],
-                        "eliminated_team": kill['Eliminated Team'],
-                        "kill_type": kill['Kill Type'],
+                        "eliminated_agent": round_events['eliminated_agent'][i],
+                        "eliminated_team": round_events['eliminated_team'][i],
+                        "kill_type": kill_type,
                         "sequence": sequence,
                         "is_multi_kill": True,
                         "victim_count": len(victims),
-                        "map": map_name  # ✅ Added
+                        "map": map_name
                     })
                     sequence += 1
             else:
                 kill_timeline.append({
-                    "eliminator": kill['Eliminator'],
-                    "eliminator_agent": kill['Eliminator Agent'],
-                    "eliminator_team": kill['Eliminator Team'],
-                    "eliminated": [kill['Eliminated']],
-                    "eliminated_agent": kill['Eliminated Agent'],
-                    "eliminated_team": kill['Eliminated Team'],
-                    "kill_type": kill['Kill Type'],
+                    "eliminator": eliminator,
+                    "eliminator_agent": round_events['eliminator_agent'][i],
+                    "eliminator_team": round_events['eliminator_team'][i],
+                    "eliminated": [round_events['eliminated'][i]],
+                    "eliminated_agent": round_events['eliminated_agent'][i],
+                    "eliminated_team": round_events['eliminated_team'][i],
+                    "kill_type": kill_type,
                     "sequence": sequence,
                     "is_multi_kill": False,
                     "victim_count": 1,
-                    "map": map_name  # ✅ Added
+                    "map": map_name
                 })
                 sequence += 1
-        
+
         return kill_timeline
 
     def _extract_key_moments(self, kill_timeline):
@@ -349,37 +319,37 @@ class MatchService:
         return key_moments
 
     def _calculate_round_player_performance(self, round_events):
+        eliminators = round_events['eliminator']
+        eliminated = round_events['eliminated']
         player_stats = {}
-        kills_by_player = round_events.groupby('Eliminator').size().to_dict()
-        deaths_by_player = round_events.groupby('Eliminated').size().to_dict()
-        all_players = set(round_events['Eliminator'].unique()) | set(round_events['Eliminated'].unique())
-        for player in all_players:
-            info = round_events[(round_events['Eliminator'] == player) | (round_events['Eliminated'] == player)]
-            if info.empty:
-                continue
-            if player in round_events['Eliminator'].values:
-                team = info[info['Eliminator'] == player]['Eliminator Team'].iloc[0]
-                agent = info[info['Eliminator'] == player]['Eliminator Agent'].iloc[0]
+        for player in set(eliminators) | set(eliminated):
+            if player in eliminators:
+                i = eliminators.index(player)
+                team, agent = round_events['eliminator_team'][i], round_events['eliminator_agent'][i]
             else:
-                team = info[info['Eliminated'] == player]['Eliminated Team'].iloc[0]
-                agent = info[info['Eliminated'] == player]['Eliminated Agent'].iloc[0]
+                i = eliminated.index(player)
+                team, agent = round_events['eliminated_team'][i], round_events['eliminated_agent'][i]
 
+            deaths = eliminated.count(player)
             player_stats[player] = {
                 "player": player,
                 "team": team,
                 "agent": agent,
-                "kills": int(kills_by_player.get(player, 0)),
-                "deaths": int(deaths_by_player.get(player, 0)),
-                "survived": deaths_by_player.get(player, 0) == 0
+                "kills": eliminators.count(player),
+                "deaths": deaths,
+                "survived": deaths == 0
             }
-        return list(player_stats.values())
+        # Set order depends on the hash seed; sort so every worker renders the same bytes
+        return sorted(player_stats.values(), key=lambda p: (-p["kills"], p["player"] is None, p["player"] or ""))
 
     def _calculate_agent_performance(self, round_events):
-        agent_stats = round_events.groupby(['Eliminator Team', 'Eliminator Agent']).agg({
-            'Eliminated': 'count'
-        }).reset_index()
-        agent_stats.columns = ['Team', 'Agent', 'Kills']
-        return agent_stats.to_dict('records')
+        kills = {}
+        for team, agent, victim in zip(
+            round_events['eliminator_team'], round_events['eliminator_agent'], round_events['eliminated']
+        ):
+            if team is not None and agent is not None:
+                kills[(team, agent)] = kills.get((team, agent), 0) + (victim is not None)
+        return [{'Team': team, 'Agent': agent, 'Kills': count} for (team, agent), count in sorted(kills.items())]
 
     def _process_maps_analysis(self, map_scores, win_loss_methods, team_a, team_b):
         maps_analysis = {}
@@ -412,33 +382,34 @@ class MatchService:
             }
         return methods
 
-    def _calculate_match_statistics(self, rounds_data, maps_analysis, team_a, team_b):
-        total_kills = len(rounds_data)
+    def _calculate_match_statistics(self, match_code, match_events, maps_analysis, team_a, team_b):
+        total_kills = len(match_events['map'])
         total_rounds = sum([m['total_rounds'] for m in maps_analysis.values()]) or 1
 
-        # Process player statistics with multi-kills breakdown
-        player_stats = rounds_data.groupby(['Eliminator', 'Eliminator Team']).agg({
-            'Eliminated': 'count',
-            'Kill Type': lambda x: list(x)
-        }).reset_index()
-        player_stats.columns = ['Player', 'Team', 'Total_Kills', 'Kill_Types']
+        # Kills (events with a victim) per player and per agent; multi-kills come from the highlight index
+        player_kills_by = {}
+        agent_kills_by = {}
+        for player, team, agent, victim in zip(
+            match_events['eliminator'], match_events['eliminator_team'], match_events['eliminator_agent'],
+            match_events['eliminated']
+        ):
+            if player is not None and team is not None:
+                player_kills_by[(player, team)] = player_kills_by.get((player, team), 0) + (victim is not None)
+            if agent is not None:
+                agent_kills_by[agent] = agent_kills_by.get(agent, 0) + (victim is not None)
+        player_multi_kills, agent_multi_kills_by = get_derived('highlights').match_multi_kills(match_code)
+        no_multi_kills = [0] * len(MULTI_KILL_TYPES)
 
         advanced_player_stats = []
-        for _, player in player_stats.iterrows():
-            kill_types = player['Kill_Types']
-            multi_kills = {
-                '2k': kill_types.count('2k'),
-                '3k': kill_types.count('3k'),
-                '4k': kill_types.count('4k'),
-                '5k': kill_types.count('5k')
-            }
+        for (player, team), player_kills in sorted(player_kills_by.items()):
+            multi_kills = dict(zip(MULTI_KILL_TYPES, player_multi_kills.get((player, team), no_multi_kills)))
             advanced_player_stats.append({
-                "player": player['Player'],
-                "team": player['Team'],
-                "total_kills": int(player['Total_Kills']),
+                "player": player,
+                "team": team,
+                "total_kills": player_kills,
                 "multi_kills": multi_kills,
-                "total_multi_kills": int(sum(multi_kills.values())),
-                "avg_kills_per_round": float(round(player['Total_Kills'] / total_rounds, 2)) if total_rounds > 0 else 0.0
+                "total_multi_kills": sum(multi_kills.values()),
+                "avg_kills_per_round": float(round(player_kills / total_rounds, 2)) if total_rounds > 0 else 0.0
             })
 
         # Calculate top performers
@@ -473,23 +444,9 @@ class MatchService:
                 "highest_avg": {"player": "N/A", "avg_kills_per_round": 0.0}
             }
 
-        # Process agent statistics with multi-kills breakdown
-        agent_stats = rounds_data.groupby('Eliminator Agent').agg({
-            'Eliminated': 'count',
-            'Kill Type': lambda x: list(x)
-        }).reset_index()
-        
         agent_performance = []
-        for _, agent in agent_stats.iterrows():
-            agent_name = agent['Eliminator Agent']
-            total_agent_kills = int(agent['Eliminated'])
-            kill_types = agent['Kill Type'] if isinstance(agent['Kill Type'], list) else []
-            agent_multi_kills = {
-                '2k': kill_types.count('2k') if isinstance(kill_types, list) else 0,
-                '3k': kill_types.count('3k') if isinstance(kill_types, list) else 0,
-                '4k': kill_types.count('4k') if isinstance(kill_types, list) else 0,
-                '5k': kill_types.count('5k') if isinstance(kill_types, list) else 0
-            }
+        for agent_name, total_agent_kills in sorted(agent_kills_by.items()):
+            agent_multi_kills = dict(zip(MULTI_KILL_TYPES, agent_multi_kills_by.get(agent_name, no_multi_kills)))
             agent_performance.append({
                 "agent": agent_name,
                 "total_kills": total_agent_kills,
@@ -500,12 +457,12 @@ class MatchService:
         # Team comparison
         team_comparison = {
             team_a: {
-                "total_kills": int(len(rounds_data[rounds_data['Eliminator Team'] == team_a])),
+                "total_kills": match_events['eliminator_team'].count(team_a),
                 "maps_won": int(len([m for m in maps_analysis.values() if m['winner'] == team_a])),
                 "rounds_won": int(sum([m['team_a_rounds'] for m in maps_analysis.values()]))
             },
             team_b: {
-                "total_kills": int(len(rounds_data[rounds_data['Eliminator Team'] == team_b])),
+                "total_kills": match_events['eliminator_team'].count(team_b),
                 "maps_won": int(len([m for m in maps_analysis.values() if m['winner'] == team_b])),
                 "rounds_won": int(sum([m['team_b_rounds'] for m in maps_analysis.values()]))
             }
@@ -1,23 +1,127 @@
-from config import get_data
-import numpy as np
-from utils.helpers import construct_match_names
+from config import get_data, get_derived, get_storage, register_derived
+from utils.helpers import construct_match_names, player_match_totals, aggregate_player_stats, player_stats_summary
+from utils.instrumentation import get_logger, instrument, timer
+from utils.singleflight import single_flight
+from utils.result_store import persistent
+from services.search_service import SearchService
+import services.form_service  # noqa: F401 -- registers player_form
+import services.highlight_service  # noqa: F401 -- registers highlights
 import pandas as pd
 
+logger = get_logger(__name__)
+
+RECENT_MATCHES = 5
+
+def _player_id(player_name):
+    return player_name.lower().replace(' ', '-')
+
+def build_player_profiles():
+    """Precompute career, agent, stage and per-match stats for every player"""
+    players_stats_df = get_data('players_stats')
+    scores_df = get_data('scores')
+
+    totals = player_match_totals(players_stats_df)
+    careers = aggregate_player_stats(totals, ['Player']).set_index('Player')
+    team_rounds = totals.groupby(['Player', 'Teams'])['Rounds Played'].sum().reset_index()
+    stages = aggregate_player_stats(totals, ['Player', 'Stage'])
+
+    # Single-agent rows only, combined "agent, agent" rows would double count
+    agent_rows = players_stats_df[
+        (players_stats_df['Stage'] != 'All Stages') &
+        (~players_stats_df['Agents'].astype(str).str.contains(','))
+    ]
+    agents = aggregate_player_stats(agent_rows, ['Player', 'Agents'])
+
+    # Order match types by when they appear in the schedule
+    schedule = {}
+    for stage, match_type in zip(scores_df['Stage'], scores_df['Match Type']):
+        schedule.setdefault((stage, match_type), len(schedule))
+    totals = totals.assign(
+        _order=[schedule.get(key, -1) for key in zip(totals['Stage'], totals['Match Type'])]
+    )
+
+    profiles = {}
+    for player, rows in totals.groupby('Player', sort=False):
+        teams = team_rounds[team_rounds['Player'] == player].sort_values('Rounds Played', ascending=False)
+        player_agents = agents[agents['Player'] == player].sort_values('Rounds Played', ascending=False)
+        player_stages = stages[stages['Player'] == player]
+        recent = rows.sort_values('_order', ascending=False, kind='stable').head(RECENT_MATCHES)
+
+        profiles[player] = {
+            'id': _player_id(player),
+            'name': player,
+            'current_team': teams['Teams'].iloc[0] if not teams.empty else 'Unknown',
+            'teams': teams['Teams'].tolist(),
+            'career_stats': player_stats_summary(careers.loc[player]),
+            'agents': [
+                {'agent': row['Agents'], **player_stats_summary(row)}
+                for _, row in player_agents.iterrows()
+            ],
+            'stages': [
+                {'stage': row['Stage'], **player_stats_summary(row)}
+                for _, row in player_stages.iterrows()
+            ],
+            'recent_matches': [
+                {
+                    'tournament': row['Tournament'],
+                    'stage': row['Stage'],
+                    'match_type': row['Match Type'],
+                    'team': row['Teams'],
+                    'agents': [a.strip() for a in str(row['Agents']).split(',')],
+                    'rounds': int(row['Rounds Played']),
+                    'rating': float(row['Rating']) if pd.notna(row['Rating']) else None,
+                    'acs': float(row['Average Combat Score']) if pd.notna(row['Average Combat Score']) else None,
+                    'kills': int(row['Kills']),
+                    'deaths': int(row['Deaths']),
+                    'assists': int(row['Assists']),
+                }
+                for _, row in recent.iterrows()
+            ],
+        }
+
+    summaries = sorted(
+        (
+            {
+                'id': profile['id'],
+                'name': profile['name'],
+                'current_team': profile['current_team'],
+                'average_rating': profile['career_stats']['rating'],
+                'average_acs': profile['career_stats']['acs'],
+                'kd_ratio': profile['career_stats']['kd_ratio'],
+                'total_rounds': profile['career_stats']['rounds'],
+                'total_kills': profile['career_stats']['kills'],
+                'agents': [a['agent'] for a in profile['agents']],
+            }
+            for profile in profiles.values()
+        ),
+        key=lambda p: p['average_rating'] or 0,
+        reverse=True
+    )
+
+    aliases = {}
+    for player, profile in profiles.items():
+        aliases[player.lower()] = player
+        aliases[profile['id']] = player
+    return {'profiles': profiles, 'summaries': summaries, 'aliases': aliases}
+
+register_derived('player_profiles', build_player_profiles)
+
 class PlayerService:
     def __init__(self):
-        pass
+        self.search_service = SearchService()
     
+    @instrument
+    @single_flight
     def get_all_players_with_map_stats(self, match_id):
         """Get all players with map-segregated statistics"""
-        print(f"Fetching players for match_id: {match_id}")
-        scores_df = get_data('scores')
-        players_stats_df = get_data('players_stats')
+        logger.debug("Fetching players for match_id: %s", match_id)
+        storage = get_storage()
         maps_played_df = get_data('maps_played')
         
         # Get match details to filter players and maps
-        match_row = scores_df[scores_df['match_id'] == match_id]
+        match_row = storage.select('scores', {'match_id': [match_id]})
         if match_row.empty:
-            print(f"❌ [PLAYER_SERVICE] Match ID {match_id} not found")
+            logger.warning("❌ Match ID %s not found", match_id)
             return []
             
         match_row = match_row.iloc[0]
@@ -28,61 +132,62 @@ class PlayerService:
         team_a = match_row['Team A']
         team_b = match_row['Team B']
         
-        print(f"📊 Match Details: {match_name} ({match_type}) - {team_a} vs {team_b}")
+        logger.debug("📊 Match Details: %s (%s) - %s vs %s", match_name, match_type, team_a, team_b)
         
         # Filter players to only those in the playing teams
         # This prevents fetching every player who played in this tournament stage
-        relevant_players_df = players_stats_df[
-            (players_stats_df['Tournament'] == tournament) &
-            (players_stats_df['Stage'] == stage) &
-            (players_stats_df['Match Type'] == match_type) &
-            (players_stats_df['Teams'].isin([team_a, team_b]))
-        ]
+        with timer("filter"):
+            relevant_players_df = storage.select('players_stats', {
+                'Tournament': [tournament],
+                'Stage': [stage],
+                'Match Type': [match_type],
+                'Teams': [team_a, team_b],
+            })
         
         unique_players = relevant_players_df['Player'].unique()
         players_list = []
         
-
-        for player_name in unique_players:
-            player_data = relevant_players_df[relevant_players_df['Player'] == player_name]
+        with timer("aggregate"):
+            for player_name in unique_players:
+                player_data = relevant_players_df[relevant_players_df['Player'] == player_name]
             
-            # Get player's team (most recent or most common)
-            teams = player_data['Teams'].value_counts()
-            current_team = teams.index[0] if not teams.empty else 'Unknown'
+                # Get player's team (most recent or most common)
+                teams = player_data['Teams'].value_counts()
+                current_team = teams.index[0] if not teams.empty else 'Unknown'
             
-            # Aggregate overall stats
-            total_rounds = player_data['Rounds Played'].sum()
-            total_kills = player_data['Kills'].sum()
-            total_deaths = player_data['Deaths'].sum()
-            total_assists = player_data['Assists'].sum()
+                # Aggregate overall stats
+                total_rounds = player_data['Rounds Played'].sum()
+                total_kills = player_data['Kills'].sum()
+                total_deaths = player_data['Deaths'].sum()
+                total_assists = player_data['Assists'].sum()
             
-            # Calculate average rating (weighted by rounds played)
-            if total_rounds > 0:
-                weighted_rating = (player_data['Rating'] * player_data['Rounds Played']).sum() / total_rounds
-                avg_acs = (player_data['Average Combat Score'] * player_data['Rounds Played']).sum() / total_rounds
-            else:
-                weighted_rating = 0
-                avg_acs = 0
+                # Calculate average rating (weighted by rounds played)
+                if total_rounds > 0:
+                    weighted_rating = (player_data['Rating'] * player_data['Rounds Played']).sum() / total_rounds
+                    avg_acs = (player_data['Average Combat Score'] * player_data['Rounds Played']).sum() / total_rounds
+                else:
+                    weighted_rating = 0
+                    avg_acs = 0
             
-            # Get map-specific stats
-            map_stats = self._get_player_map_stats(player_name, player_data, maps_played_df, match_name)
+                # Get map-specific stats
+                map_stats = self._get_player_map_stats(player_name, player_data, maps_played_df, match_name)
          
-            player_info = {
-                'id': player_name.lower().replace(' ', '-'),
-                'name': player_name,
-                'current_team': current_team,
-                'average_rating': round(float(weighted_rating), 2),
-                'average_acs': round(float(avg_acs), 2),
-                'total_rounds': int(total_rounds),
-                'total_kills': int(total_kills),
-                'total_deaths': int(total_deaths),
-                'total_assists': int(total_assists),
-                'kd_ratio': round(total_kills / max(total_deaths, 1), 2),
-                'map_stats': map_stats
-            }
+                player_info = {
+                    'id': player_name.lower().replace(' ', '-'),
+                    'name': player_name,
+                    'current_team': current_team,
+                    'average_rating': round(float(weighted_rating), 2),
+                    'average_acs': round(float(avg_acs), 2),
+                    'total_rounds': int(total_rounds),
+                    'total_kills': int(total_kills),
+                    'total_deaths': int(total_deaths),
+                    'total_assists': int(total_assists),
+                    'kd_ratio': round(total_kills / max(total_deaths, 1), 2),
+                    'map_stats': map_stats
+                }
             
-            players_list.append(player_info)
-        
+                players_list.append(player_info)
+
         # Sort by average rating descending
         players_list.sort(key=lambda x: x['average_rating'], reverse=True)
         
@@ -112,7 +217,7 @@ class PlayerService:
             apr = row.get('Assists Per Round', 0)
             fkpr = row.get('First Kills Per Round', 0)
             fdpr = row.get('First Deaths Per Round', 0)
-            headshot_pct = row.get('Headshot %', '0%').replace('%', '')
+            headshot_pct = row.get('Headshot %', 0)
             
             # Find which map this row corresponds to
             # We match based on Tournament, Stage, Match Type AND Match Name
@@ -124,7 +229,8 @@ class PlayerService:
             ]
             
             if matching_maps.empty and processed_rows <= 3:
-                print(f"    ⚠️ [MAP_STATS] No matching maps for {player_name}: {tournament} | {stage} | {match_type} | {match_name}")
+                logger.debug("⚠️ No matching maps for %s: %s | %s | %s | %s",
+                             player_name, tournament, stage, match_type, match_name)
             
             # If we have a single agent (not comma-separated), try to match to specific map
             # Otherwise, aggregate across all maps for this match
@@ -166,7 +272,7 @@ class PlayerService:
                     map_stats[map_name_val]['apr_values'].append(float(apr) if pd.notna(apr) else 0)
                     map_stats[map_name_val]['fkpr_values'].append(float(fkpr) if pd.notna(fkpr) else 0)
                     map_stats[map_name_val]['fdpr_values'].append(float(fdpr) if pd.notna(fdpr) else 0)
-                    map_stats[map_name_val]['headshot_pcts'].append(float(headshot_pct) if pd.notna(headshot_pct) and headshot_pct != '' else 0)
+                    map_stats[map_name_val]['headshot_pcts'].append(float(headshot_pct) if pd.notna(headshot_pct) else 0)
                     
                     if agents not in map_stats[map_name_val]['agents_played']:
                         map_stats[map_name_val]['agents_played'].append(str(agents))
@@ -210,7 +316,7 @@ class PlayerService:
                     map_stats[map_name_val]['apr_values'].append(float(apr) if pd.notna(apr) else 0)
                     map_stats[map_name_val]['fkpr_values'].append(float(fkpr) if pd.notna(fkpr) else 0)
                     map_stats[map_name_val]['fdpr_values'].append(float(fdpr) if pd.notna(fdpr) else 0)
-                    map_stats[map_name_val]['headshot_pcts'].append(float(headshot_pct) if pd.notna(headshot_pct) and headshot_pct != '' else 0)
+                    map_stats[map_name_val]['headshot_pcts'].append(float(headshot_pct) if pd.notna(headshot_pct) else 0)
                     
                     # Add unique agents
                     for agent in str(agents).split(','):
@@ -241,12 +347,29 @@ class PlayerService:
        
         return result
     
+    @instrument
+    def get_players_detailed(self):
+        """Get all players with precomputed career metadata, best rating first"""
+        return get_derived('player_profiles')['summaries']
+
+    @instrument
+    def get_player_profile(self, player_name):
+        """Get a player profile by name or id (case-insensitive)"""
+        player_profiles = get_derived('player_profiles')
+        player = player_profiles['aliases'].get(player_name.strip().lower())
+        return player_profiles['profiles'].get(player) if player else None
+
+    @instrument
+    @single_flight
     def get_player_timeseries(self, player_name):
         """Get comprehensive player time series data"""
-        player_matches = self._get_player_matches(player_name)
+        player_name = self.search_service.resolve_player(player_name)
+        with timer("filter"):
+            player_matches = self._get_player_matches(player_name)
         if not player_matches:
             return None
-        timeseries_data = self._process_player_timeseries(player_name, player_matches)
+        with timer("aggregate"):
+            timeseries_data = self._process_player_timeseries(player_name, player_matches)
         
         return {
             "player": player_name,
@@ -256,14 +379,20 @@ class PlayerService:
             }
         }
     
+    @instrument
+    @single_flight
+    @persistent
     def compare_players(self, player_names):
         """Compare multiple players"""
         comparison_data = {}
+        player_names = [self.search_service.resolve_player(player) for player in player_names]
         
         for player in player_names:
-            player_matches = self._get_player_matches(player)
+            with timer("filter"):
+                player_matches = self._get_player_matches(player)
             if player_matches:
-                comparison_data[player] = self._process_player_timeseries(player, player_matches)
+                with timer("aggregate"):
+                    comparison_data[player] = self._process_player_timeseries(player, player_matches)
         
         return {
             "players": comparison_data,
@@ -277,29 +406,28 @@ class PlayerService:
     
     def _get_player_matches(self, player_name):
         """Get all matches for a player"""
-        rounds_kills_df = get_data('rounds_kills')
-        scores_df = get_data('scores')
-        
-        player_rounds = rounds_kills_df[
-            (rounds_kills_df['Eliminator'] == player_name) | 
-            (rounds_kills_df['Eliminated'] == player_name)
-        ]
-        
-        if player_rounds.empty:
+        events = get_derived('kill_events')
+        multi_kill = get_derived('highlights').multi_kill
+        player_events = events.events_of_player(player_name)
+        if not len(player_events):
             return []
-        
+
+        # Group the player's events by match name, in order of first appearance
+        match_keys = [events.matches[code] for code in events.match[player_events].tolist()]
+        grouped = {}
+        for position, key in zip(player_events.tolist(), match_keys):
+            grouped.setdefault(key[3], (key, []))[1].append(position)
+
         matches = []
-        for match_name in player_rounds['Match Name'].unique():
-            match_rounds = player_rounds[player_rounds['Match Name'] == match_name]
-            
-            match_data = {
+        for match_name, ((tournament, stage, match_type, _), positions) in grouped.items():
+            matches.append({
                 "match_name": match_name,
-                "match_type": match_rounds['Match Type'].iloc[0],
-                "tournament": match_rounds['Tournament'].iloc[0],
-                "stage": match_rounds['Stage'].iloc[0],
-                "rounds_data": match_rounds
-            }
-            matches.append(match_data)
+                "match_type": match_type,
+                "tournament": tournament,
+                "stage": stage,
+                "rounds_data": events.decode(positions),
+                "multi_kill": multi_kill[positions].tolist()
+            })
         
         return matches
     
@@ -320,17 +448,23 @@ class PlayerService:
         # Process each match
         for match_idx, match in enumerate(player_matches):
             match_data = match["rounds_data"]
+            # (map, round, kill, death, multi-kill) per event the player took part in
+            player_events = [
+                (map_name, round_num, eliminator == player_name, eliminated == player_name,
+                 eliminator == player_name and multi_kill)
+                for map_name, round_num, eliminator, eliminated, multi_kill in zip(
+                    match_data['map'], match_data['round'], match_data['eliminator'],
+                    match_data['eliminated'], match["multi_kill"]
+                )
+            ]
             
             # Overall match stats
-            player_kills = len(match_data[match_data['Eliminator'] == player_name])
-            player_deaths = len(match_data[match_data['Eliminated'] == player_name])
+            player_kills = sum(event[2] for event in player_events)
+            player_deaths = sum(event[3] for event in player_events)
             kd_ratio = player_kills / max(player_deaths, 1)
             
             # Multi-kills in this match
-            multi_kills = len(match_data[
-                (match_data['Eliminator'] == player_name) & 
-                (match_data['Kill Type'].isin(['2k', '3k', '4k', '5k']))
-            ])
+            multi_kills = sum(event[4] for event in player_events)
             
             match_progression = {
                 "match_index": match_idx,
@@ -345,17 +479,14 @@ class PlayerService:
             }
             
             # ✅ NEW: Process each map in this match
-            for map_name in match_data['Map'].unique():
-                map_data = match_data[match_data['Map'] == map_name]
-                map_kills = len(map_data[map_data['Eliminator'] == player_name])
-                map_deaths = len(map_data[map_data['Eliminated'] == player_name])
+            for map_name in dict.fromkeys(match_data['map']):
+                map_data = [event for event in player_events if event[0] == map_name]
+                map_kills = sum(event[2] for event in map_data)
+                map_deaths = sum(event[3] for event in map_data)
                 map_kd = map_kills / max(map_deaths, 1)
                 
                 # Get multi-kills on this map
-                map_multi_kills = len(map_data[
-                    (map_data['Eliminator'] == player_name) & 
-                    (map_data['Kill Type'].isin(['2k', '3k', '4k', '5k']))
-                ])
+                map_multi_kills = sum(event[4] for event in map_data)
                 
                 map_performance = {
                     "map": map_name,
@@ -369,15 +500,13 @@ class PlayerService:
                 }
                 
                 # ✅ NEW: Process each round in this map
-                for round_num in sorted(map_data['Round Number'].unique()):
-                    round_data = map_data[map_data['Round Number'] == round_num]
-                    round_kills = len(round_data[round_data['Eliminator'] == player_name])
-                    round_deaths = len(round_data[round_data['Eliminated'] == player_name])
+                for round_num in sorted({event[1] for event in map_data}):
+                    round_data = [event for event in map_data if event[1] == round_num]
+                    round_kills = sum(event[2] for event in round_data)
+                    round_deaths = sum(event[3] for event in round_data)
                     
                     # Check for multi-kill in this round
-                    round_multi_kill = any(round_data[
-                        round_data['Eliminator'] == player_name
-                    ]['Kill Type'].isin(['2k', '3k', '4k', '5k']))
+                    round_multi_kill = any(event[4] for event in round_data)
                     
                     # Clutch situation: player got kills, survived, and got 2+ kills
                     clutch_situation = (round_kills >= 2 and round_deaths == 0)
@@ -405,11 +534,11 @@ class PlayerService:
             timeseries["performance_metrics"]["deaths_per_match"].append(int(player_deaths))
             timeseries["performance_metrics"]["kd_ratio"].append(float(kd_ratio))
         
-        # Calculate consistency score
-        kd_values = timeseries["performance_metrics"]["kd_ratio"]
-        if len(kd_values) > 1:
-            consistency = 1 / (1 + float(np.var(kd_values)))
-            timeseries["performance_metrics"]["consistency_score"] = round(consistency, 3)
+        # Consistency and form curves are precomputed for every player at load
+        player_form = get_derived('player_form').get(player_name)
+        if player_form is not None:
+            timeseries["performance_metrics"]["consistency_score"] = player_form["consistency_score"]
+            timeseries["form"] = player_form["form"]
         
         return timeseries
 
@@ -0,0 +1,157 @@
+from bisect import bisect_left
+from itertools import combinations
+from config import SEARCH_MAX_EDIT_DISTANCE, SEARCH_RESULT_LIMIT, get_data, get_derived, register_derived
+from utils.helpers import normalize_name, player_match_totals
+from utils.instrumentation import instrument
+import services.kill_event_store  # noqa: F401 -- registers kill_events, whose players are indexed
+
+
+ENTITY_TYPES = ('player', 'team')
+
+
+def _max_distance(query):
+    """Edit distance allowed for a query: none for very short ones, growing with length"""
+    if len(query) < 3:
+        return 0
+    return min(SEARCH_MAX_EDIT_DISTANCE, 1 if len(query) < 6 else 2)
+
+
+def _deletes(word, distance):
+    """Every string obtained by deleting up to `distance` characters of word"""
+    variants = {word}
+    for count in range(1, min(distance, len(word)) + 1):
+        for positions in combinations(range(len(word)), count):
+            variants.add(''.join(char for i, char in enumerate(word) if i not in positions))
+    return variants
+
+
+def _edit_distance(a, b, limit):
+    """Levenshtein distance of a and b, or limit + 1 once it is known to exceed limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class SearchIndex:
+    """Normalized player and team names for type-ahead lookups.
+
+    Prefix lookups bisect a sorted array of (key, entry) pairs, where the keys of
+    an entry are its full name, each word of it and, for teams, the abbreviation.
+    Fuzzy lookups use a deletion index (every key with up to
+    SEARCH_MAX_EDIT_DISTANCE characters removed), so candidates are found by
+    dictionary hits and only those are checked with a bounded edit distance.
+    """
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.names = {(entry['type'], entry['name']) for entry in entries}
+        self.exact = {}
+        keyed = set()
+        for position, entry in enumerate(entries):
+            names = [entry['name']] + ([entry['abbreviation']] if entry.get('abbreviation') else [])
+            for name in names:
+                key = normalize_name(name)
+                self.exact.setdefault((entry['type'], key), position)
+                keyed.add((key, position))
+                keyed.update((word, position) for word in key.split()[1:])
+        self.keys = sorted(keyed)
+        self.deletes = {}
+        for key, position in self.keys:
+            for variant in _deletes(key, SEARCH_MAX_EDIT_DISTANCE):
+                self.deletes.setdefault(variant, set()).add((key, position))
+
+    def resolve(self, entity_type, name):
+        """Canonical name of an exact (normalized) match, or None"""
+        if (entity_type, name) in self.names:
+            return name
+        position = self.exact.get((entity_type, normalize_name(name)))
+        return self.entries[position]['name'] if position is not None else None
+
+    def prefix(self, query, entity_type, limit, seen):
+        matches = []
+        for i in range(bisect_left(self.keys, (query,)), len(self.keys)):
+            key, position = self.keys[i]
+            if len(matches) >= limit or not key.startswith(query):
+                break
+            if position in seen or (entity_type and self.entries[position]['type'] != entity_type):
+                continue
+            seen.add(position)
+            matches.append((position, 'exact' if key == query else 'prefix', 0))
+        return matches
+
+    def fuzzy(self, query, entity_type, limit, seen):
+        distance = _max_distance(query)
+        if not distance:
+            return []
+        candidates = {}
+        for variant in _deletes(query, distance):
+            for key, position in self.deletes.get(variant, ()):
+                if position in seen or (entity_type and self.entries[position]['type'] != entity_type):
+                    continue
+                found = _edit_distance(query, key, distance)
+                if found <= distance and found < candidates.get(position, (distance + 1,))[0]:
+                    candidates[position] = (found, key)
+        ranked = sorted(candidates.items(), key=lambda item: (item[1][0], item[1][1]))[:limit]
+        seen.update(position for position, _ in ranked)
+        return [(position, 'fuzzy', found) for position, (found, _) in ranked]
+
+
+def build_search_index():
+    """Index player names (stats and kill events) and team names and abbreviations"""
+    events = get_derived('kill_events')
+    totals = player_match_totals(get_data('players_stats'))
+    # Team a player played the most rounds for, as in player profiles
+    team_rounds = totals.groupby(['Player', 'Teams'])['Rounds Played'].sum().sort_values(ascending=False, kind='stable')
+    current_teams = {}
+    for player, team in team_rounds.index:
+        current_teams.setdefault(player, team)
+
+    entries = []
+    for player in sorted(set(current_teams) | set(events.players[:-1].tolist())):
+        entries.append({'type': 'player', 'name': player, 'team': current_teams.get(player)})
+
+    team_mapping_df = get_data('team_mapping')
+    abbreviations = dict(zip(team_mapping_df['Full Name'], team_mapping_df['Abbreviated']))
+    teams = set(totals['Teams']) | set(events.teams[:-1].tolist()) | set(abbreviations)
+    for team in sorted(teams):
+        abbreviation = abbreviations.get(team)
+        entries.append({'type': 'team', 'name': team,
+                        'abbreviation': str(abbreviation) if abbreviation is not None else None})
+    return SearchIndex(entries)
+
+
+register_derived('search_index', build_search_index)
+
+
+class SearchService:
+    def resolve_player(self, player_name):
+        """Canonical spelling of a player name, ignoring case and accents (unchanged if unknown)"""
+        return get_derived('search_index').resolve('player', player_name) or player_name
+
+    @instrument
+    def search(self, query, entity_type=None, limit=SEARCH_RESULT_LIMIT):
+        """Players and teams whose name, a word of it or abbreviation starts with or nearly matches query"""
+        if entity_type is not None and entity_type not in ENTITY_TYPES:
+            raise ValueError(f"Unknown type '{entity_type}', expected one of: {', '.join(ENTITY_TYPES)}")
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+
+        index = get_derived('search_index')
+        normalized = normalize_name(query)
+        results = []
+        if normalized:
+            seen = set()
+            matches = index.prefix(normalized, entity_type, limit, seen)
+            if len(matches) < limit:
+                matches += index.fuzzy(normalized, entity_type, limit - len(matches), seen)
+            for position, match, distance in matches:
+                results.append({**index.entries[position], 'match': match, 'distance': distance})
+        return {'query': query, 'results': results}
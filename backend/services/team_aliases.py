@@ -0,0 +1,23 @@
+from config import get_data, get_derived, register_derived
+
+
+def build_team_aliases():
+    """Lower-cased full names and abbreviations -> canonical team name"""
+    scores_df = get_data('scores')
+    team_mapping_df = get_data('team_mapping')
+    abbreviations = dict(zip(team_mapping_df['Full Name'], team_mapping_df['Abbreviated']))
+
+    aliases = {}
+    for team, abbreviation in abbreviations.items():
+        aliases[str(abbreviation).lower()] = team
+    for team in set(scores_df['Team A']) | set(scores_df['Team B']) | set(abbreviations):
+        aliases[team.lower()] = team
+    return aliases
+
+
+register_derived('team_aliases', build_team_aliases)
+
+
+def resolve_team(team_name):
+    """Canonical name of a team from its full name or abbreviation (case-insensitive), or None"""
+    return get_derived('team_aliases').get(team_name.strip().lower())
@@ -0,0 +1,188 @@
+import numpy as np
+import pandas as pd
+from config import get_data, get_derived, register_derived
+from services.eco_service import EcoService
+from services.team_aliases import resolve_team
+from utils.helpers import player_match_totals, aggregate_player_stats, player_stats_summary, safe_divide
+from utils.instrumentation import instrument
+
+
+RECENT_MATCHES = 5
+
+
+def _rate(won, played):
+    return round(float(safe_divide(won, played)), 3)
+
+
+def _team_match_rows(scores_df):
+    """Scores from each team's perspective: one row per (match, team)"""
+    winners = scores_df['Match Result'].str.replace(' won', '', regex=False)
+    sides = []
+    for team, opponent, own, other in (('Team A', 'Team B', 'Team A Score', 'Team B Score'),
+                                        ('Team B', 'Team A', 'Team B Score', 'Team A Score')):
+        sides.append(pd.DataFrame({
+            'order': np.arange(len(scores_df)),
+            'team': scores_df[team].to_numpy(),
+            'opponent': scores_df[opponent].to_numpy(),
+            'maps_won': scores_df[own].to_numpy(),
+            'maps_lost': scores_df[other].to_numpy(),
+            'won': (winners == scores_df[team]).to_numpy(),
+            'match_id': scores_df['match_id'].to_numpy(),
+            'match_name': scores_df['Match Name'].to_numpy(),
+            'stage': scores_df['Stage'].to_numpy(),
+            'match_type': scores_df['Match Type'].to_numpy(),
+            'tournament': scores_df['Tournament'].to_numpy(),
+        }))
+    return pd.concat(sides, ignore_index=True).sort_values(['order', 'team'], kind='stable')
+
+
+def _team_map_rows(maps_scores_df):
+    """Map scores from each team's perspective: one row per (map played, team)"""
+    sides = []
+    for own, other in (('Team A', 'Team B'), ('Team B', 'Team A')):
+        sides.append(pd.DataFrame({
+            'team': maps_scores_df[own].to_numpy(),
+            'map': maps_scores_df['Map'].to_numpy(),
+            'rounds_won': maps_scores_df[f'{own} Score'].to_numpy(),
+            'rounds_lost': maps_scores_df[f'{other} Score'].to_numpy(),
+            'attack_won': maps_scores_df[f'{own} Attacker Score'].to_numpy(),
+            'attack_lost': maps_scores_df[f'{other} Defender Score'].to_numpy(),
+            'defense_won': maps_scores_df[f'{own} Defender Score'].to_numpy(),
+            'defense_lost': maps_scores_df[f'{other} Attacker Score'].to_numpy(),
+            'overtime_won': maps_scores_df[f'{own} Overtime Score'].to_numpy(),
+            'map_won': (maps_scores_df[f'{own} Score'] > maps_scores_df[f'{other} Score']).to_numpy(),
+        }))
+    return pd.concat(sides, ignore_index=True)
+
+
+def build_team_profiles():
+    """Precompute team profiles and summaries so profile requests are dict lookups"""
+    scores_df = get_data('scores')
+    maps_scores_df = get_data('maps_scores')
+    players_stats_df = get_data('players_stats')
+    team_mapping_df = get_data('team_mapping')
+
+    abbreviations = dict(zip(team_mapping_df['Full Name'], team_mapping_df['Abbreviated']))
+    match_rows = _team_match_rows(scores_df)
+    map_rows = _team_map_rows(maps_scores_df)
+    eco_service = EcoService()
+
+    totals = player_match_totals(players_stats_df)
+    roster_stats = aggregate_player_stats(totals, ['Teams', 'Player'])
+    team_stats = aggregate_player_stats(totals, ['Teams'])
+    team_stats = team_stats.set_index('Teams')
+
+    match_totals = match_rows.groupby('team').agg(
+        matches=('won', 'size'), wins=('won', 'sum'), maps_won=('maps_won', 'sum'), maps_lost=('maps_lost', 'sum')
+    )
+    side_totals = map_rows.groupby('team').sum(numeric_only=True)
+    per_map = map_rows.groupby(['team', 'map']).agg(
+        played=('map_won', 'size'), won=('map_won', 'sum'),
+        rounds_won=('rounds_won', 'sum'), rounds_lost=('rounds_lost', 'sum'),
+        attack_won=('attack_won', 'sum'), attack_lost=('attack_lost', 'sum'),
+        defense_won=('defense_won', 'sum'), defense_lost=('defense_lost', 'sum'),
+    ).reset_index()
+
+    teams = sorted(set(match_rows['team']) | set(abbreviations))
+    profiles = {}
+    for team in teams:
+        record = match_totals.loc[team] if team in match_totals.index else None
+        matches = int(record['matches']) if record is not None else 0
+        wins = int(record['wins']) if record is not None else 0
+
+        sides = side_totals.loc[team] if team in side_totals.index else None
+        attack_won = int(sides['attack_won']) if sides is not None else 0
+        attack_played = attack_won + (int(sides['attack_lost']) if sides is not None else 0)
+        defense_won = int(sides['defense_won']) if sides is not None else 0
+        defense_played = defense_won + (int(sides['defense_lost']) if sides is not None else 0)
+
+        team_maps = per_map[per_map['team'] == team]
+        map_performance = [
+            {
+                'map': m.map,
+                'played': int(m.played),
+                'won': int(m.won),
+                'win_rate': _rate(m.won, m.played),
+                'rounds_won': int(m.rounds_won),
+                'rounds_lost': int(m.rounds_lost),
+                'attack_win_rate': _rate(m.attack_won, m.attack_won + m.attack_lost),
+                'defense_win_rate': _rate(m.defense_won, m.defense_won + m.defense_lost),
+            }
+            for m in team_maps.sort_values(['played', 'won'], ascending=False).itertuples(index=False)
+        ]
+
+        team_matches = match_rows[match_rows['team'] == team]
+        recent_matches = [
+            {
+                'match_id': m.match_id,
+                'match_name': m.match_name,
+                'opponent': m.opponent,
+                'result': 'win' if m.won else 'loss',
+                'score': f'{int(m.maps_won)}-{int(m.maps_lost)}',
+                'stage': m.stage,
+                'match_type': m.match_type,
+            }
+            for m in team_matches.iloc[::-1].head(RECENT_MATCHES).itertuples(index=False)
+        ]
+
+        roster = roster_stats[roster_stats['Teams'] == team].sort_values('Rating', ascending=False)
+        players = [{'name': row['Player'], **player_stats_summary(row)} for _, row in roster.iterrows()]
+
+        average_rating = None
+        if team in team_stats.index and pd.notna(team_stats.loc[team, 'Rating']):
+            average_rating = round(float(team_stats.loc[team, 'Rating']), 2)
+
+        profiles[team] = {
+            'name': team,
+            'abbreviation': abbreviations.get(team),
+            'matches_played': matches,
+            'wins': wins,
+            'losses': matches - wins,
+            'win_rate': _rate(wins, matches),
+            'maps_played': int(len(map_rows[map_rows['team'] == team])),
+            'maps_won': int(record['maps_won']) if record is not None else 0,
+            'map_win_rate': _rate(record['maps_won'], record['maps_won'] + record['maps_lost']) if record is not None else 0.0,
+            'rounds': {
+                'won': int(sides['rounds_won']) if sides is not None else 0,
+                'lost': int(sides['rounds_lost']) if sides is not None else 0,
+                'attack_won': attack_won,
+                'attack_played': attack_played,
+                'attack_win_rate': _rate(attack_won, attack_played),
+                'defense_won': defense_won,
+                'defense_played': defense_played,
+                'defense_win_rate': _rate(defense_won, defense_played),
+                'overtime_won': int(sides['overtime_won']) if sides is not None else 0,
+            },
+            'eco': (eco_service.get_team_conversion(team) or {}).get('buy_types', {}),
+            'average_rating': average_rating,
+            'players': players,
+            'map_performance': map_performance,
+            'recent_matches': recent_matches,
+        }
+
+    summary_keys = ('name', 'abbreviation', 'matches_played', 'wins', 'losses', 'win_rate',
+                    'maps_played', 'maps_won', 'map_win_rate', 'average_rating')
+    summaries = sorted(
+        ({key: profile[key] for key in summary_keys} | {'player_count': len(profile['players'])}
+         for profile in profiles.values()),
+        key=lambda t: (t['win_rate'], t['matches_played']),
+        reverse=True
+    )
+
+    return {'profiles': profiles, 'summaries': summaries}
+
+
+register_derived('team_profiles', build_team_profiles)
+
+
+class TeamService:
+    @instrument
+    def get_teams_detailed(self):
+        """Get all teams with precomputed metadata, best record first"""
+        return get_derived('team_profiles')['summaries']
+
+    @instrument
+    def get_team_profile(self, team_name):
+        """Get a team profile by full name or abbreviation (case-insensitive)"""
+        team = resolve_team(team_name)
+        return get_derived('team_profiles')['profiles'].get(team) if team else None
@@ -0,0 +1,98 @@
+import threading
+import weakref
+from collections import OrderedDict
+
+
+# Every live cache, so /metrics can report hit rates without services registering them
+_caches = weakref.WeakSet()
+
+
+def cache_stats():
+    """Stats of every live LRUCache, ordered by name"""
+    return sorted((cache.stats() for cache in list(_caches)), key=lambda stats: stats["name"])
+
+
+class LRUCache:
+    """Small thread-safe LRU cache used to memoize service results"""
+
+    def __init__(self, name, maxsize=128):
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # Measured sizes of entries (see nbytes), dropped when an entry changes or leaves
+        self._sizes = {}
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._sizes.pop(key, None)
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                self._sizes.pop(evicted, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+
+    def nbytes(self, sizeof):
+        """Total size of the cached values as measured by sizeof.
+
+        Each entry is measured once, except values reporting their own nbytes
+        (which may grow, like responses gaining compressed variants).
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+        total = 0
+        for key, value in entries:
+            size = getattr(value, "nbytes", None)
+            if size is None:
+                size = self._sizes.get(key)
+            if size is None:
+                size = sizeof(value)
+                with self._lock:
+                    if self._entries.get(key) is value:
+                        self._sizes[key] = size
+            total += size
+        return total
+
+    def evict_oldest(self, sizeof):
+        """Drop the least recently used entry and return its size (0 when empty)"""
+        with self._lock:
+            if not self._entries:
+                return 0
+            key, value = self._entries.popitem(last=False)
+            size = self._sizes.pop(key, None)
+        if size is None:
+            size = getattr(value, "nbytes", None)
+        return size if size is not None else sizeof(value)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,149 @@
+import gzip
+
+from flask import g, request
+
+from config import (
+    COMPRESSION_BROTLI_QUALITY, COMPRESSION_ENABLED, COMPRESSION_GZIP_LEVEL, COMPRESSION_MIN_BYTES,
+    RESPONSE_CACHE_SIZE, get_data_version,
+)
+from utils.cache import LRUCache
+from utils.instrumentation import metrics
+from utils.precomputed import read_precomputed
+
+try:
+    import brotli
+except ImportError:  # optional, gzip only without it
+    brotli = None
+
+
+# Endpoints whose responses depend only on the URL and the loaded data, so the
+# serialized (and compressed) body can be replayed for repeat requests
+CACHED_ENDPOINTS = {
+    "match.get_match_details",
+    "match.get_round_analysis",
+    "match.get_matches_full",
+    "player.get_players",
+    "player.get_player_timeseries",
+    "player.get_players_comparison",
+    "analytics.get_correlations",
+    "data.aggregate_dataset",
+    "eco.get_eco_match",
+}
+COMPRESSIBLE_MIMETYPES = {"application/json", "text/csv", "text/plain", "application/x-ndjson"}
+
+
+def _gzip(body):
+    return gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def _brotli(body):
+    return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+
+
+# Server preference order when the client accepts several equally
+ENCODERS = {"br": _brotli, "gzip": _gzip} if brotli is not None else {"gzip": _gzip}
+
+
+def negotiate_encoding():
+    """Best encoding the client accepts, or None for identity"""
+    return request.accept_encodings.best_match(list(ENCODERS))
+
+
+class CachedResponse:
+    """A serialized response plus its compressed variants, filled in as clients ask for them"""
+
+    def __init__(self, body, mimetype):
+        self.body = body
+        self.mimetype = mimetype
+        self.encoded = {}
+
+    @property
+    def nbytes(self):
+        return len(self.body) + sum(len(body) for body in self.encoded.values())
+
+    def encode(self, encoding):
+        if encoding not in self.encoded:
+            self.encoded[encoding] = _encode(self.body, encoding)
+        return self.encoded[encoding]
+
+
+def _encode(body, encoding):
+    encoded = ENCODERS[encoding](body)
+    metrics.inc("valorant_compression_bytes_total", {"encoding": encoding, "direction": "in"}, len(body),
+                help="Response bytes before and after compression")
+    metrics.inc("valorant_compression_bytes_total", {"encoding": encoding, "direction": "out"}, len(encoded))
+    return encoded
+
+
+response_cache = LRUCache("responses", maxsize=RESPONSE_CACHE_SIZE)
+
+
+def _cache_key():
+    return (request.path, tuple(sorted(request.args.items(multi=True))), get_data_version())
+
+
+def _precomputed_entry(key):
+    """Cache entry from the body precompute.py wrote for this URL, if any"""
+    path, args, version = key
+    body = read_precomputed(version, path, args)
+    if body is None:
+        return None
+    metrics.inc("valorant_precomputed_hits_total", help="Responses served from precomputed bodies")
+    entry = CachedResponse(body, "application/json")
+    response_cache.set(key, entry)
+    return entry
+
+
+def _compressible(response):
+    return (
+        not response.is_streamed
+        and response.status_code == 200
+        and "Content-Encoding" not in response.headers
+        and response.mimetype in COMPRESSIBLE_MIMETYPES
+    )
+
+
+def _set_body(response, body, encoding):
+    response.set_data(body)
+    response.vary.add("Accept-Encoding")
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+
+
+def init_app(app):
+    """Negotiate gzip/brotli response compression and replay cached responses of CACHED_ENDPOINTS"""
+    if not COMPRESSION_ENABLED:
+        return
+
+    @app.before_request
+    def _replay_cached():
+        # ?profile=1 must run the view to profile it
+        if request.method != "GET" or request.endpoint not in CACHED_ENDPOINTS or "profile" in request.args:
+            return None
+        key = _cache_key()
+        entry = response_cache.get(key) or _precomputed_entry(key)
+        if entry is None:
+            g.response_cache_key = key
+            return None
+        response = app.response_class(mimetype=entry.mimetype)
+        encoding = negotiate_encoding() if len(entry.body) >= COMPRESSION_MIN_BYTES else None
+        _set_body(response, entry.encode(encoding) if encoding else entry.body, encoding)
+        return response
+
+    @app.after_request
+    def _compress(response):
+        key = g.pop("response_cache_key", None)
+        if not _compressible(response):
+            return response
+        entry = None
+        if key is not None:
+            entry = CachedResponse(response.get_data(), response.mimetype)
+            response_cache.set(key, entry)
+
+        body = response.get_data()
+        encoding = negotiate_encoding() if len(body) >= COMPRESSION_MIN_BYTES else None
+        if encoding:
+            _set_body(response, entry.encode(encoding) if entry else _encode(body, encoding), encoding)
+        else:
+            response.vary.add("Accept-Encoding")
+        return response
@@ -0,0 +1,127 @@
+import threading
+import time
+from collections import Counter
+
+from flask import g, jsonify, request
+
+from config import ROUTE_QUEUE_LIMIT, ROUTE_QUEUE_TIMEOUT_SECONDS
+from utils.instrumentation import metrics
+
+
+# Concurrent requests allowed per CPU-heavy endpoint. Endpoints not listed are
+# cheap dict lookups and are never queued.
+HEAVY_ENDPOINTS = {
+    "match.get_matches_full": 1,
+    "analytics.get_player_clustering": 2,
+    "analytics.get_match_predictions": 2,
+    "player.get_players_comparison": 2,
+    "data.export_dataset": 2,
+    "player.get_player_timeseries": 4,
+    "player.get_players": 4,
+    "match.get_round_analysis": 4,
+    "match.get_match_details": 4,
+    "data.aggregate_dataset": 4,
+    "analytics.get_correlations": 4,
+}
+RETRY_AFTER_SECONDS = 1
+
+
+class RouteGate:
+    """Per-endpoint concurrency caps with a bounded, time-limited wait queue"""
+
+    def __init__(self, limits, queue_limit=ROUTE_QUEUE_LIMIT, timeout=ROUTE_QUEUE_TIMEOUT_SECONDS):
+        self.limits = dict(limits)
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self.active = Counter()
+        self.waiting = Counter()
+        self._condition = threading.Condition()
+
+    def enter(self, endpoint):
+        """Take a slot for the endpoint; returns the rejection reason, or None once admitted"""
+        limit = self.limits.get(endpoint)
+        if limit is None:
+            return None
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            if self.active[endpoint] < limit:
+                self.active[endpoint] += 1
+                return None
+            if self.waiting[endpoint] >= self.queue_limit:
+                return "queue_full"
+            self.waiting[endpoint] += 1
+            try:
+                while self.active[endpoint] >= limit:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return "queue_timeout"
+                    self._condition.wait(remaining)
+                self.active[endpoint] += 1
+                return None
+            finally:
+                self.waiting[endpoint] -= 1
+
+    def leave(self, endpoint):
+        if endpoint not in self.limits:
+            return
+        with self._condition:
+            self.active[endpoint] -= 1
+            self._condition.notify_all()
+
+    def collect(self):
+        with self._condition:
+            active, waiting = dict(self.active), dict(self.waiting)
+        return [
+            ("valorant_route_active_requests", "gauge", "Requests running per capped endpoint",
+             [({"endpoint": e}, active.get(e, 0)) for e in sorted(self.limits)]),
+            ("valorant_route_queued_requests", "gauge", "Requests waiting per capped endpoint",
+             [({"endpoint": e}, waiting.get(e, 0)) for e in sorted(self.limits)]),
+            ("valorant_route_concurrency_limit", "gauge", "Concurrency cap per endpoint",
+             [({"endpoint": e}, limit) for e, limit in sorted(self.limits.items())]),
+        ]
+
+
+def busy_payload(reason):
+    return {"error": "Server busy, retry later", "reason": reason}
+
+
+def reject(endpoint, reason):
+    """Count a rejected request; used by both the Flask gate and the ASGI dispatcher"""
+    metrics.inc("valorant_route_rejected_total", {"endpoint": endpoint, "reason": reason},
+                help="Requests turned away by admission control")
+
+
+gate = RouteGate(HEAVY_ENDPOINTS)
+metrics.register_collector(gate.collect)
+
+
+def init_app(app):
+    """Cap concurrent requests per heavy endpoint so they can't occupy every worker thread"""
+
+    @app.before_request
+    def _admit():
+        endpoint = request.endpoint
+        reason = gate.enter(endpoint)
+        if reason:
+            reject(endpoint, reason)
+            response = jsonify(busy_payload(reason))
+            response.status_code = 503
+            response.headers["Retry-After"] = str(RETRY_AFTER_SECONDS)
+            return response
+        g.gated_endpoint = endpoint
+
+    @app.after_request
+    def _hold_while_streaming(response):
+        # The request context (and teardown) ends before the server iterates a
+        # streamed body, so such responses keep their slot until the body is closed
+        endpoint = g.get("gated_endpoint")
+        if endpoint is not None and response.is_streamed:
+            g.pop("gated_endpoint")
+            response.call_on_close(lambda: gate.leave(endpoint))
+        return response
+
+    @app.teardown_request
+    def _release(_exc):
+        endpoint = g.pop("gated_endpoint", None)
+        if endpoint is not None:
+            gate.leave(endpoint)
@@ -0,0 +1,114 @@
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+
+from utils.snapshot import read_snapshot, write_snapshot
+
+
+class DataStore(dict):
+    """Loaded datasets by name, some of which may be spilled to disk.
+
+    spill() writes a dataset as a snapshot (utils/snapshot.py) and drops the
+    frame; the next read maps it back in, so callers never see the difference.
+    Reads are timestamped so the coldest datasets can be picked for spilling.
+    Iterating (keys/items/values) only covers the datasets in memory; names()
+    and shape() cover every dataset without loading it.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.last_access = {}
+        # Every dataset name in load order, loaded or spilled
+        self._names = {}
+        self._spilled = {}
+        # name -> (snapshot directory, weakref to the frame read from it), so an
+        # unchanged frame is spilled again without rewriting its files
+        self._snapshots = {}
+        self._lock = threading.RLock()
+        self._spill_dir = None
+
+    def __getitem__(self, name):
+        self.last_access[name] = time.monotonic()
+        with self._lock:
+            if name in self._spilled:
+                self._restore(name)
+            return dict.__getitem__(self, name)
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name) or name in self._spilled
+
+    def __setitem__(self, name, df):
+        with self._lock:
+            self._discard_snapshot(name)
+            self._names[name] = None
+            dict.__setitem__(self, name, df)
+
+    def update(self, *args, **kwargs):
+        for name, df in dict(*args, **kwargs).items():
+            self[name] = df
+
+    def clear(self):
+        with self._lock:
+            for name in list(self._snapshots):
+                self._discard_snapshot(name)
+            dict.clear(self)
+            self._names.clear()
+            self.last_access.clear()
+
+    def names(self):
+        """Every dataset, spilled or not"""
+        return list(self._names)
+
+    def is_loaded(self, name):
+        return dict.__contains__(self, name)
+
+    def shape(self, name):
+        """(rows, columns) of a dataset, without mapping a spilled one back in"""
+        if name in self._spilled:
+            return self._spilled[name]
+        df = dict.get(self, name)
+        return (len(df), list(df.columns)) if df is not None else (0, [])
+
+    def spill(self, name, directory):
+        """Write a dataset under directory and drop it from memory; False if it is not loaded"""
+        with self._lock:
+            df = dict.get(self, name)
+            if df is None:
+                return False
+            snapshot = self._snapshots.get(name)
+            if snapshot is None or snapshot[1]() is not df:
+                self._discard_snapshot(name)
+                path = tempfile.mkdtemp(prefix=f"{name}-", dir=self._process_dir(directory))
+                write_snapshot({name: df}, path)
+                self._snapshots[name] = (path, weakref.ref(df))
+            self._spilled[name] = (len(df), list(df.columns))
+            dict.__delitem__(self, name)
+            return True
+
+    def _process_dir(self, directory):
+        """Spill directory of this process, removed when it exits"""
+        if self._spill_dir is None:
+            os.makedirs(directory, exist_ok=True)
+            self._spill_dir = tempfile.mkdtemp(prefix=f"{os.getpid()}-", dir=directory)
+            atexit.register(shutil.rmtree, self._spill_dir, True)
+        return self._spill_dir
+
+    def _restore(self, name):
+        path = self._snapshots[name][0]
+        df = read_snapshot(path)[name]
+        self._snapshots[name] = (path, weakref.ref(df))
+        dict.__setitem__(self, name, df)
+        del self._spilled[name]
+
+    def _discard_snapshot(self, name):
+        self._spilled.pop(name, None)
+        snapshot = self._snapshots.pop(name, None)
+        if snapshot is not None:
+            shutil.rmtree(snapshot[0], ignore_errors=True)
@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+
+
+def vocabulary(*columns):
+    """Sorted distinct values of the columns plus a trailing None, so code -1 decodes to None"""
+    values = pd.unique(pd.concat(columns, ignore_index=True).dropna())
+    return np.array(sorted(values) + [None], dtype=object)
+
+
+def encode(column, vocab):
+    """int32 codes of a column against a vocabulary, -1 for missing values"""
+    return pd.Index(vocab[:-1]).get_indexer(column).astype(np.int32)
+
+
+def encode_keys(df, columns):
+    """Sorted distinct row keys over columns and the int32 key code of every row"""
+    keys = list(zip(*(df[column] for column in columns)))
+    distinct = sorted(set(keys))
+    codes = {key: code for code, key in enumerate(distinct)}
+    return distinct, np.fromiter((codes[key] for key in keys), dtype=np.int32, count=len(keys))
@@ -1,9 +1,17 @@
+import unicodedata
+
 def construct_match_names(team_a, team_b):
     """Construct both possible match name variations"""
     match_name_1 = f"{team_a} vs {team_b}"
     match_name_2 = f"{team_b} vs {team_a}"
     return match_name_1, match_name_2
 
+def normalize_name(name):
+    """Case- and accent-insensitive form of a player or team name"""
+    decomposed = unicodedata.normalize('NFKD', str(name))
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(stripped.casefold().split())
+
 def safe_divide(numerator, denominator, default=0):
     """Safe division with default value"""
     return numerator / denominator if denominator != 0 else default
@@ -11,3 +19,72 @@ def safe_divide(numerator, denominator, default=0):
 def calculate_kd_ratio(kills, deaths):
     """Calculate K/D ratio safely"""
     return safe_divide(kills, deaths, kills)
+
+# Rate columns of players_stats that are averaged weighted by Rounds Played
+PLAYER_RATE_COLUMNS = {
+    'Rating': 'rating',
+    'Average Combat Score': 'acs',
+    'Average Damage Per Round': 'adr',
+    'Kills Per Round': 'kpr',
+    'Assists Per Round': 'apr',
+    'First Kills Per Round': 'fkpr',
+    'First Deaths Per Round': 'fdpr',
+    'Headshot %': 'headshot_pct',
+    'Kill, Assist, Trade, Survive %': 'kast_pct',
+}
+PLAYER_COUNT_COLUMNS = {
+    'Rounds Played': 'rounds',
+    'Kills': 'kills',
+    'Deaths': 'deaths',
+    'Assists': 'assists',
+    'First Kills': 'first_kills',
+    'First Deaths': 'first_deaths',
+    'Clutches Won': 'clutches_won',
+    'Clutches Played': 'clutches_played',
+}
+
+def player_match_totals(players_stats_df):
+    """One row per player and match type (the row covering all agents they played).
+
+    players_stats holds a row per agent plus a combined "agent, agent" row when a
+    player swapped agents, and 'All Stages' rollups; keeping only the row with the
+    most rounds per (player, team, tournament, stage, match type) avoids double counting.
+    """
+    df = players_stats_df[players_stats_df['Stage'] != 'All Stages']
+    keys = ['Player', 'Teams', 'Tournament', 'Stage', 'Match Type']
+    order = df.sort_values('Rounds Played', ascending=False, kind='stable')
+    return order.drop_duplicates(keys).sort_index()
+
+def aggregate_player_stats(df, by):
+    """Sum count columns and average rate columns weighted by Rounds Played per group"""
+    rounds = df['Rounds Played'].astype('float64')
+    work = df[by].copy()
+    for column in PLAYER_COUNT_COLUMNS:
+        if column in df.columns:
+            work[column] = df[column].astype('float64')
+    for column in PLAYER_RATE_COLUMNS:
+        if column in df.columns:
+            values = df[column].astype('float64')
+            work[column] = values * rounds
+            work[f'_weight_{column}'] = rounds.where(values.notna(), 0)
+    grouped = work.groupby(by, sort=False).sum(min_count=1)
+
+    result = grouped[[c for c in PLAYER_COUNT_COLUMNS if c in grouped.columns]].fillna(0)
+    for column in PLAYER_RATE_COLUMNS:
+        if column in grouped.columns:
+            weight = grouped[f'_weight_{column}']
+            result[column] = grouped[column] / weight.where(weight != 0)
+    result['KD'] = result['Kills'] / result['Deaths'].clip(lower=1)
+    return result.reset_index()
+
+def player_stats_summary(row):
+    """Serialize an aggregate_player_stats row into API field names"""
+    summary = {}
+    for column, key in PLAYER_COUNT_COLUMNS.items():
+        summary[key] = int(row[column]) if column in row else 0
+    for column, key in PLAYER_RATE_COLUMNS.items():
+        value = row[column] if column in row else None
+        summary[key] = round(float(value), 2) if value is not None and value == value else None
+    summary['kd_ratio'] = round(float(row['KD']), 2)
+    summary['clutch_rate'] = round(safe_divide(summary['clutches_won'], summary['clutches_played']), 3)
+    return summary
@@ -0,0 +1,249 @@
+import cProfile
+import logging
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import g, has_request_context, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+from config import LOG_LEVEL, PROFILE_TOP_FUNCTIONS, PROFILING_ENABLED, data_store, get_data_version
+from utils.cache import cache_stats
+
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+
+
+def configure_logging(level=None):
+    """Route the app's loggers to stderr at LOG_LEVEL (idempotent)"""
+    root = logging.getLogger("valorant")
+    root.setLevel((level or LOG_LEVEL).upper())
+    if not root.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        root.addHandler(handler)
+        root.propagate = False
+    return root
+
+
+def get_logger(name):
+    """Logger under the app's 'valorant' namespace"""
+    return logging.getLogger(f"valorant.{name}")
+
+
+def _label_key(labels):
+    return tuple(sorted((labels or {}).items()))
+
+
+def _format_labels(key):
+    if not key:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in key)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(key, escaped)) + "}"
+
+
+class MetricsRegistry:
+    """In-process counters and latency histograms rendered in Prometheus text format"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._counters = {}
+        self._histograms = {}
+        self._help = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def inc(self, name, labels=None, value=1, help=None):
+        key = _label_key(labels)
+        with self._lock:
+            self._help.setdefault(name, help)
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name, seconds, labels=None, help=None):
+        key = _label_key(labels)
+        with self._lock:
+            self._help.setdefault(name, help)
+            series = self._histograms.setdefault(name, {})
+            counts, total, observations = series.get(key, ([0] * len(self.buckets), 0.0, 0))
+            for position, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    counts[position] += 1
+            series[key] = (counts, total + seconds, observations + 1)
+
+    def register_collector(self, collector):
+        """Add a callable returning [(name, type, help, [(labels, value), ...]), ...] at scrape time"""
+        self._collectors.append(collector)
+
+    def render(self):
+        lines = []
+        with self._lock:
+            counters = {n: dict(s) for n, s in self._counters.items()}
+            histograms = {n: {k: (list(c), t, o) for k, (c, t, o) in s.items()} for n, s in self._histograms.items()}
+
+        for name, series in sorted(counters.items()):
+            lines += self._header(name, "counter", self._help.get(name))
+            lines += [f"{name}{_format_labels(key)} {value}" for key, value in sorted(series.items())]
+
+        for name, series in sorted(histograms.items()):
+            lines += self._header(name, "histogram", self._help.get(name))
+            for key, (bucket_counts, total, observations) in sorted(series.items()):
+                for bound, count in zip(self.buckets, bucket_counts):
+                    lines.append(f"{name}_bucket{_format_labels(key + (('le', str(bound)),))} {count}")
+                lines.append(f"{name}_bucket{_format_labels(key + (('le', '+Inf'),))} {observations}")
+                lines.append(f"{name}_sum{_format_labels(key)} {total:.6f}")
+                lines.append(f"{name}_count{_format_labels(key)} {observations}")
+
+        for collector in self._collectors:
+            for name, kind, help_text, samples in collector():
+                lines += self._header(name, kind, help_text)
+                lines += [f"{name}{_format_labels(_label_key(labels))} {value}" for labels, value in samples]
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _header(name, kind, help_text):
+        return ([f"# HELP {name} {help_text}"] if help_text else []) + [f"# TYPE {name} {kind}"]
+
+
+metrics = MetricsRegistry()
+
+# Service method currently running on this thread, used to label stage timings
+_active = threading.local()
+
+
+def _current_method():
+    stack = getattr(_active, "methods", None)
+    if stack:
+        return stack[-1]
+    return (request.endpoint or "unmatched") if has_request_context() else "-"
+
+
+@contextmanager
+def timer(name):
+    """Time one stage (filter, aggregate, serialize, ...) of the running service method"""
+    method = _current_method()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        metrics.observe("valorant_stage_duration_seconds", elapsed, {"method": method, "stage": name},
+                        help="Time spent per stage of a service method")
+        if has_request_context() and "stages" in g:
+            g.stages.append((method, name, elapsed))
+
+
+def instrument(func):
+    """Time a service method and make it the label for stages timed inside it"""
+    method = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        stack = _active.__dict__.setdefault("methods", [])
+        stack.append(method)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stack.pop()
+            metrics.observe("valorant_service_duration_seconds", time.perf_counter() - started,
+                            {"method": method}, help="Service method latency")
+    return wrapper
+
+
+class InstrumentedJSONProvider(DefaultJSONProvider):
+    """jsonify() with its encoding timed as the 'serialize' stage"""
+
+    def response(self, *args, **kwargs):
+        with timer("serialize"):
+            return super().response(*args, **kwargs)
+
+
+def _profile_report(profiler, response, elapsed):
+    """Top functions by cumulative time for the profiled request"""
+    stats = pstats.Stats(profiler)
+    functions = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:PROFILE_TOP_FUNCTIONS]
+    return {
+        "endpoint": request.endpoint,
+        "path": request.full_path.rstrip("?"),
+        "status": response.status_code,
+        "duration_ms": round(elapsed * 1000, 3),
+        "stages": [
+            {"method": method, "stage": name, "ms": round(seconds * 1000, 3)}
+            for method, name, seconds in g.stages
+        ],
+        "profile": {
+            "total_calls": stats.total_calls,
+            "functions": [
+                {
+                    "function": f"{os.path.basename(file)}:{line}({name})" if line else name,
+                    "calls": calls,
+                    "primitive_calls": primitive_calls,
+                    "total_ms": round(total * 1000, 3),
+                    "cumulative_ms": round(cumulative * 1000, 3),
+                }
+                for (file, line, name), (primitive_calls, calls, total, cumulative, _) in functions
+            ],
+        },
+    }
+
+
+def _collect_caches():
+    caches = cache_stats()
+    return [
+        ("valorant_cache_hits_total", "counter", "Result cache hits", [({"cache": c["name"]}, c["hits"]) for c in caches]),
+        ("valorant_cache_misses_total", "counter", "Result cache misses", [({"cache": c["name"]}, c["misses"]) for c in caches]),
+        ("valorant_cache_entries", "gauge", "Entries held per result cache", [({"cache": c["name"]}, c["entries"]) for c in caches]),
+    ]
+
+
+def _collect_datasets():
+    return [
+        ("valorant_dataset_rows", "gauge", "Rows loaded per dataset",
+         [({"dataset": name}, data_store.shape(name)[0]) for name in sorted(data_store.names())]),
+        ("valorant_data_info", "gauge", "Version of the loaded data", [({"version": get_data_version()}, 1)]),
+    ]
+
+
+metrics.register_collector(_collect_caches)
+metrics.register_collector(_collect_datasets)
+
+
+def init_app(app):
+    """Attach request timing, Server-Timing headers and ?profile=1 to the app"""
+    app.json = InstrumentedJSONProvider(app)
+
+    @app.before_request
+    def _start_request():
+        g.stages = []
+        g.request_started = time.perf_counter()
+        if PROFILING_ENABLED and request.args.get("profile") == "1":
+            g.profiler = cProfile.Profile()
+            g.profiler.enable()
+
+    @app.after_request
+    def _finish_request(response):
+        if "request_started" not in g:
+            return response
+        profiler = g.pop("profiler", None)
+        if profiler is not None:
+            profiler.disable()
+        elapsed = time.perf_counter() - g.request_started
+
+        labels = {"endpoint": request.endpoint or "unmatched", "method": request.method}
+        metrics.observe("valorant_http_request_duration_seconds", elapsed, labels, help="Request latency")
+        metrics.inc("valorant_http_requests_total", {**labels, "status": str(response.status_code)},
+                    help="Requests served")
+
+        if profiler is not None:
+            report = _profile_report(profiler, response, elapsed)
+            g.stages = []
+            return jsonify(report)
+
+        timings = [f"{name};desc=\"{method}\";dur={seconds * 1000:.2f}" for method, name, seconds in g.stages]
+        response.headers["Server-Timing"] = ", ".join(timings + [f"total;dur={elapsed * 1000:.2f}"])
+        return response
@@ -0,0 +1,206 @@
+import sys
+import threading
+import time
+import types
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    MEMORY_BUDGET_BYTES, MEMORY_CHECK_INTERVAL_SECONDS, MEMORY_COLD_SECONDS, MEMORY_SPILL_DIR,
+    data_store, derived_store, get_data_version, get_storage,
+)
+from utils.cache import _caches
+from utils.instrumentation import get_logger, metrics
+
+logger = get_logger(__name__)
+
+# Not walked into: shared by everything, or not owned by the structure being measured
+_OPAQUE = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def deep_sizeof(obj):
+    """Bytes held by obj and everything it references, counting shared objects once.
+
+    Frames and series report their deep memory_usage, numpy arrays their
+    buffer (views count their base array once) plus the objects of object
+    arrays; containers and instance attributes are walked.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, pd.DataFrame):
+            total += int(item.memory_usage(index=True, deep=True).sum())
+        elif isinstance(item, (pd.Series, pd.Index)):
+            total += int(item.memory_usage(deep=True))
+        elif isinstance(item, np.ndarray):
+            if isinstance(item.base, np.ndarray):
+                stack.append(item.base)
+                continue
+            total += item.nbytes
+            if item.dtype == object:
+                stack.extend(item.ravel().tolist())
+        elif isinstance(item, (str, bytes, bytearray, int, float, complex, bool)) or item is None:
+            total += sys.getsizeof(item)
+        elif isinstance(item, dict):
+            total += sys.getsizeof(item)
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            total += sys.getsizeof(item)
+            stack.extend(item)
+        elif isinstance(item, _OPAQUE):
+            continue
+        else:
+            total += sys.getsizeof(item)
+            if hasattr(item, "__dict__"):
+                stack.append(vars(item))
+            for slot in getattr(type(item), "__slots__", ()):
+                if hasattr(item, slot):
+                    stack.append(getattr(item, slot))
+    return total
+
+
+class MemoryAccountant:
+    """Deep sizes of datasets, derived indexes and caches, and the budget enforcing them.
+
+    Datasets and indexes only change on load or ingest, so their sizes are
+    measured once per (object, data version); cache entries once per entry.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+
+    def _measure(self, kind, name, obj):
+        key = (kind, name)
+        stamp = (id(obj), get_data_version())
+        cached = self._sizes.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = self._sizes[key] = (stamp, deep_sizeof(obj))
+        return cached[1]
+
+    def usage(self):
+        """Bytes per dataset (0 when spilled), derived index, cache and storage backend"""
+        datasets = {
+            name: self._measure("dataset", name, dict.get(data_store, name)) if data_store.is_loaded(name) else 0
+            for name in data_store.names()
+        }
+        indexes = {name: self._measure("index", name, index) for name, index in list(derived_store.items())}
+        caches = {}
+        for cache in list(_caches):
+            caches[cache.name] = caches.get(cache.name, 0) + cache.nbytes(deep_sizeof)
+        storage = get_storage()
+        return {
+            "datasets": datasets,
+            "indexes": indexes,
+            "caches": caches,
+            "storage": {storage.name: storage.memory_bytes()},
+        }
+
+    def report(self):
+        """Usage with totals, for the root endpoint"""
+        usage = self.usage()
+        total = sum(sum(group.values()) for group in usage.values())
+        return {
+            "budget_bytes": self.budget_bytes or None,
+            "total_bytes": total,
+            "datasets": {
+                name: {"bytes": size, "rows": data_store.shape(name)[0], "loaded": data_store.is_loaded(name)}
+                for name, size in usage["datasets"].items()
+            },
+            "indexes": usage["indexes"],
+            "caches": usage["caches"],
+            "storage": usage["storage"],
+        }
+
+    def enforce(self):
+        """Bring usage under the budget: evict cache entries, then spill the coldest datasets"""
+        if self.budget_bytes <= 0 or not self._lock.acquire(blocking=False):
+            return
+        try:
+            usage = self.usage()
+            over = sum(sum(group.values()) for group in usage.values()) - self.budget_bytes
+            if over <= 0:
+                return
+
+            # Largest caches first, least recently used entries first
+            evicted = 0
+            for cache in sorted(list(_caches), key=lambda c: usage["caches"].get(c.name, 0), reverse=True):
+                while over > 0 and len(cache):
+                    over -= cache.evict_oldest(deep_sizeof)
+                    evicted += 1
+            if evicted:
+                metrics.inc("valorant_memory_evictions_total", {"kind": "cache_entry"}, value=evicted,
+                            help="Cache entries evicted and datasets spilled to stay under MEMORY_BUDGET_BYTES")
+
+            now = time.monotonic()
+            cold = [
+                name for name in usage["datasets"]
+                if data_store.is_loaded(name) and now - data_store.last_access.get(name, 0.0) >= MEMORY_COLD_SECONDS
+            ]
+            for name in sorted(cold, key=lambda n: data_store.last_access.get(n, 0.0)):
+                if over <= 0:
+                    break
+                if data_store.spill(name, MEMORY_SPILL_DIR):
+                    over -= usage["datasets"][name]
+                    metrics.inc("valorant_memory_evictions_total", {"kind": "dataset"},
+                                help="Cache entries evicted and datasets spilled to stay under MEMORY_BUDGET_BYTES")
+                    logger.info("💾 Spilled cold dataset %s (%.1f MB)", name, usage["datasets"][name] / 1e6)
+            if over > 0:
+                logger.warning("⚠️ Memory still %.1f MB over budget after evicting caches and cold datasets",
+                               over / 1e6)
+        finally:
+            self._lock.release()
+
+    def maybe_enforce(self):
+        """enforce(), at most once per MEMORY_CHECK_INTERVAL_SECONDS"""
+        now = time.monotonic()
+        if self.budget_bytes > 0 and now - self._last_check >= MEMORY_CHECK_INTERVAL_SECONDS:
+            self._last_check = now
+            self.enforce()
+
+
+accountant = MemoryAccountant(MEMORY_BUDGET_BYTES)
+
+
+def memory_report():
+    return accountant.report()
+
+
+def _collect_memory():
+    usage = accountant.usage()
+    samples = [
+        ({"kind": kind, "name": name}, size)
+        for kind, group in (("dataset", usage["datasets"]), ("index", usage["indexes"]),
+                            ("cache", usage["caches"]), ("storage", usage["storage"]))
+        for name, size in sorted(group.items())
+    ]
+    return [
+        ("valorant_memory_bytes", "gauge", "Deep bytes held per dataset, derived index, cache and storage backend",
+         samples),
+        ("valorant_memory_budget_bytes", "gauge", "MEMORY_BUDGET_BYTES (0 = unlimited)",
+         [({}, accountant.budget_bytes)]),
+        ("valorant_dataset_loaded", "gauge", "1 when a dataset is in memory, 0 when spilled to disk",
+         [({"dataset": name}, int(data_store.is_loaded(name))) for name in sorted(data_store.names())]),
+    ]
+
+
+metrics.register_collector(_collect_memory)
+
+
+def init_app(app):
+    """Check the memory budget now and after requests"""
+    accountant.maybe_enforce()
+
+    @app.after_request
+    def _check_memory(response):
+        accountant.maybe_enforce()
+        return response
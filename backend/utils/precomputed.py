@@ -0,0 +1,40 @@
+import hashlib
+import os
+
+import config
+
+
+def _file_name(path, args):
+    query = "&".join(f"{name}={value}" for name, value in args)
+    return hashlib.sha1(f"{path}?{query}".encode("utf-8")).hexdigest() + ".json"
+
+
+def precomputed_dir(version):
+    """Directory of the bodies rendered from a data version by the running code version"""
+    return os.path.join(config.PRECOMPUTED_DIR, f"{version}-{config.CODE_VERSION}")
+
+
+def precomputed_path(version, path, args=()):
+    """File holding the precomputed body of a URL (path + sorted query args) for a data version"""
+    return os.path.join(precomputed_dir(version), _file_name(path, args))
+
+
+def read_precomputed(version, path, args=()):
+    """Precomputed response body of a URL, or None if it was not precomputed for this data"""
+    if not config.PRECOMPUTED_DIR or version is None:
+        return None
+    try:
+        with open(precomputed_path(version, path, args), "rb") as handle:
+            return handle.read()
+    except FileNotFoundError:
+        return None
+
+
+def write_precomputed(version, path, body, args=()):
+    """Store a response body atomically, so readers never see a partial file"""
+    target = precomputed_path(version, path, args)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    temporary = f"{target}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as handle:
+        handle.write(body)
+    os.replace(temporary, target)
@@ -0,0 +1,67 @@
+import pandas as pd
+
+
+FILTER_SEPARATOR = "=="
+VALUE_SEPARATOR = "|"
+
+
+class DatasetNotFound(KeyError):
+    """Raised when a request names a dataset that is not in data_store"""
+
+
+class QueryTimeout(Exception):
+    """Raised by a storage backend when a query runs past its deadline"""
+
+
+def parse_filters(raw_filters):
+    """Parse `Column==value` (or `Column==v1|v2`) strings into {column: [values]}"""
+    filters = {}
+    for raw in raw_filters or []:
+        if FILTER_SEPARATOR not in raw:
+            raise ValueError(f"Invalid filter '{raw}', expected 'Column==value'")
+        column, values = raw.split(FILTER_SEPARATOR, 1)
+        column = column.strip()
+        if not column:
+            raise ValueError(f"Invalid filter '{raw}', missing column name")
+        filters.setdefault(column, []).extend(v for v in values.split(VALUE_SEPARATOR))
+    return filters
+
+
+def validate_columns(df, columns):
+    """Raise ValueError if any requested column is missing from the dataframe"""
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise ValueError(f"Unknown columns: {missing}")
+
+
+def coerce_filter_values(dtype, column, values):
+    """Cast string filter values to the dtype of the column they are compared with.
+
+    Values that were already coerced pass through unchanged.
+    """
+    if pd.api.types.is_bool_dtype(dtype):
+        return [v if isinstance(v, bool) else v.lower() in ("1", "true", "yes") for v in values]
+    if pd.api.types.is_numeric_dtype(dtype):
+        try:
+            return [float(v) for v in values]
+        except ValueError:
+            raise ValueError(f"Non-numeric filter value for column '{column}': {values}")
+    return values
+
+
+def build_mask(df, filters):
+    """Build a boolean mask for the filters, or None when there is nothing to filter"""
+    if not filters:
+        return None
+    mask = pd.Series(True, index=df.index)
+    for column, values in filters.items():
+        series = df[column]
+        mask &= series.isin(coerce_filter_values(series.dtype, column, values))
+    return mask
+
+
+def apply_filters(df, filters):
+    """Return the rows of df matching every filter (values of one column are OR-ed)"""
+    validate_columns(df, filters.keys())
+    mask = build_mask(df, filters)
+    return df if mask is None else df[mask]
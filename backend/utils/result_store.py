@@ -0,0 +1,158 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from functools import wraps
+
+from config import CODE_VERSION, RESULT_STORE_MAX_BYTES, RESULT_STORE_PATH, get_data_version
+from utils.instrumentation import get_logger, metrics, timer
+from utils.singleflight import _freeze
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    version TEXT,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+
+class ResultStore:
+    """Service results persisted in SQLite, shared by every worker process on the box.
+
+    Rows are keyed by a hash of (method, arguments, data version, code version)
+    and hold the
+    zlib-compressed pickle of the result. Once the values pass max_bytes the least
+    recently read rows are evicted down to 90% of it. Store errors are logged and
+    treated as misses, so a broken or locked file never fails a request.
+    """
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+    def _connection(self):
+        # One connection per thread and process; sqlite connections must not cross a fork
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    @staticmethod
+    def key(method, args, kwargs, version):
+        return hashlib.sha1(
+            repr((method, _freeze(args), _freeze(kwargs), version, CODE_VERSION)).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key):
+        try:
+            connection = self._connection()
+            row = connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+            return pickle.loads(zlib.decompress(row[0]))
+        except (sqlite3.Error, pickle.UnpicklingError, zlib.error) as e:
+            logger.warning("⚠️ Result store read failed: %s", e)
+            return None
+
+    def set(self, key, method, version, value):
+        blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        if len(blob) > self.max_bytes:
+            return
+        try:
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO results (key, method, version, value, size, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, method, version, blob, len(blob), time.time()),
+            )
+            self._evict(connection)
+        except sqlite3.Error as e:
+            logger.warning("⚠️ Result store write failed: %s", e)
+
+    def _evict(self, connection):
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = total - int(self.max_bytes * 0.9)
+        evicted = freed = 0
+        for key, size in connection.execute("SELECT key, size FROM results ORDER BY accessed").fetchall():
+            if freed >= target:
+                break
+            connection.execute("DELETE FROM results WHERE key = ?", (key,))
+            freed += size
+            evicted += 1
+        metrics.inc("valorant_result_store_evictions_total", value=evicted,
+                    help="Results evicted from the persistent store to stay under RESULT_STORE_MAX_BYTES")
+
+    def stats(self):
+        try:
+            entries, size = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+        except sqlite3.Error:
+            entries, size = 0, 0
+        return {"entries": entries, "bytes": size}
+
+
+result_store = ResultStore(RESULT_STORE_PATH, RESULT_STORE_MAX_BYTES) if RESULT_STORE_PATH else None
+
+
+def persistent(func):
+    """Serve a service method from the persistent result store, storing results on a miss.
+
+    Keyed like single_flight (arguments and data version, not the instance), plus
+    CODE_VERSION so a deploy of changed code does not serve results of the old one.
+    None and {"error": ...} results are not stored. Apply it below @single_flight
+    so only the leader of a burst of identical calls reads and writes the store.
+    """
+    method = func.__qualname__
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if result_store is None:
+            return func(self, *args, **kwargs)
+        version = get_data_version()
+        key = ResultStore.key(method, args, kwargs, version)
+        with timer("result_store"):
+            result = result_store.get(key)
+        outcome = "hit" if result is not None else "miss"
+        metrics.inc("valorant_result_store_requests_total", {"method": method, "result": outcome},
+                    help="Persistent result store lookups per service method")
+        if result is not None:
+            return result
+        result = func(self, *args, **kwargs)
+        if result is not None and not (isinstance(result, dict) and "error" in result):
+            result_store.set(key, method, version, result)
+        return result
+
+    return wrapper
+
+
+def _collect_store():
+    if result_store is None:
+        return []
+    stats = result_store.stats()
+    return [
+        ("valorant_result_store_entries", "gauge", "Results held in the persistent store", [({}, stats["entries"])]),
+        ("valorant_result_store_bytes", "gauge", "Compressed bytes held in the persistent store", [({}, stats["bytes"])]),
+    ]
+
+
+metrics.register_collector(_collect_store)
@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+
+# Column types applied once by load_data so request paths never parse strings.
+#   float32 / int16 / int32   plain numeric casts (int types treat blanks as 0)
+#   percent                   "44%"  -> 44.0 (float32, blanks stay NaN)
+#   credits                   "0.2k" -> 200.0 (float32, blanks stay NaN)
+#   ratio                     "1/3"  -> two int16 columns replacing the source column
+#   duration                  "48:56" -> extra int32 seconds column, source kept for display
+COUNT_COLUMNS_KILLS_STATS = ["2k", "3k", "4k", "5k", "1v1", "1v2", "1v3", "1v4", "1v5"]
+
+DATASET_SCHEMAS = {
+    "players_stats": {
+        "Rounds Played": "int32",
+        "Kill, Assist, Trade, Survive %": "percent",
+        "Headshot %": "percent",
+        "Clutch Success %": "percent",
+        "Clutches (won/played)": ("ratio", ("Clutches Won", "Clutches Played")),
+        "Maximum Kills in a Single Map": "int16",
+        "Kills": "int32",
+        "Deaths": "int32",
+        "Assists": "int32",
+        "First Kills": "int32",
+        "First Deaths": "int32",
+    },
+    "kills_stats": {
+        **{column: "int16" for column in COUNT_COLUMNS_KILLS_STATS},
+        "Econ": "int32",
+        "Spike Plants": "int16",
+        "Spike Defuses": "int16",
+    },
+    "maps_scores": {
+        "Team A Score": "int16",
+        "Team A Attacker Score": "int16",
+        "Team A Defender Score": "int16",
+        "Team A Overtime Score": "int16",
+        "Team B Score": "int16",
+        "Team B Attacker Score": "int16",
+        "Team B Defender Score": "int16",
+        "Team B Overtime Score": "int16",
+        "Duration": ("duration", "Duration Seconds"),
+    },
+    "scores": {
+        "Team A Score": "int16",
+        "Team B Score": "int16",
+    },
+    "win_loss_methods_count": {
+        column: "int16"
+        for column in [
+            "Elimination", "Detonated", "Defused", "Time Expiry (No Plant)",
+            "Eliminated", "Defused Failed", "Detonation Denied", "Time Expiry (Failed to Plant)",
+        ]
+    },
+    "win_loss_method_round_number": {
+        "Round Number": "int16",
+    },
+    "rounds_kills": {
+        "Round Number": "int16",
+    },
+    "kills": {
+        "Player Kills": "int32",
+        "Enemy Kills": "int32",
+        "Difference": "int32",
+    },
+    "eco_rounds": {
+        "Round Number": "int16",
+        "Loadout Value": "credits",
+        "Remaining Credits": "credits",
+    },
+    "eco_stats": {
+        "Initiated": "float32",
+        "Won": "int16",
+    },
+}
+
+
+def parse_percent(series):
+    """'44%' -> 44.0 as float32, blanks become NaN"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(np.float32)
+    return pd.to_numeric(series.astype("string").str.rstrip("%"), errors="coerce").astype(np.float32)
+
+
+def parse_credits(series):
+    """'0.2k' -> 200.0 as float32, blanks become NaN"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(np.float32)
+    text = series.astype("string").str.strip().str.lower()
+    thousands = text.str.endswith("k").fillna(False)
+    values = pd.to_numeric(text.str.rstrip("k"), errors="coerce")
+    return values.where(~thousands, values * 1000).round().astype(np.float32)
+
+
+def parse_ratio(series):
+    """'1/3' -> (1, 3) as two int16 series, blanks become 0/0"""
+    parts = series.astype("string").str.split("/", n=1, expand=True).reindex(columns=[0, 1])
+    won = pd.to_numeric(parts[0], errors="coerce").fillna(0).astype(np.int16)
+    played = pd.to_numeric(parts[1], errors="coerce").fillna(0).astype(np.int16)
+    return won, played
+
+
+def parse_duration(series):
+    """'48:56' or '1:02:03' -> seconds as int32, blanks become 0"""
+    parts = series.astype("string").str.split(":", expand=True)
+    seconds = pd.Series(0, index=series.index, dtype="float64")
+    for position in range(parts.shape[1]):
+        seconds = seconds * 60 + pd.to_numeric(parts[position], errors="coerce").fillna(0)
+    # Rows with fewer fields were shifted too far left, undo the extra factors of 60
+    field_counts = parts.notna().sum(axis=1)
+    seconds = seconds / (60 ** (parts.shape[1] - field_counts))
+    return seconds.fillna(0).astype(np.int32)
+
+
+def coerce_dataset(name, df):
+    """Apply the declared schema for a dataset, parsing string columns into numbers"""
+    schema = DATASET_SCHEMAS.get(name)
+    if df is None or not schema:
+        return df
+
+    for column, kind in schema.items():
+        if column not in df.columns:
+            continue
+        if isinstance(kind, tuple):
+            kind, target = kind
+            if kind == "ratio":
+                won_column, played_column = target
+                df[won_column], df[played_column] = parse_ratio(df[column])
+                df.drop(columns=[column], inplace=True)
+            elif kind == "duration":
+                df[target] = parse_duration(df[column])
+        elif kind == "percent":
+            df[column] = parse_percent(df[column])
+        elif kind == "credits":
+            df[column] = parse_credits(df[column])
+        elif kind.startswith("int"):
+            df[column] = pd.to_numeric(df[column], errors="coerce").fillna(0).astype(kind)
+        else:
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype(kind)
+    return df
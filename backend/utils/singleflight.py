@@ -0,0 +1,124 @@
+import threading
+import weakref
+from functools import wraps
+
+from config import get_data_version
+from utils.instrumentation import metrics
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key onto one in-progress computation.
+
+    The first caller for a key runs the function; callers arriving while it runs
+    wait and receive the same result (or exception). Nothing is kept once the
+    call finishes, so this dedupes bursts without acting as a cache.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.leaders = 0
+        self.coalesced = 0
+        self.errors = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+        _groups.add(self)
+
+    def do(self, key, func, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "in_flight": self.in_flight(),
+        }
+
+
+_groups = weakref.WeakSet()
+
+
+def _freeze(value):
+    """Hashable form of call arguments (lists and dicts from query strings)"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def single_flight(func):
+    """Coalesce concurrent identical calls to a service method.
+
+    Calls are keyed by their arguments and the data version; the service
+    instance is not part of the key, services hold no per-instance state.
+    """
+    group = SingleFlight(func.__qualname__)
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (_freeze(args), _freeze(kwargs), get_data_version())
+        return group.do(key, func, self, *args, **kwargs)
+
+    wrapper.single_flight = group
+    return wrapper
+
+
+def _collect_groups():
+    groups = sorted((group.stats() for group in list(_groups)), key=lambda stats: stats["name"])
+    return [
+        ("valorant_singleflight_calls_total", "counter", "Computations started per coalescing group",
+         [({"method": s["name"]}, s["leaders"]) for s in groups]),
+        ("valorant_singleflight_coalesced_total", "counter", "Requests that shared an in-progress computation",
+         [({"method": s["name"]}, s["coalesced"]) for s in groups]),
+        ("valorant_singleflight_errors_total", "counter", "Coalesced computations that raised",
+         [({"method": s["name"]}, s["errors"]) for s in groups]),
+        ("valorant_singleflight_in_flight", "gauge", "Computations currently running",
+         [({"method": s["name"]}, s["in_flight"]) for s in groups]),
+    ]
+
+
+metrics.register_collector(_collect_groups)
@@ -0,0 +1,63 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+MANIFEST = "manifest.json"
+
+
+def write_snapshot(data_store, directory):
+    """Write every dataset as one .npy file per column so other processes can mmap it.
+
+    Numeric columns are stored as-is; text columns as int32 codes plus a JSON
+    vocabulary, with -1 for missing values. An index other than 0..n-1 (e.g.
+    after a tournament filter) is stored too.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest = {}
+    for key, df in data_store.items():
+        columns = []
+        for position, column in enumerate(df.columns):
+            file_name = f"{key}.{position}.npy"
+            values = df[column]
+            if values.dtype == object:
+                codes, vocab = pd.factorize(values, use_na_sentinel=True)
+                np.save(os.path.join(directory, file_name), codes.astype(np.int32))
+                columns.append({"name": column, "file": file_name, "vocabulary": vocab.tolist()})
+            else:
+                np.save(os.path.join(directory, file_name), values.to_numpy())
+                columns.append({"name": column, "file": file_name})
+        manifest[key] = {"rows": len(df), "columns": columns}
+        if not df.index.equals(pd.RangeIndex(len(df))):
+            index_file = f"{key}.index.npy"
+            np.save(os.path.join(directory, index_file), df.index.to_numpy())
+            manifest[key]["index"] = index_file
+    with open(os.path.join(directory, MANIFEST), "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle)
+
+
+def read_snapshot(directory):
+    """Map a snapshot written by write_snapshot back into {dataset: DataFrame}.
+
+    Numeric columns are copy-on-write memory maps, so every process reading the
+    same snapshot shares their pages.
+    """
+    with open(os.path.join(directory, MANIFEST), encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    data = {}
+    for key, entry in manifest.items():
+        columns = {}
+        for column in entry["columns"]:
+            values = np.load(os.path.join(directory, column["file"]), mmap_mode="c")
+            if "vocabulary" in column:
+                # Code -1 picks the trailing NaN
+                vocab = np.array(column["vocabulary"] + [np.nan], dtype=object)
+                values = vocab[values]
+            columns[column["name"]] = values
+        if "index" in entry:
+            index = pd.Index(np.load(os.path.join(directory, entry["index"])))
+        else:
+            index = pd.RangeIndex(entry["rows"])
+        data[key] = pd.DataFrame(columns, index=index, copy=False)
+    return data
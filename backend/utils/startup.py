@@ -0,0 +1,69 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger("valorant.startup")
+
+
+class StartupReport:
+    """How long each startup phase of this process took, and whether it is ready to serve.
+
+    config.load_data records the loading phases and utils/warmup.py the warm-up
+    ones, then marks the process ready. A phase may carry a breakdown, e.g. the
+    seconds spent building each derived structure.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.breakdowns = {}
+        self.current = None
+        self.ready = False
+        self.error = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        """Time one startup phase"""
+        self.current = name
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            with self._lock:
+                self.phases[name] = seconds
+                self.current = None
+            logger.info("⏱️  Startup phase %s: %.2fs", name, seconds)
+
+    def detail(self, phase, name, seconds):
+        """Add one item (dataset, structure, URL group) to a phase's breakdown"""
+        with self._lock:
+            self.breakdowns.setdefault(phase, {})[name] = seconds
+
+    def mark_ready(self, error=None):
+        self.error = error
+        self.ready = True
+
+    def report(self):
+        with self._lock:
+            phases = dict(self.phases)
+            breakdowns = {phase: dict(items) for phase, items in self.breakdowns.items()}
+        return {
+            "ready": self.ready,
+            "phase": self.current,
+            "error": self.error,
+            "total_seconds": round(sum(phases.values()), 3),
+            "phases": [
+                {
+                    "name": name,
+                    "seconds": round(seconds, 3),
+                    **({"breakdown": {item: round(s, 3) for item, s in breakdowns[name].items()}}
+                       if name in breakdowns else {}),
+                }
+                for name, seconds in phases.items()
+            ],
+        }
+
+
+startup = StartupReport()
@@ -0,0 +1,357 @@
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.query import QueryTimeout, apply_filters, build_mask, coerce_filter_values, validate_columns
+
+
+# Column sets indexed by the SQL backend when a dataset has all of them
+INDEXED_COLUMNS = (
+    ('match_id',),
+    ('Tournament', 'Stage', 'Match Type', 'Match Name'),
+    ('Tournament', 'Stage', 'Match Type', 'Teams'),
+    ('Match Name',),
+    ('Player',),
+    ('Eliminator',),
+    ('Eliminated',),
+    ('Map',),
+)
+
+
+# Instructions SQLite runs between deadline checks
+PROGRESS_INSTRUCTIONS = 10000
+
+
+def _check_deadline(deadline):
+    if deadline is not None and time.perf_counter() > deadline:
+        raise QueryTimeout("Query ran past its deadline")
+
+
+def _rows(df, filters, columns):
+    filtered = apply_filters(df, filters or {})
+    return filtered if columns is None else filtered[list(columns)]
+
+
+class PandasStorage:
+    """Queries answered by masking the loaded DataFrames (the default backend)"""
+
+    name = "pandas"
+
+    def __init__(self):
+        self.frames = {}
+
+    def load(self, data_store):
+        self.frames = data_store
+
+    def memory_bytes(self):
+        """Memory held besides the loaded frames, which this backend shares"""
+        return 0
+
+    def append(self, name, df):
+        """data_store already holds the appended rows"""
+
+    def select(self, name, filters=None, columns=None):
+        """Rows of a dataset matching every filter ({column: [values]}), optionally projected"""
+        return _rows(self.frames[name], filters, columns)
+
+    def count(self, name, filters=None):
+        df = self.frames[name]
+        validate_columns(df, (filters or {}).keys())
+        mask = build_mask(df, filters)
+        return len(df) if mask is None else int(mask.sum())
+
+    def iter_chunks(self, name, filters, columns, chunk_size):
+        """Filtered, projected frames of at most chunk_size rows, in row order"""
+        df = self.frames[name]
+        for start in range(0, len(df), chunk_size):
+            chunk = df.iloc[start:start + chunk_size]
+            mask = build_mask(chunk, filters)
+            if mask is not None:
+                chunk = chunk[mask]
+            if not chunk.empty:
+                yield chunk[columns]
+
+    def aggregate(self, name, group_by, metrics, filters, weight, deadline=None, chunk_rows=None):
+        """Group-by aggregation as a frame of group columns plus one column per metric label.
+
+        With a deadline (a time.perf_counter() value), inputs over chunk_rows are
+        aggregated chunk by chunk into partial sums, counts and extremes that are
+        then combined, checking the deadline before each chunk.
+        """
+        filtered = _rows(self.frames[name], filters, None)
+        if deadline is None or not chunk_rows or len(filtered) <= chunk_rows:
+            _check_deadline(deadline)
+            return self._aggregate(filtered, group_by, metrics, weight)
+
+        partials = []
+        for start in range(0, len(filtered), chunk_rows):
+            _check_deadline(deadline)
+            partials.append(self._partials(filtered.iloc[start:start + chunk_rows], group_by, metrics, weight))
+        _check_deadline(deadline)
+        return self._combine(pd.concat(partials), group_by, metrics)
+
+    @staticmethod
+    def _keys(df, group_by):
+        # A constant key collapses the frame into a single group when no group-by is given
+        return [df[c] for c in group_by] or [pd.Series(0, index=df.index, name="_all")]
+
+    def _aggregate(self, filtered, group_by, metrics, weight):
+        keys = self._keys(filtered, group_by)
+        grouped = filtered.groupby(keys, sort=True, dropna=False)
+
+        columns = {}
+        for op, column in metrics:
+            label = metric_label(op, column)
+            if op == "count":
+                columns[label] = grouped.size()
+            elif op == "wmean":
+                values = filtered[column]
+                weights = filtered[weight].where(values.notna())
+                numerator = (values * weights).groupby(keys, sort=True, dropna=False).sum()
+                denominator = weights.groupby(keys, sort=True, dropna=False).sum()
+                columns[label] = numerator / denominator.where(denominator != 0)
+            else:
+                columns[label] = grouped[column].agg(op)
+
+        result = pd.DataFrame(columns)
+        return result.reset_index() if group_by else result.reset_index(drop=True)
+
+    def _partials(self, chunk, group_by, metrics, weight):
+        """Per-group partial aggregates of one chunk, as columns named (kind, column)"""
+        keys = self._keys(chunk, group_by)
+        grouped = chunk.groupby(keys, sort=False, dropna=False)
+        columns = {("count", None): grouped.size()}
+        for op, column in metrics:
+            if op in ("sum", "mean"):
+                columns[("sum", column)] = grouped[column].sum()
+                columns[("valid", column)] = grouped[column].count()
+            elif op in ("min", "max"):
+                columns[(op, column)] = grouped[column].agg(op)
+            elif op == "wmean":
+                values = chunk[column]
+                weights = chunk[weight].where(values.notna())
+                columns[("numerator", column)] = (values * weights).groupby(keys, sort=False, dropna=False).sum()
+                columns[("denominator", column)] = weights.groupby(keys, sort=False, dropna=False).sum()
+        return pd.DataFrame(columns)
+
+    def _combine(self, partials, group_by, metrics):
+        """Final metrics from the concatenated chunk partials (indexed by group)"""
+        grouped = partials.groupby(level=list(range(partials.index.nlevels)), sort=True, dropna=False)
+        totals = grouped.agg({name: name[0] if name[0] in ("min", "max") else "sum" for name in partials.columns})
+
+        columns = {}
+        for op, column in metrics:
+            label = metric_label(op, column)
+            if op == "count":
+                columns[label] = totals[("count", None)]
+            elif op == "sum":
+                columns[label] = totals[("sum", column)]
+            elif op == "mean":
+                columns[label] = totals[("sum", column)] / totals[("valid", column)].where(totals[("valid", column)] != 0)
+            elif op in ("min", "max"):
+                columns[label] = totals[(op, column)]
+            elif op == "wmean":
+                denominator = totals[("denominator", column)]
+                columns[label] = totals[("numerator", column)] / denominator.where(denominator != 0)
+
+        result = pd.DataFrame(columns)
+        return result.reset_index() if group_by else result.reset_index(drop=True)
+
+
+def metric_label(op, column):
+    return "count" if op == "count" else f"{op}({column})"
+
+
+def _quote(column):
+    return '"' + column.replace('"', '""') + '"'
+
+
+class SQLiteStorage:
+    """Queries pushed down to an in-memory SQLite copy of the datasets.
+
+    Every dataset becomes a table (rows in load order) with indexes on the match
+    key, player and map columns, so filtered lookups use an index instead of
+    scanning the frame. Results are cast back to the frame's dtypes so services
+    see the same values as with the pandas backend.
+    """
+
+    name = "sqlite"
+
+    def __init__(self):
+        self.uri = f"file:valorant-{id(self)}?mode=memory&cache=shared"
+        self.dtypes = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # The shared in-memory database lives as long as one connection to it is open
+        self._anchor = self._connect()
+
+    def _connect(self):
+        return sqlite3.connect(self.uri, uri=True, check_same_thread=False)
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection
+
+    def load(self, data_store):
+        with self._lock:
+            connection = self._anchor
+            for name in list(self.dtypes):
+                connection.execute(f"DROP TABLE IF EXISTS {_quote(name)}")
+            self.dtypes = {}
+            for name, df in data_store.items():
+                if df is not None:
+                    self._insert(connection, name, df, replace=True)
+            connection.commit()
+
+    def memory_bytes(self):
+        """Size of the in-memory database"""
+        page_count = self._anchor.execute("PRAGMA page_count").fetchone()[0]
+        return page_count * self._anchor.execute("PRAGMA page_size").fetchone()[0]
+
+    def append(self, name, df):
+        with self._lock:
+            self._insert(self._anchor, name, df, replace=name not in self.dtypes)
+            self._anchor.commit()
+
+    def _insert(self, connection, name, df, replace):
+        df.to_sql(name, connection, index=False, if_exists="replace" if replace else "append")
+        if replace:
+            self.dtypes[name] = df.dtypes
+            for columns in INDEXED_COLUMNS:
+                if all(column in df.columns for column in columns):
+                    index_name = _quote(f"{name}__{'__'.join(columns)}")
+                    connection.execute(
+                        f"CREATE INDEX {index_name} ON {_quote(name)} ({', '.join(map(_quote, columns))})"
+                    )
+
+    def _where(self, name, filters):
+        """WHERE clause and parameters for {column: [values]} filters"""
+        dtypes = self.dtypes[name]
+        missing = [column for column in filters or {} if column not in dtypes]
+        if missing:
+            raise ValueError(f"Unknown columns: {missing}")
+        clauses, params = [], []
+        for column, values in (filters or {}).items():
+            values = coerce_filter_values(dtypes[column], column, values)
+            clauses.append(f"{_quote(column)} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _frame(self, name, columns, rows):
+        """Frame of fetched rows with the loaded dtypes (integers with NULLs become floats)"""
+        dtypes = self.dtypes[name]
+        values = list(zip(*rows)) if rows else [()] * len(columns)
+        data = {}
+        for column, column_values in zip(columns, values):
+            dtype = dtypes[column]
+            if dtype == object:
+                # Missing text comes back as None; the loaded frames hold NaN
+                data[column] = np.array([np.nan if v is None else v for v in column_values], dtype=object)
+            elif dtype.kind in "iu" and None in column_values:
+                data[column] = np.array(column_values, dtype=float)
+            else:
+                data[column] = np.array(column_values, dtype=dtype)
+        return pd.DataFrame(data, columns=columns)
+
+    def select(self, name, filters=None, columns=None):
+        dtypes = self.dtypes[name]
+        columns = list(columns) if columns is not None else list(dtypes.index)
+        missing = [column for column in columns if column not in dtypes]
+        if missing:
+            raise ValueError(f"Unknown columns: {missing}")
+        where, params = self._where(name, filters)
+        cursor = self._connection().execute(
+            f"SELECT {', '.join(map(_quote, columns))} FROM {_quote(name)}{where} ORDER BY rowid", params
+        )
+        return self._frame(name, columns, cursor.fetchall())
+
+    def count(self, name, filters=None):
+        where, params = self._where(name, filters)
+        return self._connection().execute(f"SELECT COUNT(*) FROM {_quote(name)}{where}", params).fetchone()[0]
+
+    def iter_chunks(self, name, filters, columns, chunk_size):
+        where, params = self._where(name, filters)
+        cursor = self._connection().cursor()
+        cursor.execute(f"SELECT {', '.join(map(_quote, columns))} FROM {_quote(name)}{where} ORDER BY rowid", params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield self._frame(name, columns, rows)
+
+    def _fetch(self, sql, params, deadline):
+        """Rows of a query, interrupted by SQLite itself once the deadline passes"""
+        connection = self._connection()
+        if deadline is None:
+            return connection.execute(sql, params).fetchall()
+        connection.set_progress_handler(lambda: time.perf_counter() > deadline, PROGRESS_INSTRUCTIONS)
+        try:
+            return connection.execute(sql, params).fetchall()
+        except sqlite3.OperationalError:
+            _check_deadline(deadline)
+            raise
+        finally:
+            connection.set_progress_handler(None, 0)
+
+    def aggregate(self, name, group_by, metrics, filters, weight, deadline=None, chunk_rows=None):
+        """SQL GROUP BY; SQLite aborts it once deadline (a time.perf_counter() value) passes"""
+        dtypes = self.dtypes[name]
+        metrics = list(dict.fromkeys(metrics))
+        where, params = self._where(name, filters)
+        selects = [_quote(column) for column in group_by]
+        labels = []
+        for op, column in metrics:
+            labels.append(metric_label(op, column))
+            if op == "count":
+                selects.append("COUNT(*)")
+                continue
+            value = _quote(column)
+            if op == "sum":
+                # pandas sums empty/all-missing groups to 0 and keeps integer sums integral
+                selects.append(f"COALESCE(SUM({value}), 0)" if dtypes[column].kind in "iu" else f"TOTAL({value})")
+            elif op == "mean":
+                selects.append(f"AVG({value})")
+            elif op in ("min", "max"):
+                selects.append(f"{op.upper()}({value})")
+            elif op == "wmean":
+                w = _quote(weight)
+                selects.append(
+                    f"TOTAL({value} * {w}) / NULLIF(TOTAL(CASE WHEN {value} IS NOT NULL THEN {w} END), 0)"
+                )
+
+        sql = f"SELECT {', '.join(selects)} FROM {_quote(name)}{where}"
+        if group_by:
+            # pandas sorts missing group keys last
+            keys = ", ".join(f"{_quote(c)} IS NULL, {_quote(c)}" for c in group_by)
+            sql += f" GROUP BY {', '.join(map(_quote, group_by))} ORDER BY {keys}"
+        elif not self.count(name, filters):
+            return pd.DataFrame(columns=labels)
+        rows = self._fetch(sql, params, deadline)
+        result = pd.DataFrame.from_records(rows, columns=group_by + labels)
+        for column in group_by:
+            if dtypes[column] != object and not result[column].isna().any():
+                result[column] = result[column].astype(dtypes[column])
+        for (op, column), label in zip(metrics, labels):
+            if op in ("mean", "wmean"):
+                result[label] = result[label].astype(float)
+            elif op in ("min", "max") and dtypes[column].kind == "f":
+                result[label] = result[label].astype(float)
+        return result
+
+
+STORAGE_BACKENDS = {
+    PandasStorage.name: PandasStorage,
+    SQLiteStorage.name: SQLiteStorage,
+}
+
+
+def create_storage(name):
+    """Storage backend by name ("pandas" or "sqlite")"""
+    if name not in STORAGE_BACKENDS:
+        raise ValueError(f"Unknown storage backend '{name}', expected one of {list(STORAGE_BACKENDS)}")
+    return STORAGE_BACKENDS[name]()
@@ -0,0 +1,135 @@
+import threading
+import time
+from urllib.parse import quote
+
+from config import WARMUP_MATCHES, WARMUP_MODE, WARMUP_PLAYERS, get_data
+from utils.instrumentation import get_logger, metrics
+from utils.startup import startup
+
+logger = get_logger(__name__)
+
+WARMUP_MODES = ("background", "sync", "off")
+# Like a browser, so the response cache also keeps the compressed variant
+HEADERS = {"Accept-Encoding": "gzip, deflate, br"}
+
+# Per-entity routes rendered for the hot matches, players and teams
+MATCH_ROUTES = ("round_analysis", "match_details", "players", "player_details", "eco/match", "draft/match",
+                "match_predictions")
+PLAYER_ROUTES = ("player_timeseries", "player", "maps/player")
+TEAM_ROUTES = ("team", "eco/team", "draft/team", "maps/team")
+# Routes without path parameters, touched once so lazy imports and first-call
+# paths (sklearn, correlation matrices, ...) are paid before traffic arrives
+CODE_PATHS = (
+    "/api/teams", "/api/teams/detailed", "/api/matches", "/api/matches_full", "/api/players/detailed",
+    "/api/correlations", "/api/datasets", "/api/eco/teams", "/api/draft/teams", "/api/highlights",
+    "/api/aggregate?name=players_stats&group_by=Teams&metric=wmean:Rating",
+)
+
+
+class _Warmer:
+    """Test client over the app that counts the warm-up requests that did not succeed"""
+
+    def __init__(self, app):
+        self.client = app.test_client()
+        self.requests = 0
+        self.failed = 0
+
+    def get(self, url, headers=HEADERS):
+        response = self.client.get(url, headers=headers)
+        response.get_data()
+        self.requests += 1
+        if response.status_code >= 400:
+            self.failed += 1
+            logger.debug("Warm-up request %s returned %d", url, response.status_code)
+        return response
+
+    def get_json(self, url):
+        """Decoded body of a lookup the warm-up itself needs (requested uncompressed)"""
+        return self.get(url, headers={}).get_json(silent=True) or {}
+
+    def get_all(self, phase, group, urls):
+        started = time.perf_counter()
+        for url in urls:
+            self.get(url)
+        startup.detail(phase, group, time.perf_counter() - started)
+
+
+def _hot_payloads(warmer):
+    """Render the first matches (newest in the source data), their teams and the top-rated players"""
+    scores = get_data('scores').head(WARMUP_MATCHES)
+    match_ids = scores['match_id'].tolist()
+    teams = list(dict.fromkeys(scores['Team A'].tolist() + scores['Team B'].tolist()))
+    board = warmer.get_json(f"/api/leaderboards?metric=rating&k={max(WARMUP_PLAYERS, 1)}")
+    players = [entry['name'] for entry in board.get('entries', [])][:WARMUP_PLAYERS]
+
+    warmer.get_all("hot_payloads", "matches", (
+        [f"/api/{route}/{match_id}" for match_id in match_ids for route in MATCH_ROUTES]
+        + [f"/api/highlights?match_id={match_id}" for match_id in match_ids]
+    ))
+    warmer.get_all("hot_payloads", "players", (
+        [f"/api/{route}/{quote(player)}" for player in players for route in PLAYER_ROUTES]
+        + [f"/api/highlights?player={quote(player)}" for player in players]
+    ))
+    warmer.get_all("hot_payloads", "teams", [f"/api/{route}/{quote(team)}" for team in teams for route in TEAM_ROUTES])
+    return players
+
+
+def _code_paths(warmer, players):
+    """Touch the remaining routes once each"""
+    urls = list(CODE_PATHS)
+    maps = warmer.get_json("/api/maps").get('maps', [])
+    if maps:
+        urls.append(f"/api/maps/{quote(maps[0]['map'])}")
+    if players:
+        urls.append(f"/api/search?q={quote(players[0][:3])}")
+    if len(players) >= 2:
+        pair = '&'.join(f'players={quote(player)}' for player in players[:2])
+        urls += [
+            f"/api/players_comparison?{pair}",
+            f"/api/h2h?player={quote(players[0])}&enemy={quote(players[1])}",
+            f"/api/player_clustering?{'&'.join(f'players={quote(player)}' for player in players)}",
+        ]
+    for url in urls:
+        warmer.get_all("code_paths", url.split('?')[0], [url])
+
+
+def warm_up(app):
+    """Run the warm-up phases, then mark this process ready (also when they fail)"""
+    warmer = _Warmer(app)
+    try:
+        with startup.phase("hot_payloads"):
+            players = _hot_payloads(warmer)
+        with startup.phase("code_paths"):
+            _code_paths(warmer, players)
+    except Exception as e:
+        logger.exception("❌ Warm-up failed: %s", e)
+        startup.mark_ready(error=str(e))
+        return
+    startup.mark_ready()
+    logger.info("✅ Warm-up done: %d requests (%d failed), ready after %.2fs",
+                warmer.requests, warmer.failed, startup.report()["total_seconds"])
+
+
+def _collect_startup():
+    report = startup.report()
+    return [
+        ("valorant_startup_phase_seconds", "gauge", "Seconds spent in each startup phase",
+         [({"phase": phase["name"]}, phase["seconds"]) for phase in report["phases"]]),
+        ("valorant_ready", "gauge", "1 once the data is loaded and the warm-up has finished",
+         [({}, int(report["ready"]))]),
+    ]
+
+
+metrics.register_collector(_collect_startup)
+
+
+def init_app(app):
+    """Warm the app up according to WARMUP_MODE; /ready reports when it is done"""
+    if WARMUP_MODE not in WARMUP_MODES:
+        raise ValueError(f"Unknown warm-up mode '{WARMUP_MODE}', expected one of {list(WARMUP_MODES)}")
+    if WARMUP_MODE == "off":
+        startup.mark_ready()
+    elif WARMUP_MODE == "sync":
+        warm_up(app)
+    else:
+        threading.Thread(target=warm_up, args=(app,), name="warmup", daemon=True).start()
@@ -29,7 +29,7 @@ def demo_api_endpoints():
         
         # Get teams
         print("\n2. Getting teams list...")
-        response = requests.get(f"{API_URL}/teams/detailed")
+        response = requests.get(f"{API_URL}/api/teams/detailed")
         if response.status_code == 200:
             teams = response.json()
             print(f"   ✅ Found {len(teams)} teams")
@@ -41,7 +41,7 @@ def demo_api_endpoints():
         
         # Get players
         print("\n3. Getting players list...")
-        response = requests.get(f"{API_URL}/players/detailed")
+        response = requests.get(f"{API_URL}/api/players/detailed")
         if response.status_code == 200:
             players = response.json()
             print(f"   ✅ Found {len(players)} players")
@@ -55,7 +55,7 @@ def demo_api_endpoints():
         if teams:
             print(f"\n4. Getting team profile for '{teams[0]['name']}'...")
             team_name = teams[0]['name']
-            response = requests.get(f"{API_URL}/team/{team_name}")
+            response = requests.get(f"{API_URL}/api/team/{team_name}")
             if response.status_code == 200:
                 team_data = response.json()
                 print(f"   ✅ Team profile loaded")
@@ -69,7 +69,7 @@ def demo_api_endpoints():
         if players:
             print(f"\n5. Getting player profile for '{players[0]['name']}'...")
             player_name = players[0]['name']
-            response = requests.get(f"{API_URL}/player/{player_name}")
+            response = requests.get(f"{API_URL}/api/player/{player_name}")
             if response.status_code == 200:
                 player_data = response.json()
                 print(f"   ✅ Player profile loaded")